@@ -0,0 +1,31 @@
+"""
+Build the AOT-compiled indicator kernels (spx_kernels extension module).
+
+Usage:
+    python build_kernels.py
+
+Produces spx_kernels.*.pyd / .so next to main.py. main.py imports it at startup
+and skips the numba JIT warmup entirely; if the module is missing the app falls
+back to indicator_kernels.jit_kernels().
+
+Requires numba with numba.pycc (removed in newer numba releases - pin numba<0.61
+on the build machine). The compiled module itself has no numba dependency.
+"""
+
+import os
+
+from numba.pycc import CC
+
+import indicator_kernels
+
+
+cc = CC('spx_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('atr', 'f8[:](f8[:], f8[:], f8[:], i8)')(indicator_kernels.atr)
+cc.export('supertrend', 'f8[:](f8[:], f8[:], f8[:], f8[:], f8[:], f8[:])')(indicator_kernels.supertrend)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built spx_kernels in {cc.output_dir}")
@@ -416,7 +416,10 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
 
     def update_tv_chart(self):
         if not self.chart_bar_data: return
-        df = pd.DataFrame(self.chart_bar_data); df['time'] = df['time'].apply(lambda x: datetime.strptime(x, '%Y%m%d  %H:%M:%S').timestamp())
+        df = pd.DataFrame(self.chart_bar_data)
+        # Parse all bar times in one vectorized call; only the first goes through strptime for the local-time epoch
+        bar_times = pd.to_datetime(df['time'], format='%Y%m%d  %H:%M:%S')
+        df['time'] = datetime.strptime(df['time'].iloc[0], '%Y%m%d  %H:%M:%S').timestamp() + (bar_times - bar_times.iloc[0]).dt.total_seconds()
         candlestick_data = df[['time', 'open', 'high', 'low', 'close']].to_dict(orient='records')
         df['ema9'] = df['close'].ewm(span=9, adjust=False).mean(); ema_data = df[['time', 'ema9']].rename(columns={'ema9': 'value'}).to_dict(orient='records')
         sma20 = df['close'].rolling(window=self.z_score_period).mean(); std20 = df['close'].rolling(window=self.z_score_period).std()
@@ -0,0 +1,214 @@
+"""
+Indicator Kernels - ATR and Supertrend
+Plain-loop implementations shared by the AOT build (build_kernels.py) and the
+runtime JIT fallback used by main.py.
+Author: Van Gothreaux, Triquant Analytics LLC
+Copywrite 2025.  All Rights Reserved.
+"""
+
+import numpy as np
+
+
+# ============================================================================
+# KERNELS (numba-compatible: numpy arrays + scalars only, no pandas)
+# ============================================================================
+
+def atr(high, low, close, period):
+    """
+    Average True Range as a simple moving average of the true range.
+
+    Args:
+        high, low, close: float64 arrays of equal length
+        period: ATR window length
+
+    Returns:
+        float64 array, NaN until the first full window (matches pandas rolling mean)
+    """
+    n = high.shape[0]
+    tr = np.empty(n)
+    out = np.empty(n)
+
+    for i in range(n):
+        tr[i] = high[i] - low[i]
+        if i > 0:
+            high_close = abs(high[i] - close[i - 1])
+            low_close = abs(low[i] - close[i - 1])
+            if high_close > tr[i]:
+                tr[i] = high_close
+            if low_close > tr[i]:
+                tr[i] = low_close
+
+    running = 0.0
+    for i in range(n):
+        running += tr[i]
+        if i >= period:
+            running -= tr[i - period]
+        if i >= period - 1:
+            out[i] = running / period
+        else:
+            out[i] = np.nan
+
+    return out
+
+
+def supertrend(close, basic_upper, basic_lower, upper, lower, trend):
+    """
+    Supertrend line from hl2 +/- multiplier * ATR with the usual band ratchet.
+
+    Args:
+        close: float64 array
+        basic_upper, basic_lower: float64 unratcheted bands (see basic_bands())
+        upper, lower, trend: float64 arrays of the same length, filled in place with
+            the ratcheted bands and the direction (1.0 up / 0.0 down)
+
+    Returns:
+        float64 array - lower band while the trend is up, upper band while it is down.
+        The trend flips down when close breaks the previous lower band and back up
+        when it breaks the previous upper band.
+    """
+    n = close.shape[0]
+    out = np.zeros(n)
+    trend_up = True
+
+    for i in range(n):
+        if i == 0:
+            upper[i] = basic_upper[i]
+            lower[i] = basic_lower[i]
+            trend[i] = 1.0
+            continue
+
+        # Upper band only ratchets down while price stays below it
+        if close[i - 1] <= upper[i - 1] and basic_upper[i] > upper[i - 1]:
+            upper[i] = upper[i - 1]
+        else:
+            upper[i] = basic_upper[i]
+
+        # Lower band only ratchets up while price stays above it
+        if close[i - 1] >= lower[i - 1] and basic_lower[i] < lower[i - 1]:
+            lower[i] = lower[i - 1]
+        else:
+            lower[i] = basic_lower[i]
+
+        # Direction only changes on a break of the prior bar's band
+        if trend_up and close[i] < lower[i - 1]:
+            trend_up = False
+        elif not trend_up and close[i] > upper[i - 1]:
+            trend_up = True
+
+        if trend_up:
+            out[i] = lower[i]
+            trend[i] = 1.0
+        else:
+            out[i] = upper[i]
+            trend[i] = 0.0
+
+    return out
+
+
+# ============================================================================
+# VECTORIZED (no-numba fallback)
+# ============================================================================
+
+def basic_bands(high, low, atr_values, multiplier):
+    """
+    Unratcheted supertrend bands hl2 +/- multiplier * ATR, for supertrend().
+    Two passes into two output buffers instead of a temporary per operator.
+
+    Returns:
+        (basic_upper, basic_lower) float64 arrays
+    """
+    basic_lower = np.add(high, low)
+    basic_lower *= 0.5  # hl2
+    scaled = np.multiply(atr_values, multiplier)
+    basic_upper = np.add(basic_lower, scaled)
+    np.subtract(basic_lower, scaled, out=basic_lower)
+    return basic_upper, basic_lower
+
+
+def atr_vectorized(high, low, close, period):
+    """
+    Whole-array NumPy version of atr() for machines without numba, where the
+    plain loop above would run as interpreted Python. Same output as atr().
+
+    Also takes [K, N] arrays (one series per row, time along the last axis) to
+    compute many contracts in one pass; rows shorter than N may be padded at the
+    end, since every value only depends on earlier columns.
+    """
+    n = high.shape[-1]
+    prev_close = np.empty_like(close)
+    prev_close[..., 0] = close[..., 0]
+    prev_close[..., 1:] = close[..., :-1]
+
+    tr = np.maximum.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+    tr[..., 0] = high[..., 0] - low[..., 0]  # No previous close for the first bar
+
+    out = np.full(high.shape, np.nan)
+    if n >= period:
+        csum = np.cumsum(tr, axis=-1)
+        out[..., period - 1] = csum[..., period - 1] / period
+        out[..., period:] = (csum[..., period:] - csum[..., :-period]) / period
+    return out
+
+
+def zscore_tail(close, period, count):
+    """
+    Z-score of close against its rolling mean / sample std (pandas rolling(period)
+    with ddof=1) for only the last `count` bars - the strategy reads one or two
+    values, so the windows before them are never computed.
+
+    Returns:
+        float64 array of length count (inf/NaN where a window is flat)
+    """
+    tail = np.asarray(close[-(period + count - 1):], dtype=np.float64)
+    windows = np.lib.stride_tricks.sliding_window_view(tail, period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (tail[period - 1:] - windows.mean(axis=1)) / windows.std(axis=1, ddof=1)
+
+
+# ============================================================================
+# RUNTIME FALLBACK
+# ============================================================================
+
+def jit_kernels():
+    """
+    Return (atr, supertrend, backend) for use when the AOT module is missing.
+
+    Uses numba JIT when installed (cached to __pycache__ so the warmup is paid
+    once per machine), otherwise vectorized ATR plus the plain supertrend loop.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return atr_vectorized, supertrend, "python"
+
+    return njit(cache=True)(atr), njit(cache=True)(supertrend), "numba"
+
+
+def _make_supertrend_batch(row_kernel, row_range):
+    """Build the batch loop around a per-row supertrend kernel"""
+    def supertrend_batch(close, basic_upper, basic_lower, lengths, upper, lower, trend, out):
+        """
+        supertrend() over K independent series stored as [K, N_max] rows; row r
+        uses its first lengths[r] columns. Results go into upper/lower/trend/out.
+        """
+        for r in row_range(close.shape[0]):
+            n = lengths[r]
+            out[r, :n] = row_kernel(close[r, :n], basic_upper[r, :n], basic_lower[r, :n],
+                                    upper[r, :n], lower[r, :n], trend[r, :n])
+    return supertrend_batch
+
+
+def batch_kernel():
+    """
+    Return supertrend_batch for bulk recalculation of many contracts at once.
+
+    With numba the rows run in parallel (prange, one series per thread); the
+    JIT is not cached because the loop closes over the row kernel. Without
+    numba it is a plain serial loop over supertrend().
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return _make_supertrend_batch(supertrend, range)
+
+    return njit(parallel=True)(_make_supertrend_batch(njit(cache=True)(supertrend), prange))
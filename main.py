@@ -12,13 +12,19 @@ import ttkbootstrap as ttk
 from ttkbootstrap.constants import BOTH, YES, X, Y, LEFT, RIGHT, BOTTOM, TOP, CENTER, END, W, E, EW, SUNKEN, HORIZONTAL, VERTICAL
 from tksheet import Sheet
 import threading
-import queue
 import time
 from datetime import datetime, timedelta, time as dt_time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
 from enum import Enum
 import json
+import calendar
 import os
+import sys
+import copy
+import random
 import logging
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from collections import deque
@@ -26,7 +32,8 @@ import pandas as pd
 import numpy as np
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.patches import Rectangle
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.ticker import FixedLocator, FixedFormatter
 from matplotlib.dates import DateFormatter
 import matplotlib.dates as mdates
 from tksheet import Sheet
@@ -39,6 +46,17 @@ except ImportError:
     LIGHTWEIGHT_CHARTS_AVAILABLE = False
     print("WARNING: lightweight-charts not installed. Run: pip install lightweight-charts")
 
+# Indicator kernels (ATR / Supertrend)
+# Prefer the AOT-compiled module (build once with: python build_kernels.py) so
+# there is no JIT warmup on launch; fall back to numba JIT, then plain Python
+try:
+    from spx_kernels import atr as atr_kernel, supertrend as supertrend_kernel
+    INDICATOR_BACKEND = "aot"
+except ImportError:
+    from indicator_kernels import jit_kernels
+    atr_kernel, supertrend_kernel, INDICATOR_BACKEND = jit_kernels()
+from indicator_kernels import atr_vectorized, basic_bands, batch_kernel, zscore_tail
+
 if TYPE_CHECKING:
     from ttkbootstrap import Window
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -46,10 +64,22 @@ from matplotlib.backends._backend_tk import NavigationToolbar2Tk
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 
+# Cheaper Agg rasterization for the live charts: simplify dense paths, draw long
+# paths in chunks, skip antialiasing on axis-aligned shapes (candles, grid, boxes).
+# Artists that need smoothing (mid-price line) still ask for it explicitly.
+plt.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+    'lines.antialiased': False,
+    'patch.antialiased': False,
+    'axes.unicode_minus': False,
+})
+
 # Interactive Brokers API imports
 from ibapi.client import EClient
 from ibapi.wrapper import EWrapper
-from ibapi.contract import Contract
+from ibapi.contract import Contract, ComboLeg
 from ibapi.order import Order, UNSET_DOUBLE, UNSET_INTEGER
 from ibapi.common import TickerId, TickAttrib
 from ibapi.ticktype import TickType
@@ -77,11 +107,28 @@ TRADING_SYMBOL = "XSP"  # Options: "SPX" or "XSP"
 TRADING_CLASS = "XSP"   # Must match TRADING_SYMBOL
 UNDERLYING_SYMBOL = "XSP"  # For underlying price subscription
 
+# Chart timeframe selector -> bar length, used to bucket tick-by-tick midpoints into bars
+CHART_BAR_SECONDS = {"1 min": 60, "5 min": 300, "15 min": 900, "30 min": 1800, "1 hour": 3600}
+
 
 # ============================================================================
 # FILE LOGGING SETUP
 # ============================================================================
 
+# log_message levels in increasing severity (SUCCESS sits between INFO and WARNING)
+LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40}
+
+# GUI log widget: flushed from the Tk thread at ~60 Hz, trimmed once it passes this many lines
+LOG_FLUSH_INTERVAL_MS = 16
+LOG_IDLE_INTERVAL_MS = 200  # Poll interval once a flush finds nothing queued
+LOG_WIDGET_MAX_LINES = 1000
+
+# Position P&L is recomputed at most this often from ticks (4 Hz, the positions sheet cadence)
+PNL_FLUSH_MS = 250
+
+# Option chain redraws format only the rows in view plus this many above and below
+CHAIN_ROW_MARGIN = 5
+
 def setup_file_logger():
     """
     Setup file logging with daily log files in logs/ directory
@@ -222,6 +269,150 @@ def calculate_greeks(option_type: str, spot_price: float, strike: float,
         }
 
 
+# ============================================================================
+# CELL FORMATTING
+# ============================================================================
+
+@lru_cache(maxsize=8192)
+def _format_cell(value: float, format_str: str) -> str:
+    """Format a (pre-rounded) number for a chain cell - memoized, ticks repeat a lot"""
+    if format_str == "int":
+        return str(int(value)) if value != 0 else "0"
+    elif format_str == ".2f":
+        return f"{value:.2f}" if value != 0 else "0.00"
+    elif format_str == ".4f":
+        return f"{value:.4f}" if value != 0 else "0.0000"
+    return str(value)
+
+
+# Placeholder cells for a freshly inserted chain row, in display column order
+BLANK_CALL_CELLS = ("0.00", "0.00", "0.00", "0.00", "0.00", "0", "0.00%", "0.00", "0.00", "0.00")  # IV .. Bid
+BLANK_PUT_CELLS = ("0.00", "0.00", "0.00", "0.00%", "0", "0.00", "0.00", "0.00", "0.00", "0.00")   # Bid .. IV
+
+
+def safe_format(value, format_str: str, default: str = "—") -> str:
+    """Safely format a value, returning default if None or invalid"""
+    if value is None:
+        return default
+    try:
+        # Round to display precision so sub-tick float noise shares cache entries
+        return _format_cell(round(float(value), 4), format_str)
+    except (ValueError, TypeError):
+        return default
+
+
+# ============================================================================
+# BAR STORAGE
+# ============================================================================
+
+def bar_epoch(date: str) -> int:
+    """
+    IBKR bar date ('YYYYMMDD  HH:MM:SS', maybe with a trailing time zone, or 'YYYYMMDD')
+    as wall-clock epoch seconds: the fields are read as UTC, so no zone conversion happens
+    and the result compares directly with calendar.timegm(datetime.now().timetuple()).
+    """
+    parts = date.split()
+    day = parts[0]
+    clock = parts[1] if len(parts) > 1 else "00:00:00"
+    return calendar.timegm((int(day[0:4]), int(day[4:6]), int(day[6:8]),
+                            int(clock[0:2]), int(clock[3:5]), int(clock[6:8])))
+
+
+class BarBuffer:
+    """
+    Chart bars for one contract as preallocated column arrays.
+    
+    Live bars are always [0:size), so callers slice (buf.close[:len(buf)]) and get
+    contiguous views with no copying. When the buffer is full the oldest quarter
+    is dropped in one block move instead of wrapping around.
+    
+    Option prices are float32: premiums carry a few decimals at most, and the chart
+    path moves half the bytes. Indicator code upcasts to float64 before summing.
+    Index bars (confirmation/trade charts) pass dtype=np.float64.
+    """
+    
+    def __init__(self, capacity: int = 16384, dtype=np.float32):
+        self.open = np.empty(capacity, dtype=dtype)
+        self.high = np.empty(capacity, dtype=dtype)
+        self.low = np.empty(capacity, dtype=dtype)
+        self.close = np.empty(capacity, dtype=dtype)
+        self.volume = np.empty(capacity, dtype=dtype)
+        self.date = np.empty(capacity, dtype=object)  # IBKR bar date strings
+        self.ts = np.empty(capacity, dtype=np.int64)  # Same dates parsed once, see bar_epoch()
+        self.label = np.empty(capacity, dtype=object)  # Time-of-day part of date, for x-axis ticks
+        self.size = 0
+    
+    def __len__(self):
+        return self.size
+    
+    def append(self, date, open_, high, low, close, volume=0.0):
+        """Add a bar at the end, dropping the oldest quarter first if full"""
+        if self.size == self.close.shape[0]:
+            keep = self.size - self.size // 4
+            for column in (self.open, self.high, self.low, self.close, self.volume,
+                           self.date, self.ts, self.label):
+                column[:keep] = column[self.size - keep:self.size]
+            self.size = keep
+        i = self.size
+        self.date[i] = date
+        self.ts[i] = bar_epoch(date)
+        self.label[i] = date.split()[1] if ' ' in date else date
+        self.open[i] = open_
+        self.high[i] = high
+        self.low[i] = low
+        self.close[i] = close
+        self.volume[i] = volume
+        self.size = i + 1
+    
+    def replace_last(self, date, open_, high, low, close, volume=0.0):
+        """Overwrite the newest bar (streamed update of the bar still forming)"""
+        i = self.size - 1
+        self.date[i] = date
+        self.open[i] = open_
+        self.high[i] = high
+        self.low[i] = low
+        self.close[i] = close
+        self.volume[i] = volume
+    
+    def clear(self):
+        """Drop all bars, keeping the allocated columns"""
+        self.size = 0
+    
+    def update_last(self, price):
+        """Extend the newest (forming) bar with a trade/mid price"""
+        i = self.size - 1
+        if price > self.high[i]:
+            self.high[i] = price
+        if price < self.low[i]:
+            self.low[i] = price
+        self.close[i] = price
+
+
+@dataclass
+class SupertrendState:
+    """Supertrend output for one contract - float64 arrays aligned with the bars it was built from"""
+    date: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    atr: np.ndarray
+    supertrend: np.ndarray
+    
+    def __len__(self):
+        return self.close.shape[0]
+
+
+@dataclass(slots=True)
+class Position:
+    """One open position in self.positions - per-option prices (not x100), P&L in dollars"""
+    contract: Contract
+    position: float
+    avgCost: float
+    currentPrice: float = 0.0
+    pnl: float = 0.0
+    entryTime: datetime = field(default_factory=datetime.now)
+
+
 # ============================================================================
 # CONNECTION STATE MACHINE
 # ============================================================================
@@ -232,6 +423,26 @@ class ConnectionState(Enum):
     CONNECTED = "CONNECTED"
 
 
+def requires_connection(action: Optional[str] = None, level: str = "WARNING"):
+    """
+    Decorator: skip the wrapped method unless connection_state is CONNECTED.
+    
+    Args:
+        action: Logged as "Cannot {action} - not connected"; None skips silently
+        level: Log level for the skip message
+    """
+    def deco(fn):
+        @wraps(fn)
+        def wrap(self, *args, **kwargs):
+            if self.connection_state != ConnectionState.CONNECTED:
+                if action is not None:
+                    self.log_message(f"Cannot {action} - not connected", level)
+                return None
+            return fn(self, *args, **kwargs)
+        return wrap
+    return deco
+
+
 # ============================================================================
 # IBKR API WRAPPER
 # ============================================================================
@@ -314,7 +525,7 @@ class IBKRWrapper(EWrapper):
                 self.app.running = False  # Stop current connection loop
                 # Schedule reconnect with new client ID
                 if self.app.root:
-                    self.app.root.after(2000, self.app.retry_connection_with_new_client_id)
+                    self.app.post_to_gui(self.app.root.after, 2000, self.app.retry_connection_with_new_client_id)
             else:
                 self.app.log_message(f"Exhausted all client IDs (1-{self.app.max_client_id}). Please close other connections.", "ERROR")
                 self.app.connection_state = ConnectionState.DISCONNECTED
@@ -324,7 +535,7 @@ class IBKRWrapper(EWrapper):
         elif errorCode in [502, 503, 504, 1100, 2110]:
             self.app.log_message(f"Connection error detected (code {errorCode}). Initiating reconnection...", "WARNING")
             self.app.connection_state = ConnectionState.DISCONNECTED
-            self.app.schedule_reconnect()
+            self.app.post_to_gui(self.app.schedule_reconnect)
         
         # Market data errors
         elif errorCode == 354:  # Requested market data is not subscribed
@@ -339,18 +550,29 @@ class IBKRWrapper(EWrapper):
             # Remove from manual orders tracking
             if reqId in self.app.manual_orders:
                 del self.app.manual_orders[reqId]
+            self.app.combo_orders.pop(reqId, None)
             # Update order sheet
-            self.app.update_order_in_tree(reqId, status="REJECTED", price=0)
+            self.app.post_to_gui(self.app.update_order_in_tree, reqId, "REJECTED", 0)
         elif errorCode == 110:  # Price is out of range
             self.app.log_message(f"ORDER PRICE OUT OF RANGE (orderId={reqId}): {errorString}", "ERROR")
         elif errorCode == 200:  # No security definition found
+            # Combo leg conId lookup failed - its on_done never fires, so the straddle is abandoned
+            request = self.app.contract_details_requests.pop(reqId, None)
+            if request is not None:
+                self.app.log_message(
+                    f"Contract details failed for {request['contract_key']} (reqId={reqId}): {errorString} - "
+                    f"straddle not placed",
+                    "ERROR"
+                )
+                return
             self.app.log_message(f"ORDER ERROR - Security not found (orderId={reqId}): {errorString}", "ERROR")
             # Remove from pending orders if exists
             if reqId in self.app.pending_orders:
                 del self.app.pending_orders[reqId]
             if reqId in self.app.manual_orders:
                 del self.app.manual_orders[reqId]
-            self.app.update_order_in_tree(reqId, status="REJECTED", price=0)
+            self.app.combo_orders.pop(reqId, None)
+            self.app.post_to_gui(self.app.update_order_in_tree, reqId, "REJECTED", 0)
         
         # Historical data errors
         elif errorCode == 162:  # Historical market data Service error
@@ -367,6 +589,13 @@ class IBKRWrapper(EWrapper):
             if reqId in self.app.historical_data_requests:
                 contract_key = self.app.historical_data_requests[reqId]
                 self.app.log_message(f"No historical data available for {contract_key}", "WARNING")
+        elif errorCode in [10189, 10190]:  # Tick-by-tick subscription refused / limit reached
+            stream = self.app.tick_req_ids.pop(reqId, None)
+            if stream is not None:
+                self.app.log_message(
+                    f"Tick-by-tick stream unavailable for {stream[0]} - chart stays on historical bars: {errorString}",
+                    "WARNING"
+                )
         elif errorCode in [165, 321]:  # Historical data errors
             if reqId in self.app.historical_data_requests:
                 contract_key = self.app.historical_data_requests[reqId]
@@ -389,7 +618,7 @@ class IBKRWrapper(EWrapper):
         self.app.reconnect_attempts = 0  # Reset reconnect counter on successful connection
         self.app.client_id_iterator = 1  # Reset client ID iterator for next connection
         self.app.log_message(f"Successfully connected to IBKR with Client ID {self.app.client_id}! Next Order ID: {orderId}", "SUCCESS")
-        self.app.on_connected()
+        self.app.post_to_gui(self.app.on_connected)
     
     def managedAccounts(self, accountsList: str):
         """
@@ -433,7 +662,7 @@ class IBKRWrapper(EWrapper):
         if reqId == self.app.underlying_req_id:
             if tickType == 4:  # LAST price
                 self.app.underlying_price = price
-                self.app.update_underlying_price_display()
+                self.app.post_to_gui(self.app.update_underlying_price_display)
             return
         
         # Check if this is VIX price
@@ -441,41 +670,59 @@ class IBKRWrapper(EWrapper):
             if tickType == 4:  # LAST price
                 self.app.vix_price = price
                 if hasattr(self.app, 'update_vix_display'):
-                    self.app.update_vix_display()
+                    self.app.post_to_gui(self.app.update_vix_display)
             return
         
         # Handle option contract prices
-        if reqId in self.app.market_data_map:
-            contract_key = self.app.market_data_map[reqId]
+        sub = self.app.market_data_by_req_id.get(reqId)
+        if sub is not None:
+            contract_key, entry = sub
             
             if tickType == 1:  # BID
-                self.app.market_data[contract_key]['bid'] = price
+                entry['bid'] = price
                 # Update position P&L with new mid-price
                 if contract_key in self.app.positions:
-                    self.app.update_position_pnl(contract_key)
+                    self.app.mark_pnl_dirty(contract_key)
                     
             elif tickType == 2:  # ASK
-                self.app.market_data[contract_key]['ask'] = price
+                entry['ask'] = price
+                slot = entry.get('slot')
+                if slot is not None:  # Position-only contracts have no scan column
+                    self.app._md_ask_pending.append((slot, price))
                 # Update position P&L with new mid-price
                 if contract_key in self.app.positions:
-                    self.app.update_position_pnl(contract_key)
+                    self.app.mark_pnl_dirty(contract_key)
                     
             elif tickType == 4:  # LAST
-                self.app.market_data[contract_key]['last'] = price
+                entry['last'] = price
                 # Update position P&L if this is a held position
                 if contract_key in self.app.positions:
-                    self.app.update_position_pnl(contract_key, price)
+                    self.app.mark_pnl_dirty(contract_key, price)
                     
             elif tickType == 9:  # CLOSE PRICE (previous day's close)
-                self.app.market_data[contract_key]['prev_close'] = price
+                entry['prev_close'] = price
+            else:
+                return
+            
+            # Flag row for the next option chain redraw
+            self.app.dirty_rows.add(entry.get('row_index'))
     
     def tickSize(self, reqId: TickerId, tickType: TickType, size: int):
         """Receives real-time size updates"""
-        if reqId in self.app.market_data_map:
-            contract_key = self.app.market_data_map[reqId]
-            
-            if tickType == 8:  # VOLUME
-                self.app.market_data[contract_key]['volume'] = size
+        sub = self.app.market_data_by_req_id.get(reqId)
+        if sub is not None and tickType == 8:  # VOLUME
+            entry = sub[1]
+            entry['volume'] = size
+            self.app.dirty_rows.add(entry.get('row_index'))
+    
+    def tickByTickMidPoint(self, reqId: int, time: int, midPoint: float):
+        """Receives tick-by-tick midpoints for the selected call/put chart contracts"""
+        stream = self.app.tick_req_ids.get(reqId)
+        if stream is None or midPoint <= 0:
+            return
+        contract_key, option_type = stream
+        # Bar bucketing and redraws touch Tk state, so they run on the GUI thread
+        self.app.post_to_gui(self.app.on_midpoint_tick, contract_key, option_type, time, midPoint)
     
     def tickOptionComputation(self, reqId: TickerId, tickType: TickType,
                              tickAttrib: int, impliedVol: float,
@@ -487,19 +734,38 @@ class IBKRWrapper(EWrapper):
         Tick Type 13 (MODEL_OPTION) = Model-based greeks that work without Last price.
         This uses bid/ask mid-price for calculations when Last is unavailable.
         """
-        if reqId in self.app.market_data_map:
-            contract_key = self.app.market_data_map[reqId]
+        sub = self.app.market_data_by_req_id.get(reqId)
+        if sub is not None:
+            entry = sub[1]
             
             # Accept greeks from any tick type, but prioritize MODEL (13)
             # Tick type 13 = MODEL_OPTION (always calculated even without Last)
             # Tick types 10, 11, 12 = BID, ASK, LAST based greeks
-            self.app.market_data[contract_key].update({
-                'delta': delta if delta != -2 and delta != -1 else 0,
-                'gamma': gamma if gamma != -2 and gamma != -1 else 0,
-                'theta': theta if theta != -2 and theta != -1 else 0,
-                'vega': vega if vega != -2 and vega != -1 else 0,
-                'iv': impliedVol if impliedVol != -2 and impliedVol != -1 else 0
-            })
+            # -1/-2 are IBKR's "not computed" sentinels; stored straight into the entry
+            # (no temporary dict per tick)
+            if delta == -2 or delta == -1:
+                delta = 0
+            entry['delta'] = delta
+            entry['gamma'] = gamma if gamma != -2 and gamma != -1 else 0
+            entry['theta'] = theta if theta != -2 and theta != -1 else 0
+            entry['vega'] = vega if vega != -2 and vega != -1 else 0
+            entry['iv'] = impliedVol if impliedVol != -2 and impliedVol != -1 else 0
+            slot = entry.get('slot')
+            if slot is not None:  # Position-only contracts have no scan column
+                self.app._md_delta_pending.append((slot, delta))
+            self.app.dirty_rows.add(entry.get('row_index'))
+    
+    def contractDetails(self, reqId: int, contractDetails):
+        """Receives contract details - used to resolve option conIds for combo orders"""
+        request = self.app.contract_details_requests.get(reqId)
+        if request is not None:
+            self.app.con_ids[request['contract_key']] = contractDetails.contract.conId
+    
+    def contractDetailsEnd(self, reqId: int):
+        """All details for reqId received - hand back to the GUI thread"""
+        request = self.app.contract_details_requests.pop(reqId, None)
+        if request is not None:
+            self.app.post_to_gui(request['on_done'])
     
     def orderStatus(self, orderId: int, status: str, filled: float,
                    remaining: float, avgFillPrice: float, permId: int,
@@ -519,12 +785,32 @@ class IBKRWrapper(EWrapper):
         self.app.log_message(f"Order {orderId}: {status} - Filled: {filled} @ {avgFillPrice}", "INFO")
         
         # Update order display in GUI
-        self.app.update_order_in_tree(orderId, status, avgFillPrice if avgFillPrice > 0 else None)
+        self.app.post_to_gui(self.app.update_order_in_tree, orderId, status,
+                             avgFillPrice if avgFillPrice > 0 else None)
+        
+        # Straddle combo filled - book each leg (position() reconciles avgCost later)
+        if status == "Filled" and orderId in self.app.combo_orders:
+            combo = self.app.combo_orders.pop(orderId)
+            self.app.pending_orders.pop(orderId, None)
+            self.app.manual_orders.pop(orderId, None)
+            call_key, put_key = combo['legs']
+            self.app.log_message(
+                f"Straddle combo #{orderId} filled: {combo['quantity']}x {call_key} + {put_key} @ ${avgFillPrice:.2f} net",
+                "SUCCESS"
+            )
+            # IBKR reports only the net price, so split it across the legs by their current mids
+            call_mid = self.app.calculate_mid_price(call_key)
+            put_mid = self.app.calculate_mid_price(put_key)
+            call_share = call_mid / (call_mid + put_mid) if call_mid > 0 and put_mid > 0 else 0.5
+            for key, share in ((call_key, call_share), (put_key, 1.0 - call_share)):
+                self.app.post_to_gui(self.app.update_position_on_fill, key, "BUY", combo['quantity'],
+                                     round(avgFillPrice * share, 2))
         
         # If order is filled, update position
         if status == "Filled" and orderId in self.app.pending_orders:
             contract_key, action, quantity = self.app.pending_orders[orderId]
-            self.app.update_position_on_fill(contract_key, action, quantity, avgFillPrice)
+            # Repaints the positions sheet - must run on the Tk thread
+            self.app.post_to_gui(self.app.update_position_on_fill, contract_key, action, quantity, avgFillPrice)
             del self.app.pending_orders[orderId]
             
             # Also remove from manual_orders tracking if present
@@ -545,7 +831,7 @@ class IBKRWrapper(EWrapper):
                 )
                 if hasattr(self.app, 'strategy_status_var'):
                     direction = trade.get('direction', 'UNKNOWN')
-                    self.app.strategy_status_var.set(f"Status: IN TRADE ({direction})")
+                    self.app.post_to_gui(self.app.strategy_status_var.set, f"Status: IN TRADE ({direction})")
             
             # Exit order filled - trade complete
             elif orderId == trade.get('exit_order_id') and status == "Filled":
@@ -571,7 +857,7 @@ class IBKRWrapper(EWrapper):
                 
                 # Update status display
                 if hasattr(self.app, 'strategy_status_var'):
-                    self.app.strategy_status_var.set("Status: SCANNING...")
+                    self.app.post_to_gui(self.app.strategy_status_var.set, "Status: SCANNING...")
     
     def openOrder(self, orderId: int, contract: Contract, order: Order,
                  orderState):
@@ -588,20 +874,18 @@ class IBKRWrapper(EWrapper):
                 avgCost: float):
         """Receives position updates from IBKR"""
         contract_key = self.app.get_contract_key(contract)
+        self.app._positions_dirty = True
         
         if position != 0:
             # For options, avgCost from IBKR is total cost per contract (includes 100x multiplier)
             # Divide by 100 to get per-option price for display
             per_option_cost = avgCost / 100 if contract.secType == "OPT" else avgCost
             
-            self.app.positions[contract_key] = {
-                'contract': contract,
-                'position': position,
-                'avgCost': per_option_cost,  # Per-option price for display
-                'currentPrice': 0,
-                'pnl': 0,
-                'entryTime': datetime.now()
-            }
+            self.app.positions[contract_key] = Position(
+                contract=contract,
+                position=position,
+                avgCost=per_option_cost  # Per-option price for display
+            )
             self.app.log_message(
                 f"Position update: {contract_key} - Qty: {position} @ ${per_option_cost:.2f}",
                 "INFO"
@@ -633,10 +917,13 @@ class IBKRWrapper(EWrapper):
                         'contract': contract,
                         'right': contract.right,
                         'strike': contract.strike,
+                        'row_index': None,  # Not a chain row
+                        'slot': None,  # No md_* scan column outside the chain
                         'bid': 0, 'ask': 0, 'last': 0, 'volume': 0,
                         'delta': 0, 'gamma': 0, 'theta': 0, 'vega': 0, 'iv': 0
                     }
                     self.app.log_message(f"Created market_data entry for {contract_key}", "INFO")
+                self.app.market_data_by_req_id[req_id] = (contract_key, self.app.market_data[contract_key])
                 
                 self.app.reqMktData(req_id, contract, "", False, False, [])
                 self.app.log_message(f"Requested market data (reqId={req_id}) for {contract_key}", "INFO")
@@ -657,7 +944,8 @@ class IBKRWrapper(EWrapper):
             f"Position subscription complete - {len(self.app.positions)} position(s)",
             "INFO"
         )
-        self.app.update_positions_display()
+        self.app._positions_dirty = True
+        self.app.post_to_gui(self.app.update_positions_display)
     
     def execDetails(self, reqId: int, contract: Contract, execution):
         """Receives execution details - recommended by IBKR for comprehensive monitoring"""
@@ -685,40 +973,25 @@ class IBKRWrapper(EWrapper):
             })
         # Handle Confirmation chart data (reqId 999995)
         elif reqId == 999995:
-            self.app.confirm_bar_data.append({
-                'time': bar.date,
-                'open': bar.open,
-                'high': bar.high,
-                'low': bar.low,
-                'close': bar.close,
-                'volume': bar.volume
-            })
+            self.app.confirm_bar_data.append(
+                bar.date, bar.open, bar.high, bar.low, bar.close, float(bar.volume)
+            )
         # Handle Trade chart data (reqId 999994)
         elif reqId == 999994:
-            self.app.trade_bar_data.append({
-                'time': bar.date,
-                'open': bar.open,
-                'high': bar.high,
-                'low': bar.low,
-                'close': bar.close,
-                'volume': bar.volume
-            })
+            self.app.trade_bar_data.append(
+                bar.date, bar.open, bar.high, bar.low, bar.close, float(bar.volume)
+            )
         # Handle option historical data (existing code)
         elif reqId in self.app.historical_data_requests:
             contract_key = self.app.historical_data_requests[reqId]
             
             if contract_key not in self.app.historical_data:
-                self.app.historical_data[contract_key] = []
+                self.app.historical_data[contract_key] = BarBuffer()
                 self.app.log_message(f"Receiving historical data for {contract_key} (reqId: {reqId})", "INFO")
             
-            self.app.historical_data[contract_key].append({
-                'date': bar.date,
-                'open': bar.open,
-                'high': bar.high,
-                'low': bar.low,
-                'close': bar.close,
-                'volume': bar.volume
-            })
+            self.app.historical_data[contract_key].append(
+                bar.date, bar.open, bar.high, bar.low, bar.close, float(bar.volume)
+            )
         else:
             self.app.log_message(f"Received historical data for unknown reqId: {reqId}", "WARNING")
     
@@ -730,7 +1003,7 @@ class IBKRWrapper(EWrapper):
                 f"Underlying 1-min history received ({len(self.app.underlying_1min_bars)} bars) for Z-Score",
                 "SUCCESS"
             )
-            self.app.calculate_indicators()
+            self.app.post_to_gui(self.app.calculate_indicators)
         # Handle Confirmation chart completion (reqId 999995)
         elif reqId == 999995:
             self.app.log_message(
@@ -739,7 +1012,7 @@ class IBKRWrapper(EWrapper):
             )
             # Update confirmation chart
             if hasattr(self.app, 'update_chart_display'):
-                self.app.root.after(100, lambda: self.app.update_chart_display("confirm"))
+                self.app.post_to_gui(self.app.root.after, 100, self.app.update_chart_display, "confirm")
         # Handle Trade chart completion (reqId 999994)
         elif reqId == 999994:
             self.app.log_message(
@@ -748,7 +1021,7 @@ class IBKRWrapper(EWrapper):
             )
             # Update trade chart
             if hasattr(self.app, 'update_chart_display'):
-                self.app.root.after(100, lambda: self.app.update_chart_display("trade"))
+                self.app.post_to_gui(self.app.root.after, 100, self.app.update_chart_display, "trade")
         # Handle option historical data (existing code)
         elif reqId in self.app.historical_data_requests:
             contract_key = self.app.historical_data_requests[reqId]
@@ -768,22 +1041,23 @@ class IBKRWrapper(EWrapper):
             
             # Determine if this is a call or put based on contract_key
             # Format: SPX_6740_C_20251020 or SPX_6745_P_20251020
-            is_call = '_C_' in contract_key
-            is_put = '_P_' in contract_key
+            right = self.app.parse_contract_key(contract_key)[2]
+            is_call = right == 'C'
+            is_put = right == 'P'
             
             # Update the appropriate chart and hide loading spinner
             if is_call and self.app.selected_call_contract:
                 self.app.log_message("Updating call chart with new data", "INFO")
                 if self.app.root:
-                    self.app.root.after(100, self.app.update_call_chart)
+                    self.app.post_to_gui(self.app.root.after, 100, self.app.update_call_chart)
                     # Always hide loading spinner when data arrives
-                    self.app.root.after(200, self.app.hide_call_loading)
+                    self.app.post_to_gui(self.app.root.after, 200, self.app.hide_call_loading)
             elif is_put and self.app.selected_put_contract:
                 self.app.log_message("Updating put chart with new data", "INFO")
                 if self.app.root:
-                    self.app.root.after(100, self.app.update_put_chart)
+                    self.app.post_to_gui(self.app.root.after, 100, self.app.update_put_chart)
                     # Always hide loading spinner when data arrives
-                    self.app.root.after(200, self.app.hide_put_loading)
+                    self.app.post_to_gui(self.app.root.after, 200, self.app.hide_put_loading)
         else:
             self.app.log_message(f"Historical data end for unknown reqId: {reqId}", "WARNING")
     
@@ -800,59 +1074,33 @@ class IBKRWrapper(EWrapper):
                 'close': bar.close
             })
             # Recalculate indicators with new bar
-            self.app.calculate_indicators()
+            self.app.post_to_gui(self.app.calculate_indicators)
         # Handle Confirmation chart real-time updates (reqId 999995)
         elif reqId == 999995:
             # Update or append the latest bar for Confirmation chart
-            if self.app.confirm_bar_data and self.app.confirm_bar_data[-1]['time'] == bar.date:
+            bars = self.app.confirm_bar_data
+            if len(bars) and bars.date[len(bars) - 1] == bar.date:
                 # Update the last bar (same timestamp)
-                self.app.confirm_bar_data[-1] = {
-                    'time': bar.date,
-                    'open': bar.open,
-                    'high': bar.high,
-                    'low': bar.low,
-                    'close': bar.close,
-                    'volume': bar.volume
-                }
+                bars.replace_last(bar.date, bar.open, bar.high, bar.low, bar.close, float(bar.volume))
             else:
                 # New bar
-                self.app.confirm_bar_data.append({
-                    'time': bar.date,
-                    'open': bar.open,
-                    'high': bar.high,
-                    'low': bar.low,
-                    'close': bar.close,
-                    'volume': bar.volume
-                })
-            # Update chart display
-            if hasattr(self.app, 'update_chart_display') and self.app.root:
-                self.app.root.after(100, lambda: self.app.update_chart_display("confirm"))
+                bars.append(bar.date, bar.open, bar.high, bar.low, bar.close, float(bar.volume))
+            # Update chart display - a burst of bar updates coalesces into one redraw
+            self.app.post_to_gui(self.app.schedule_after, 'confirm_chart_display', 100,
+                                 self.app.update_chart_display, "confirm")
         # Handle Trade chart real-time updates (reqId 999994)
         elif reqId == 999994:
             # Update or append the latest bar for Trade chart
-            if self.app.trade_bar_data and self.app.trade_bar_data[-1]['time'] == bar.date:
+            bars = self.app.trade_bar_data
+            if len(bars) and bars.date[len(bars) - 1] == bar.date:
                 # Update the last bar (same timestamp)
-                self.app.trade_bar_data[-1] = {
-                    'time': bar.date,
-                    'open': bar.open,
-                    'high': bar.high,
-                    'low': bar.low,
-                    'close': bar.close,
-                    'volume': bar.volume
-                }
+                bars.replace_last(bar.date, bar.open, bar.high, bar.low, bar.close, float(bar.volume))
             else:
                 # New bar
-                self.app.trade_bar_data.append({
-                    'time': bar.date,
-                    'open': bar.open,
-                    'high': bar.high,
-                    'low': bar.low,
-                    'close': bar.close,
-                    'volume': bar.volume
-                })
-            # Update chart display
-            if hasattr(self.app, 'update_chart_display') and self.app.root:
-                self.app.root.after(100, lambda: self.app.update_chart_display("trade"))
+                bars.append(bar.date, bar.open, bar.high, bar.low, bar.close, float(bar.volume))
+            # Update chart display - a burst of bar updates coalesces into one redraw
+            self.app.post_to_gui(self.app.schedule_after, 'trade_chart_display', 100,
+                                 self.app.update_chart_display, "trade")
 
 
 # ============================================================================
@@ -877,12 +1125,27 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         IBKRWrapper.__init__(self, self)
         IBKRClient.__init__(self, wrapper=self)
         
+        # GUI log lines waiting for the next flush_log_queue pump: (text, level)
+        # deque.append is atomic, so the API thread can log without touching Tk.
+        # Capped at what the widget keeps anyway - older lines would be trimmed on insert.
+        self._log_queue = deque(maxlen=LOG_WIDGET_MAX_LINES)
+        self._log_line_count = 0  # Lines in log_text, tracked here instead of querying Tk
+        self._log_timestamp = (0, "")  # (epoch second, "HH:MM:SS") reused within the second
+        self._clock_prefix = (None, "")  # (minute, "YYYY-mm-dd HH:MM") for the status-bar clock
+        
+        # Messages below this level are dropped before any formatting (settings.json 'log_level')
+        self.log_level = "INFO"
+        self.log_level_num = LOG_LEVELS[self.log_level]
+        
         # Connection management
         self.connection_state = ConnectionState.DISCONNECTED
         self.data_server_ok = False  # CRITICAL: Must receive 2104/2106 before placing orders
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = 10  # Increased to 10 attempts
-        self.reconnect_delay = 5
+        self.base_reconnect_delay = 1  # First retry after ~1 second
+        self.max_reconnect_delay = 300  # Cap backoff at 5 minutes
+        self.reconnect_jitter = 1.0  # Random 0-1s added so retries don't sync up
+        self.reconnect_delay = self.base_reconnect_delay
         self.auto_connect = True  # Auto-connect at startup
         self.subscribed_contracts = []  # Track subscribed contracts for reconnection
         
@@ -914,12 +1177,44 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         self.option_chain_data = {}
         self.market_data = {}
         self.market_data_map = {}  # reqId -> contract_key
+        self.market_data_by_req_id = {}  # reqId -> (contract_key, market_data entry) - one lookup per tick
+        self._contract_keys = {}  # (symbol, strike, right, expiry) -> interned contract_key
+        self._contract_key_parts = {}  # contract_key -> (symbol, strike_str, right, expiry)
+        # Column copies of the chain quotes for vectorized scans; slot = market_data entry['slot']
+        self.md_ask = np.zeros(0, dtype=np.float32)  # float32: scan columns only - exact prices stay in market_data
+        self.md_delta = np.zeros(0, dtype=np.float32)
+        self.md_right = np.zeros(0, dtype=np.uint8)  # 0 = call, 1 = put
+        self.md_strike = np.zeros(0, dtype=np.float32)
+        # (slot, value) ticks not yet written into md_ask / md_delta; flush_md_columns
+        # scatters them in one assignment right before a scan
+        self._md_ask_pending = []
+        self._md_delta_pending = []
+        self.md_keys = []  # slot -> contract_key
+        self.md_index: Dict[str, int] = {}  # contract_key -> slot
         self.strike_to_row = {}  # strike -> sheet row index mapping for tksheet
-        self.historical_data = {}
+        self.strike_to_keys = {}  # strike -> {'C': contract_key, 'P': contract_key}
+        self.pending_subscriptions = []  # (req_id, contract) not yet sent via reqMktData
+        self.subscribe_batch_size = 8  # reqMktData calls per Tk event-loop slice
+        self.dirty_rows = set()  # Sheet row indices with new ticks since last chain redraw
+        self.chain_rows = []  # row index -> (strike, call market_data entry, put market_data entry)
+        self.sheet_strikes = []  # Strikes currently laid out as option_sheet rows
+        self.last_display_underlying = 0.0  # Underlying price used for last chain redraw
+        self.historical_data: Dict[str, BarBuffer] = {}
         self.historical_data_requests = {}  # reqId -> contract_key
-        self.positions = {}
+        self.positions: Dict[str, Position] = {}
+        self._position_rows = []  # Rows last written to position_sheet, for cell-level diffing
+        self._position_colors = []  # PnL colour last applied per position row
+        self._pos_cells = {}  # contract_key -> ((position, avgCost, currentPrice, pnl, entryTime), formatted cells)
+        self._positions_dirty = True  # Set by P&L/position/fill updates, cleared by update_positions_display
+        self._positions_drawn_at = 0.0  # time.monotonic() of the last positions repaint
+        self._order_rows: Dict[int, int] = {}  # order_id -> row index in order_sheet
+        self._pnl_dirty = deque()  # (contract_key, trade price or None) from the API thread, drained by _flush_pnl
+        self._pnl_flush_scheduled = False
         self.order_status = {}
         self.pending_orders = {}  # orderId -> (contract_key, action, quantity)
+        self.combo_orders = {}  # orderId -> {'legs': (call_key, put_key), 'quantity', 'net_debit'} for BAG straddles
+        self.con_ids = {}  # contract_key -> IBKR conId (combo legs must reference conIds)
+        self.contract_details_requests = {}  # reqId -> {'contract_key', 'on_done'}
         
         # ========================================================================
         # MANUAL TRADING MODE - Order Management System
@@ -928,7 +1223,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         # - Orders placed at mid-price with proper SPX rounding ($3+ = $0.10, <$3 = $0.05)
         # - Auto-adjusts limit price as market moves to ensure fills
         # - Monitors all open orders and updates UI in real-time
-        self.manual_orders = {}  # orderId -> {contract, action, quantity, initial_mid, last_mid, attempts, timestamp}
+        self.manual_orders = {}  # orderId -> {contract, action, quantity, initial_mid, last_mid, attempts, timestamp[, legs]}
         self.manual_order_update_interval = 1000  # Check/update orders every 1 second
         self.manual_order_max_price_deviation = 0.25  # Max $0.25 deviation before re-pricing
         
@@ -938,15 +1233,18 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         
         # Expiration management
         self.expiry_offset = 0  # 0 = today (0DTE), 1 = next expiry, etc.
+        self._expiry_cache = None  # (date, [YYYYMMDD...], [dropdown labels...]) for the next 10 expiries
         self.current_expiry = self.calculate_expiry_date(self.expiry_offset)
         # Note: GUI doesn't exist yet during __init__, so we can't log to it here
         # Expiration will be logged when GUI is ready
         
-        # Option chain
-        self.option_contracts = []  # List of all option contracts
+        # Option chain - parallel arrays sorted by strike, index == sheet row
+        self.chain_strikes = np.empty(0, dtype=np.float64)
+        self.call_contracts = []  # Call Contract per chain_strikes entry
+        self.put_contracts = []   # Put Contract per chain_strikes entry
+        self._option_protos = {}  # (symbol, trading_class, expiry) -> template Contract
         
         # Trading state
-        self.last_trade_hour = -1
         self.active_straddles = []  # List of active straddle positions
         
         # ========================================================================
@@ -955,9 +1253,11 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         self.straddle_enabled = False  # Separate on/off switch for straddle strategy
         self.straddle_frequency_minutes = 60  # How often to enter straddles (default: every 60 minutes)
         self.last_straddle_time = None  # Timestamp of last straddle entry
+        self.straddle_alarm_id = None  # Pending root.after id for the next check_trade_time
         
         # Supertrend data for each position
-        self.supertrend_data = {}  # contract_key -> supertrend values
+        self.supertrend_data: Dict[str, SupertrendState] = {}  # contract_key -> supertrend values
+        self._supertrend_batch = None  # Set by _warm_supertrend_batch once the parallel JIT compile is done
         
         # ========================================================================
         # Z-SCORE STRATEGY (Gamma-Snap HFS v3.0)
@@ -989,18 +1289,26 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         self.confirm_chart_active = False
         self.trade_chart_active = False
         
-        # Queues for thread communication
-        self.gui_queue = queue.Queue()
-        self.api_queue = queue.Queue()
+        # Self-rescheduling root.after loops tied to the connection, by purpose -> after id
+        self._after_ids = {}
+        
+        # API thread -> Tk thread handoff: (fn, args) drained by _drain_gui_calls on <<IBKRMessage>>
+        # deque.append/popleft are atomic, so no lock; one wake event is in flight at a time
+        self._gui_calls = deque()  # Unbounded: every post is a one-shot call that must run
+        self._gui_wake_pending = False
         
         # Threading
         self.api_thread = None
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='settings-io')  # Serialized settings writes
         self.running = False
         
         # GUI - Will be initialized in setup_gui()
         self.root: Optional['ttk.Window'] = None
         self.setup_gui()
         
+        # Compile the parallel supertrend batch kernel off the Tk thread (takes seconds under numba)
+        threading.Thread(target=self._warm_supertrend_batch, daemon=True).start()
+        
     def setup_gui(self):
         """Initialize the GUI"""
         self.root = ttk.Window(themename="darkly")
@@ -1120,11 +1428,12 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         # Create notebook for tabs
         self.notebook = ttk.Notebook(main_container)
         self.notebook.pack(fill=BOTH, expand=YES, padx=5, pady=(5, 0))
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_notebook_tab_changed)
         
         # Tab 1: Trading Dashboard
         self.create_trading_tab()
         
-        # Tab 2: Settings
+        # Tab 2: Settings - widgets are built the first time the tab is opened
         self.create_settings_tab()
         
         # Tab 3: Chart - NOW EMBEDDED IN TRADING TAB (chart moved to main trading tab)
@@ -1133,8 +1442,11 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         # Status bar at bottom (inside main_container so it's part of scrollable area)
         self.create_status_bar(main_container)
         
-        # Start GUI update loop
-        self.root.after(100, self.process_gui_queue)
+        # Wake-up for work handed over from the API thread (post_to_gui)
+        self.root.bind("<<IBKRMessage>>", self._drain_gui_calls)
+        
+        # Start batched log widget flush
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self.flush_log_queue)
         
         # Start time checker for hourly trades
         self.root.after(1000, self.check_trade_time)
@@ -1183,6 +1495,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         """
         tab = ttk.Frame(self.notebook)
         self.notebook.add(tab, text="Option Chain & Trading Dashboard")
+        self.dashboard_tab = tab  # Positions sheet lives here; its refresh pauses while hidden
         
         # Option Chain header with price and controls
         chain_header = ttk.Frame(tab)
@@ -1730,8 +2043,8 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         trade_period.pack(side=LEFT, padx=2)
         
         # Initialize chart data containers
-        self.confirm_bar_data = []
-        self.trade_bar_data = []
+        self.confirm_bar_data = BarBuffer(capacity=4096, dtype=np.float64)
+        self.trade_bar_data = BarBuffer(capacity=4096, dtype=np.float64)
         self.chart_trade_markers = []
         
         self.log_message(f"{TRADING_SYMBOL} dual-chart system created - Confirmation + Trade charts", "INFO")
@@ -2137,17 +2450,32 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         # Initialize chart tracking variables
         self.selected_call_contract = None
         self.selected_put_contract = None
+        self.tick_req_ids = {}  # reqId -> (contract_key, 'call'/'put') for tick-by-tick midpoint streams
+        self.tick_buckets = {}  # contract_key -> epoch start of the bar the stream is currently building
+        self.tick_redraw_pending = set()  # option types with a chart redraw already queued
+        self.tick_bar_seconds = {'call': 60, 'put': 60}  # Chart bar length, cached off the timeframe vars
+        self.call_timeframe_var.trace_add('write', lambda *_: self.cache_bar_seconds('call'))
+        self.put_timeframe_var.trace_add('write', lambda *_: self.cache_bar_seconds('put'))
         self.chart_update_interval = 5000  # Legacy variable (no longer used for auto-refresh)
         
         # Debounce variables for responsive chart updates
         self.call_chart_update_pending = None
         self.put_chart_update_pending = None
+        self._candle_live = {}  # chart_type -> forming-bar artists + cached background for blitting
+        self._index_chart_live = {}  # 'confirm'/'trade' -> persistent candle/indicator artists
+        self._candle_draw_hooks = {}  # chart_type -> draw_event connection id
         self.chart_debounce_delay = 100  # 100ms debounce for TradingView-like responsiveness
     
     def create_settings_tab(self):
-        """Create the settings tab"""
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Settings")
+        """Add the (still empty) settings tab; on_notebook_tab_changed fills it on first view"""
+        self.settings_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.settings_tab, text="Settings")
+        self._settings_built = False
+    
+    def build_settings_tab(self):
+        """Create the settings tab widgets"""
+        self._settings_built = True
+        tab = self.settings_tab
         
         # Create scrollable frame
         canvas = tk.Canvas(tab, bg='#181818', highlightthickness=0)
@@ -2261,12 +2589,9 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         
         self.log_message("Chart tab created - ready for data", "INFO")
     
+    @requires_connection("refresh chart")
     def refresh_confirm_chart(self):
         """Refresh confirmation chart with current settings"""
-        if self.connection_state != ConnectionState.CONNECTED:
-            self.log_message("Cannot refresh chart - not connected", "WARNING")
-            return
-        
         # Cancel existing subscription first to avoid duplicate ticker ID error
         if self.confirm_chart_active:
             try:
@@ -2314,12 +2639,9 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         except Exception as e:
             self.log_message(f"Error requesting Confirmation chart: {str(e)}", "ERROR")
     
+    @requires_connection("refresh chart")
     def refresh_trade_chart(self):
         """Refresh trade chart with current settings"""
-        if self.connection_state != ConnectionState.CONNECTED:
-            self.log_message("Cannot refresh chart - not connected", "WARNING")
-            return
-        
         # Cancel existing subscription first to avoid duplicate ticker ID error
         if self.trade_chart_active:
             try:
@@ -2400,16 +2722,19 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             chart_name = "Trade"
             chart_title = f"{TRADING_SYMBOL} Trade Chart ({ema_length}-EMA, Z-Period={z_period})"
         
-        if not bar_data:
+        n_bars = len(bar_data)
+        if not n_bars:
             self.log_message(f"No {chart_name} chart data to display", "WARNING")
             return
         
-        # Convert bar data to DataFrame
-        df = pd.DataFrame(bar_data)
-        
-        # Parse time strings to datetime
-        if isinstance(df['time'].iloc[0], str):
-            df['time'] = pd.to_datetime(df['time'], format='%Y%m%d  %H:%M:%S')
+        # Bars are already columns - wrap views of them, no per-bar records
+        opens = bar_data.open[:n_bars]
+        highs = bar_data.high[:n_bars]
+        lows = bar_data.low[:n_bars]
+        closes = bar_data.close[:n_bars]
+        bar_ts = bar_data.ts[:n_bars]  # Epoch seconds parsed once on arrival (no per-redraw date parsing)
+        df = pd.DataFrame({'open': opens, 'high': highs, 'low': lows, 'close': closes,
+                           'volume': bar_data.volume[:n_bars]})
         
         # Calculate EMA with configurable length
         df['ema'] = df['close'].ewm(span=ema_length, adjust=False).mean()
@@ -2421,74 +2746,152 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         df['bb_upper'] = sma + (std * 2)
         df['bb_lower'] = sma - (std * 2)
         
-        # Clear previous charts
-        price_ax.clear()
-        zscore_ax.clear()
+        # Build the artists once per chart and indicator settings; later bars only
+        # swap their data in (no clear / re-plot / re-style on every update)
+        live = self._index_chart_live.get(chart_type)
+        settings = (ema_length, z_period, z_threshold, chart_title)
+        if live is None or live['settings'] != settings:
+            live = self._create_index_chart_artists(price_ax, zscore_ax, ema_length, z_threshold,
+                                                    chart_title)
+            live['settings'] = settings
+            self._index_chart_live[chart_type] = live
+        
+        # Trade markers come and go with trades - replace just those
+        for artist in live['transient']:
+            artist.remove()
+        live['transient'] = []
         
         # ========================================================================
         # PRICE CHART (Top Subplot)
         # ========================================================================
         
-        # Plot candlesticks manually
-        for i, (idx, row) in enumerate(df.iterrows()):
-            color = '#26a69a' if row['close'] >= row['open'] else '#ef5350'  # Green up, red down
-            
-            # Draw the candle body
-            body_height = abs(row['close'] - row['open'])
-            body_bottom = min(row['open'], row['close'])
-            
-            price_ax.add_patch(Rectangle(
-                (i, body_bottom), 0.8, body_height,
-                facecolor=color, edgecolor=color, linewidth=0
-            ))
-            
-            # Draw the wicks
-            price_ax.plot([i + 0.4, i + 0.4], [row['low'], row['high']], 
-                         color=color, linewidth=1)
-        
-        # Plot EMA (with dynamic label showing actual length)
-        price_ax.plot(range(len(df)), df['ema'], color='#FF8C00', linewidth=2, 
-                     label=f'{ema_length}-EMA', alpha=0.9)
-        
-        # Plot Bollinger Bands
-        price_ax.plot(range(len(df)), df['bb_upper'], color='#2962FF', linewidth=1, 
-                     label='BB Upper', alpha=0.5, linestyle='--')
-        price_ax.plot(range(len(df)), df['bb_lower'], color='#2962FF', linewidth=1, 
-                     label='BB Lower', alpha=0.5, linestyle='--')
-        
-        # Add trade markers (ONLY on Trade chart)
+        # Candlesticks as one wick and one body collection (no per-bar artists)
+        colors = np.where(closes >= opens, '#26a69a', '#ef5350')  # Green up, red down
+        wick_segments, body_verts = self._candle_geometry(
+            np.arange(n_bars) + 0.4, opens, highs, lows, closes, half_width=0.4
+        )
+        live['body'].set_verts(body_verts)
+        live['body'].set_facecolor(colors)
+        live['body'].set_edgecolor(colors)
+        live['wick'].set_segments(wick_segments)
+        live['wick'].set_color(colors)
+        
+        # EMA and Bollinger Bands
+        x = np.arange(n_bars)
+        ema = df['ema'].to_numpy()
+        bb_upper = df['bb_upper'].to_numpy()
+        bb_lower = df['bb_lower'].to_numpy()
+        live['ema'].set_data(x, ema)
+        live['bb_upper'].set_data(x, bb_upper)
+        live['bb_lower'].set_data(x, bb_lower)
+        
+        # Add trade markers (ONLY on Trade chart) - one scatter per marker kind, not per trade
         if chart_type == "trade":
+            entry_x, entry_y = [], []
+            exit_x, exit_y, exit_colors = [], [], []
             for trade in self.trade_history:
                 try:
                     if 'entry_time' in trade:
-                        time_diffs = (df['time'] - trade['entry_time']).abs()
-                        entry_idx = time_diffs.idxmin()
-                        entry_loc = df.index.get_loc(entry_idx)
-                        if isinstance(entry_loc, int):
-                            entry_position = entry_loc
-                            entry_price = trade.get('entry_price', 0)
-                            if entry_price > 0:
-                                price_ax.scatter(entry_position, entry_price, marker='v', s=200, 
-                                               color='#2196F3', zorder=5)
+                        entry_ts = calendar.timegm(trade['entry_time'].timetuple())
+                        entry_position = int(np.abs(bar_ts - entry_ts).argmin())  # Nearest bar
+                        entry_price = trade.get('entry_price', 0)
+                        if entry_price > 0:
+                            entry_x.append(entry_position)
+                            entry_y.append(entry_price)
+                            live['transient'].append(
                                 price_ax.text(entry_position, entry_price, f" ${entry_price:.2f}", 
-                                            color='#2196F3', fontsize=8, va='top')
+                                              color='#2196F3', fontsize=8, va='top'))
                     
                     if 'exit_time' in trade and trade.get('exit_time'):
-                        time_diffs = (df['time'] - trade['exit_time']).abs()
-                        exit_idx = time_diffs.idxmin()
-                        exit_loc = df.index.get_loc(exit_idx)
-                        if isinstance(exit_loc, int):
-                            exit_position = exit_loc
-                            exit_price = trade.get('exit_price_final', 0)
-                            if exit_price > 0:
-                                pnl = trade.get('pnl', 0)
-                                marker_color = '#00FF00' if pnl > 0 else '#FF0000'
-                                price_ax.scatter(exit_position, exit_price, marker='^', s=200, 
-                                               color=marker_color, zorder=5)
+                        exit_ts = calendar.timegm(trade['exit_time'].timetuple())
+                        exit_position = int(np.abs(bar_ts - exit_ts).argmin())
+                        exit_price = trade.get('exit_price_final', 0)
+                        if exit_price > 0:
+                            pnl = trade.get('pnl', 0)
+                            marker_color = '#00FF00' if pnl > 0 else '#FF0000'
+                            exit_x.append(exit_position)
+                            exit_y.append(exit_price)
+                            exit_colors.append(marker_color)
+                            live['transient'].append(
                                 price_ax.text(exit_position, exit_price, f" ${exit_price:.2f}\n${pnl:.0f}", 
-                                            color=marker_color, fontsize=8, va='bottom')
+                                              color=marker_color, fontsize=8, va='bottom'))
                 except Exception as e:
                     continue
+            if entry_x:
+                live['transient'].append(
+                    price_ax.scatter(entry_x, entry_y, marker='v', s=200, color='#2196F3', zorder=5))
+            if exit_x:
+                live['transient'].append(
+                    price_ax.scatter(exit_x, exit_y, marker='^', s=200, c=exit_colors, zorder=5))
+        
+        # Current price marker on the Y-axis
+        current_price = float(closes[-1])
+        live['price_line'].set_ydata([current_price, current_price])
+        live['price_text'].set_position((n_bars + 0.5, current_price))
+        live['price_text'].set_text(f' ${current_price:.2f} ')
+        
+        # Limits the old autoscale produced: bars plus indicator lines with a 5% margin
+        y_low = float(np.nanmin([lows.min(), np.nanmin(bb_lower, initial=np.inf)]))
+        y_high = float(np.nanmax([highs.max(), np.nanmax(bb_upper, initial=-np.inf)]))
+        y_pad = (y_high - y_low) * 0.05 or 1.0
+        x_pad = n_bars * 0.05
+        price_ax.set_xlim(-x_pad, n_bars + x_pad)  # Z-Score axis shares x
+        price_ax.set_ylim(y_low - y_pad, y_high + y_pad)
+        
+        # ========================================================================
+        # Z-SCORE INDICATOR (Bottom Subplot)
+        # ========================================================================
+        
+        z_score_array = df['z_score'].to_numpy()
+        live['z_line'].set_data(x, z_score_array)
+        
+        # Fill areas for visual clarity: one polygon per sign, the curve clipped at 0
+        # and closed back along the zero line (NaN warm-up bars sit on the line)
+        z_filled = np.nan_to_num(z_score_array)
+        x_edges = np.concatenate(([0], x, [n_bars - 1]))
+        for fill, clipped in ((live['z_fill_pos'], np.maximum(z_filled, 0)),
+                              (live['z_fill_neg'], np.minimum(z_filled, 0))):
+            fill.set_verts([np.column_stack((x_edges, np.concatenate(([0], clipped, [0]))))])
+        
+        # Current Z-Score label on Y-axis (hidden until the first full window)
+        z_text = live['z_text']
+        current_zscore = z_score_array[-1]
+        if np.isnan(current_zscore):
+            z_text.set_visible(False)
+        else:
+            zscore_color = '#44ff44' if current_zscore > 0 else '#ff4444' if current_zscore < 0 else '#808080'
+            z_text.set_position((n_bars + 0.5, current_zscore))
+            z_text.set_text(f' {current_zscore:.2f} ')
+            z_text.set_color(zscore_color)
+            z_text.get_bbox_patch().set_edgecolor(zscore_color)
+            z_text.set_visible(True)
+        
+        # Refresh canvas - draw_idle lets Tk coalesce back-to-back updates into one paint
+        canvas.draw_idle()
+        
+        # Chart updated successfully (logging removed to reduce spam)
+    
+    def _create_index_chart_artists(self, price_ax, zscore_ax, ema_length, z_threshold, chart_title):
+        """Clear a confirmation/trade chart and build its persistent artists with no data
+        
+        update_chart_display() fills them in with set_data/set_verts on every update.
+        
+        Returns:
+            dict of the artists to update, plus a 'transient' list for the trade markers
+        """
+        price_ax.clear()
+        zscore_ax.clear()
+        
+        body = price_ax.add_collection(PolyCollection([], linewidths=0))
+        wick = price_ax.add_collection(LineCollection([], linewidths=1))
+        
+        # EMA (with dynamic label showing actual length) and Bollinger Bands
+        ema_line, = price_ax.plot([], [], color='#FF8C00', linewidth=2, 
+                                  label=f'{ema_length}-EMA', alpha=0.9)
+        bb_upper_line, = price_ax.plot([], [], color='#2962FF', linewidth=1, 
+                                       label='BB Upper', alpha=0.5, linestyle='--')
+        bb_lower_line, = price_ax.plot([], [], color='#2962FF', linewidth=1, 
+                                       label='BB Lower', alpha=0.5, linestyle='--')
         
         # Price chart styling
         price_ax.set_facecolor('#000000')
@@ -2505,44 +2908,32 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         price_ax.set_ylabel(f'{TRADING_SYMBOL} Price', color='#808080', fontsize=9)
         price_ax.set_title(chart_title, color='#C0C0C0', fontsize=11, fontweight='bold', pad=5)
         
-        # Add current price label on Y-axis (bold and highlighted)
-        if not df.empty:
-            current_price = df['close'].iloc[-1]
-            price_ax.axhline(y=current_price, color='#00FF00', linestyle='--', linewidth=1, alpha=0.3)
-            price_ax.text(len(df) + 0.5, current_price, f' ${current_price:.2f} ', 
-                         fontsize=9, fontweight='bold', color='#00FF00',
-                         bbox=dict(boxstyle='round,pad=0.3', facecolor='#000000', 
-                                  edgecolor='#00FF00', linewidth=1.5),
-                         verticalalignment='center', horizontalalignment='left')
+        # Current price label on Y-axis (bold and highlighted)
+        price_line = price_ax.axhline(y=0, color='#00FF00', linestyle='--', linewidth=1, alpha=0.3)
+        price_text = price_ax.text(0, 0, '', 
+                                   fontsize=9, fontweight='bold', color='#00FF00',
+                                   bbox=dict(boxstyle='round,pad=0.3', facecolor='#000000', 
+                                             edgecolor='#00FF00', linewidth=1.5),
+                                   verticalalignment='center', horizontalalignment='left')
         
         # Legend for price chart
-        if df['ema'].notna().any():
-            legend = price_ax.legend(loc='upper left', facecolor='#1a1a1a', 
-                                    edgecolor='#3a3a3a', framealpha=0.9, fontsize=8)
-            for text in legend.get_texts():
-                text.set_color('#C0C0C0')
-        
-        # ========================================================================
-        # Z-SCORE INDICATOR (Bottom Subplot)
-        # ========================================================================
-        
-        # Plot Z-Score line
-        z_score_array = df['z_score'].to_numpy()
-        zscore_ax.plot(range(len(df)), z_score_array, color='#00BFFF', linewidth=2, 
-                      label='Z-Score', alpha=0.9)
+        legend = price_ax.legend(loc='upper left', facecolor='#1a1a1a', 
+                                 edgecolor='#3a3a3a', framealpha=0.9, fontsize=8)
+        for text in legend.get_texts():
+            text.set_color('#C0C0C0')
         
-        # Fill areas for visual clarity
-        zscore_ax.fill_between(range(len(df)), 0, z_score_array, 
-                              where=(z_score_array > 0), color='#44ff44', alpha=0.2)  # type: ignore
-        zscore_ax.fill_between(range(len(df)), 0, z_score_array, 
-                              where=(z_score_array < 0), color='#ff4444', alpha=0.2)  # type: ignore
+        # Z-Score line and its above/below-zero fills
+        z_fill_pos = zscore_ax.add_collection(PolyCollection([], facecolors='#44ff44', alpha=0.2, linewidths=0))
+        z_fill_neg = zscore_ax.add_collection(PolyCollection([], facecolors='#ff4444', alpha=0.2, linewidths=0))
+        z_line, = zscore_ax.plot([], [], color='#00BFFF', linewidth=2, 
+                                 label='Z-Score', alpha=0.9)
         
         # Entry signal lines (use configurable threshold)
         zscore_ax.axhline(y=0, color='#808080', linestyle='-', linewidth=1, alpha=0.5)
         zscore_ax.axhline(y=z_threshold, color='#44ff44', linestyle='--', linewidth=1.5, 
-                         alpha=0.8, label=f'Buy Signal (+{z_threshold})')
+                          alpha=0.8, label=f'Buy Signal (+{z_threshold})')
         zscore_ax.axhline(y=-z_threshold, color='#ff4444', linestyle='--', linewidth=1.5, 
-                         alpha=0.8, label=f'Sell Signal (-{z_threshold})')
+                          alpha=0.8, label=f'Sell Signal (-{z_threshold})')
         
         # Z-Score chart styling
         zscore_ax.set_facecolor('#000000')
@@ -2560,26 +2951,26 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         zscore_ax.set_xlabel('Time', color='#808080', fontsize=9)
         zscore_ax.set_ylim(-3, 3)
         
-        # Add current Z-Score label on Y-axis (bold and highlighted)
-        if not df.empty and not df['z_score'].isna().iloc[-1]:
-            current_zscore = df['z_score'].iloc[-1]
-            zscore_color = '#44ff44' if current_zscore > 0 else '#ff4444' if current_zscore < 0 else '#808080'
-            zscore_ax.text(len(df) + 0.5, current_zscore, f' {current_zscore:.2f} ', 
-                          fontsize=9, fontweight='bold', color=zscore_color,
-                          bbox=dict(boxstyle='round,pad=0.3', facecolor='#000000', 
-                                   edgecolor=zscore_color, linewidth=1.5),
-                          verticalalignment='center', horizontalalignment='left')
+        # Current Z-Score label on Y-axis (bold and highlighted)
+        z_text = zscore_ax.text(0, 0, '', 
+                                fontsize=9, fontweight='bold', color='#808080',
+                                bbox=dict(boxstyle='round,pad=0.3', facecolor='#000000', 
+                                          edgecolor='#808080', linewidth=1.5),
+                                verticalalignment='center', horizontalalignment='left')
         
         # Legend for Z-Score
         z_legend = zscore_ax.legend(loc='upper left', facecolor='#1a1a1a', 
-                                   edgecolor='#3a3a3a', framealpha=0.9, fontsize=8)
+                                    edgecolor='#3a3a3a', framealpha=0.9, fontsize=8)
         for text in z_legend.get_texts():
             text.set_color('#C0C0C0')
         
-        # Refresh canvas
-        canvas.draw()
-        
-        # Chart updated successfully (logging removed to reduce spam)
+        return {
+            'body': body, 'wick': wick,
+            'ema': ema_line, 'bb_upper': bb_upper_line, 'bb_lower': bb_lower_line,
+            'price_line': price_line, 'price_text': price_text,
+            'z_line': z_line, 'z_text': z_text, 'z_fill_pos': z_fill_pos, 'z_fill_neg': z_fill_neg,
+            'transient': [],
+        }
     
     def create_status_bar(self, parent):
         """Create status bar at bottom of window (now inside scrollable container)"""
@@ -2639,9 +3030,15 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         """Update time display"""
         if not self.root:
             return
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.time_label.config(text=current_time)
-        self.root.after(1000, self.update_time)
+        now = datetime.now()
+        # strftime the date/hour/minute part once a minute; each tick only appends seconds
+        minute = now.replace(second=0, microsecond=0)
+        if self._clock_prefix[0] != minute:
+            self._clock_prefix = (minute, now.strftime("%Y-%m-%d %H:%M"))
+        self.time_label.config(text=f"{self._clock_prefix[1]}:{now.second:02d}")
+        # Wake just after the next whole second rather than every 1000 ms from now,
+        # so the clock neither drifts nor skips a second under a busy event loop
+        self.root.after(1000 - now.microsecond // 1000 + 5, self.update_time)
     
     def update_vix_display(self):
         """Update VIX display in status bar"""
@@ -2757,7 +3154,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             # Connection lost - update state and schedule reconnection
             self.connection_state = ConnectionState.DISCONNECTED
             self.log_message("Connection lost, scheduling reconnection attempt...", "WARNING")
-            self.schedule_reconnect()
+            self.post_to_gui(self.schedule_reconnect)  # Touches status_label/connect_btn
     
     def disconnect_from_ib(self):
         """
@@ -2778,6 +3175,10 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         self.data_server_ok = False  # Reset data server flag on disconnect
         self.client_id_iterator = 1  # Reset client ID iterator for next connection
         
+        # Stop chain display/refresh/subscribe loops so a reconnect doesn't stack duplicates
+        self.cancel_scheduled()
+        self.pending_subscriptions = []
+        
         # Reset chart subscription flags
         self.confirm_chart_active = False
         self.trade_chart_active = False
@@ -2786,6 +3187,49 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         self.connect_btn.config(text="Connect", state=tk.NORMAL)
         self.log_message("Disconnected from IBKR successfully", "INFO")
     
+    def schedule_after(self, name: str, ms: int, fn, *args):
+        """root.after that replaces any pending callback registered under the same name"""
+        pending = self._after_ids.get(name)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._after_ids[name] = self.root.after(ms, fn, *args)
+    
+    def post_to_gui(self, fn, *args):
+        """Run fn(*args) on the Tk thread; safe to call from the IBKR API thread"""
+        if not self.root:
+            return
+        self._gui_calls.append((fn, args))
+        if not self._gui_wake_pending:
+            self._gui_wake_pending = True
+            self.root.event_generate("<<IBKRMessage>>", when="tail")
+    
+    def _drain_gui_calls(self, event=None):
+        """Run up to 64 queued post_to_gui calls in order"""
+        self._gui_wake_pending = False
+        # Size the batch up front: no per-item emptiness check or IndexError on the last pop
+        for _ in range(min(64, len(self._gui_calls))):
+            fn, args = self._gui_calls.popleft()
+            try:
+                fn(*args)
+            except Exception as e:
+                self.log_message(f"Error in GUI update {getattr(fn, '__name__', fn)}: {e}", "ERROR")
+        # More left than one batch - let Tk process other events before the rest
+        if self._gui_calls and not self._gui_wake_pending:
+            self._gui_wake_pending = True
+            self.root.event_generate("<<IBKRMessage>>", when="tail")
+    
+    def cancel_scheduled(self):
+        """Cancel every callback registered through schedule_after"""
+        for after_id in self._after_ids.values():
+            try:
+                self.root.after_cancel(after_id)
+            except tk.TclError:
+                pass  # Already fired or root destroyed
+        self._after_ids.clear()
+        # A cancelled pnl_flush would otherwise leave the flag stuck and no flush ever scheduled again
+        self._pnl_flush_scheduled = False
+        self._pnl_dirty.clear()
+    
     def retry_connection_with_new_client_id(self):
         """Retry connection with new client ID after error 326"""
         self.handling_client_id_error = False
@@ -2815,19 +3259,27 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             return
         
         self.reconnect_attempts += 1
+        
+        # Exponential backoff with jitter: 1s, 2s, 4s, ... capped at max_reconnect_delay
+        self.reconnect_delay = min(
+            self.max_reconnect_delay,
+            self.base_reconnect_delay * (2 ** (self.reconnect_attempts - 1))
+        ) + random.uniform(0, self.reconnect_jitter)
+        
         self.log_message(
             f"Scheduling reconnection attempt {self.reconnect_attempts}/{self.max_reconnect_attempts} "
-            f"in {self.reconnect_delay} seconds...", 
+            f"in {self.reconnect_delay:.1f} seconds...", 
             "WARNING"
         )
         
         # Update UI to show reconnection status
         self.status_label.config(
-            text=f"Status: Reconnecting ({self.reconnect_attempts}/{self.max_reconnect_attempts})..."
+            text=f"Status: Reconnecting ({self.reconnect_attempts}/{self.max_reconnect_attempts}) "
+                 f"in {self.reconnect_delay:.1f}s..."
         )
         
         # Schedule reconnection
-        self.root.after(self.reconnect_delay * 1000, self.connect_to_ib)
+        self.root.after(int(self.reconnect_delay * 1000), self.connect_to_ib)
     
     def on_connected(self):
         """
@@ -2836,6 +3288,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         """
         self.log_message("Connection established successfully!", "SUCCESS")
         self.reconnect_attempts = 0  # Reset reconnect counter
+        self.reconnect_delay = self.base_reconnect_delay  # Reset backoff
         
         # Update UI
         self.status_label.config(text="Status: Connected")
@@ -2865,6 +3318,11 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         if self.subscribed_contracts:
             self.log_message(f"Reconnection detected - resubscribing to {len(self.subscribed_contracts)} contracts...", "INFO")
             self.resubscribe_market_data()
+        
+        # Bars survive a disconnect - bring every cached contract's supertrend up to date in one pass
+        # (state only: no exit checks against pre-disconnect bars/quotes)
+        if self.historical_data:
+            self.calculate_supertrend_bulk(list(self.historical_data))
     
     def save_and_reconnect(self):
         """Save settings and reconnect"""
@@ -2881,9 +3339,10 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
     def save_settings(self):
         """Save settings to file"""
         try:
-            self.host = self.host_entry.get()
-            self.port = int(self.port_entry.get())
-            self.client_id = int(self.client_entry.get())
+            if self._settings_built:
+                self.host = self.host_entry.get()
+                self.port = int(self.port_entry.get())
+                self.client_id = int(self.client_entry.get())
             self.strikes_above = int(self.strikes_above_entry.get())
             self.strikes_below = int(self.strikes_below_entry.get())
             self.chain_refresh_interval = int(self.chain_refresh_entry.get())
@@ -2900,6 +3359,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 'strikes_above': self.strikes_above,
                 'strikes_below': self.strikes_below,
                 'chain_refresh_interval': self.chain_refresh_interval,
+                'log_level': self.log_level,
                 'strategy_enabled': self.strategy_enabled,
                 # Master Settings
                 'vix_threshold': self.vix_threshold,
@@ -2926,8 +3386,8 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 'trade_timeframe': self.trade_timeframe_var.get()
             }
             
-            with open('settings.json', 'w') as f:
-                json.dump(settings, f, indent=4)
+            # Write off the Tk thread; single worker keeps saves in order
+            self._io_pool.submit(self._write_settings_atomic, settings)
             
             self.log_message("Settings saved successfully", "SUCCESS")
         except Exception as e:
@@ -2936,14 +3396,15 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
     def auto_save_settings(self, event=None):
         """Auto-save settings when any field changes (silent save without log message)"""
         try:
-            if not hasattr(self, 'host_entry'):
+            if not hasattr(self, 'settings_tab'):
                 return  # GUI not fully initialized yet
             
             # Read values from entries (with validation)
             try:
-                self.host = self.host_entry.get()
-                self.port = int(self.port_entry.get())
-                self.client_id = int(self.client_entry.get())
+                if self._settings_built:  # Connection entries exist once the tab was opened
+                    self.host = self.host_entry.get()
+                    self.port = int(self.port_entry.get())
+                    self.client_id = int(self.client_entry.get())
                 self.strikes_above = int(self.strikes_above_entry.get())
                 self.strikes_below = int(self.strikes_below_entry.get())
                 self.chain_refresh_interval = int(self.chain_refresh_entry.get())
@@ -2967,6 +3428,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 'strikes_above': self.strikes_above,
                 'strikes_below': self.strikes_below,
                 'chain_refresh_interval': self.chain_refresh_interval,
+                'log_level': self.log_level,
                 'strategy_enabled': self.strategy_enabled,
                 # Master Settings
                 'vix_threshold': getattr(self, 'vix_threshold', 30.0),
@@ -2996,14 +3458,24 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 'trade_timeframe': self.trade_timeframe_var.get() if hasattr(self, 'trade_timeframe_var') else '15 secs'
             }
             
-            with open('settings.json', 'w') as f:
-                json.dump(settings, f, indent=4)
+            # Write off the Tk thread; single worker keeps saves in order
+            self._io_pool.submit(self._write_settings_atomic, settings)
             
             # Silent save - no log message to avoid spam
         except Exception as e:
             # Silent fail for auto-save
             pass
     
+    def _write_settings_atomic(self, settings: dict):
+        """Write settings.json via a temp file + os.replace so a crash never leaves it truncated"""
+        try:
+            text = json.dumps(settings, indent=2)  # Serialize once, one write() call
+            with open('settings.json.tmp', 'w') as f:
+                f.write(text)
+            os.replace('settings.json.tmp', 'settings.json')
+        except Exception as e:
+            self.log_message(f"Error writing settings: {str(e)}", "ERROR")
+    
     def load_settings(self):
         """Load settings from file"""
         try:
@@ -3021,6 +3493,9 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 self.strikes_below = settings.get('strikes_below', self.strikes_below)
                 self.chain_refresh_interval = settings.get('chain_refresh_interval', 
                                                           self.chain_refresh_interval)
+                if settings.get('log_level') in LOG_LEVELS:
+                    self.log_level = settings['log_level']
+                    self.log_level_num = LOG_LEVELS[self.log_level]
                 self.strategy_enabled = settings.get('strategy_enabled', False)
                 
                 # Z-Score Strategy Parameters
@@ -3252,6 +3727,9 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             self.log_message("✗ STRADDLE STRATEGY DISABLED", "WARNING")
             self.log_message("=" * 60, "INFO")
         
+        # Re-arm (or cancel) the straddle alarm for the new state
+        self.check_trade_time()
+        
         # Auto-save settings
         self.auto_save_settings()
     
@@ -3259,15 +3737,12 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
     # SPX UNDERLYING PRICE
     # ========================================================================
     
+    @requires_connection("subscribe to underlying price")
     def subscribe_underlying_price(self):
         """
         Subscribe to SPX underlying index price.
         This provides real-time price updates for the SPX index.
         """
-        if self.connection_state != ConnectionState.CONNECTED:
-            self.log_message("Cannot subscribe to underlying price - not connected", "WARNING")
-            return
-        
         # Create underlying index contract
         underlying_contract = Contract()
         underlying_contract.symbol = UNDERLYING_SYMBOL
@@ -3289,11 +3764,9 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         # Request underlying 1-min historical data for Z-Score strategy
         self.request_spx_1min_history()
     
+    @requires_connection()
     def subscribe_vix_price(self):
         """Subscribe to VIX index for volatility monitoring"""
-        if self.connection_state != ConnectionState.CONNECTED:
-            return
-        
         vix_contract = Contract()
         vix_contract.symbol = "VIX"
         vix_contract.secType = "IND"
@@ -3303,11 +3776,9 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         self.reqMktData(self.vix_req_id, vix_contract, "", False, False, [])
         self.log_message(f"Subscribed to VIX (reqId: {self.vix_req_id})", "INFO")
     
+    @requires_connection()
     def request_spx_1min_history(self):
         """Request underlying 1-minute historical data for Z-Score calculation"""
-        if self.connection_state != ConnectionState.CONNECTED:
-            return
-        
         underlying_contract = Contract()
         underlying_contract.symbol = UNDERLYING_SYMBOL
         underlying_contract.secType = "IND"
@@ -3350,54 +3821,58 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         
         SPX options now have DAILY expirations (Monday-Friday).
         """
-        from datetime import timedelta
-        
-        current_date = datetime.now()
-        target_date = current_date
+        # Dropdown range is computed once per calendar day
+        if offset < 10:
+            return self._get_expiry_cache()[1][offset]
         
-        # SPX has daily expirations Monday-Friday
-        # 0 = Monday, 1 = Tuesday, 2 = Wednesday, 3 = Thursday, 4 = Friday
-        expiry_days = [0, 1, 2, 3, 4]
-        
-        days_checked = 0
-        expirations_found = 0
-        
-        # Find the Nth expiration (where N = offset)
-        # If offset=0 and today is an expiry day, return today
-        while True:
-            if target_date.weekday() in expiry_days:
-                if expirations_found == offset:
-                    return target_date.strftime("%Y%m%d")
-                expirations_found += 1
-            
-            target_date += timedelta(days=1)
-            days_checked += 1
-            
-            # Safety check
-            if days_checked > 60:
-                self.log_message("Error calculating expiry date - exceeded max days", "ERROR")
-                return datetime.now().strftime("%Y%m%d")
-        
-        return target_date.strftime("%Y%m%d")
+        return self._nth_expiry(datetime.now(), offset).strftime("%Y%m%d")
     
-    def get_expiration_options(self) -> list:
-        """Get list of expiration options for dropdown"""
-        options = []
+    @staticmethod
+    def _nth_expiry(now: datetime, offset: int) -> datetime:
+        """
+        Return the Nth Monday-Friday expiration on or after now, in closed form.
+        Every 5 expirations span exactly one calendar week; a remainder that
+        runs past Friday skips the weekend.
+        """
+        # First expiry: today on a weekday, otherwise the coming Monday
+        weekday = now.weekday()
+        if weekday >= 5:
+            now += timedelta(days=7 - weekday)
+            weekday = 0
+        
+        weeks, rem = divmod(offset, 5)
+        days = weeks * 7 + rem
+        if weekday + rem >= 5:
+            days += 2  # Crossed a weekend
+        return now + timedelta(days=days)
+    
+    def _get_expiry_cache(self) -> tuple:
+        """Return (date, expiries, labels) for the next 10 expirations, rebuilt when the date rolls"""
+        now = datetime.now()
+        today = now.date()
+        if self._expiry_cache is not None and self._expiry_cache[0] == today:
+            return self._expiry_cache
         
+        # SPX has daily expirations Monday-Friday
+        expiries = []
+        labels = []
         for i in range(10):  # Show next 10 expirations
-            expiry_date = self.calculate_expiry_date(i)
-            date_obj = datetime.strptime(expiry_date, "%Y%m%d")
-            
+            target_date = self._nth_expiry(now, i)
             if i == 0:
-                label = f"0 DTE (Today - {date_obj.strftime('%m/%d/%Y')})"
+                label = f"0 DTE (Today - {target_date.strftime('%m/%d/%Y')})"
             elif i == 1:
-                label = f"1 DTE (Next - {date_obj.strftime('%m/%d/%Y')})"
+                label = f"1 DTE (Next - {target_date.strftime('%m/%d/%Y')})"
             else:
-                label = f"{i} DTE ({date_obj.strftime('%m/%d/%Y')})"
-            
-            options.append(label)
+                label = f"{i} DTE ({target_date.strftime('%m/%d/%Y')})"
+            expiries.append(target_date.strftime("%Y%m%d"))
+            labels.append(label)
         
-        return options
+        self._expiry_cache = (today, expiries, labels)
+        return self._expiry_cache
+    
+    def get_expiration_options(self) -> list:
+        """Get list of expiration options for dropdown"""
+        return list(self._get_expiry_cache()[2])
     
     def on_expiry_changed(self, event=None):
         """Handle expiration dropdown change"""
@@ -3428,6 +3903,11 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         - SPX_6745_P_20251020 (SPX Put at 6745, expiring Oct 20, 2025)
         - AAPL_150.5_C_20251120 (AAPL Call at 150.50, expiring Nov 20, 2025)
         """
+        ident = (contract.symbol, contract.strike, contract.right, contract.lastTradeDateOrContractMonth)
+        contract_key = self._contract_keys.get(ident)
+        if contract_key is not None:
+            return contract_key
+        
         # Format strike: remove unnecessary decimals (.0 becomes empty)
         strike = contract.strike
         if strike == int(strike):
@@ -3438,7 +3918,31 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         # Get YYYYMMDD from expiration (full 8-character date)
         expiry_yyyymmdd = contract.lastTradeDateOrContractMonth[:8] if contract.lastTradeDateOrContractMonth else "00000000"
         
-        return f"{contract.symbol}_{strike_str}_{contract.right}_{expiry_yyyymmdd}"
+        # Interned once per contract; later calls are a dict hit and reuse the same string
+        contract_key = sys.intern(f"{contract.symbol}_{strike_str}_{contract.right}_{expiry_yyyymmdd}")
+        self._contract_keys[ident] = contract_key
+        self._contract_key_parts[contract_key] = (contract.symbol, strike_str, contract.right, expiry_yyyymmdd)
+        return contract_key
+    
+    def parse_contract_key(self, contract_key: str) -> tuple:
+        """(symbol, strike_str, right, expiry) for a contract key, without re-splitting known keys"""
+        parts = self._contract_key_parts.get(contract_key)
+        if parts is None:
+            parts = tuple(contract_key.split('_'))
+            self._contract_key_parts[contract_key] = parts
+        return parts
+    
+    def _build_option_proto(self, symbol: str, trading_class: str) -> Contract:
+        """Build the option Contract template (everything except strike/right) for the current expiry"""
+        proto = Contract()
+        proto.symbol = symbol
+        proto.secType = "OPT"
+        proto.currency = "USD"
+        proto.exchange = "SMART"
+        proto.tradingClass = trading_class
+        proto.lastTradeDateOrContractMonth = self.current_expiry
+        proto.multiplier = "100"
+        return proto
     
     def create_option_contract(self, strike: float, right: str, symbol: Optional[str] = None, 
                               trading_class: Optional[str] = None) -> Contract:
@@ -3462,16 +3966,17 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         if trading_class is None:
             trading_class = TRADING_CLASS
         
-        contract = Contract()
-        contract.symbol = symbol
-        contract.secType = "OPT"
-        contract.currency = "USD"
-        contract.exchange = "SMART"
-        contract.tradingClass = trading_class
+        # Static fields come from a per-(symbol, class, expiry) prototype;
+        # only strike and right differ between contracts in a chain
+        proto_key = (symbol, trading_class, self.current_expiry)
+        proto = self._option_protos.get(proto_key)
+        if proto is None:
+            proto = self._build_option_proto(symbol, trading_class)
+            self._option_protos = {proto_key: proto}  # Expiry changed: drop stale prototypes
+        
+        contract = copy.copy(proto)
         contract.strike = strike
         contract.right = right  # "C" or "P"
-        contract.lastTradeDateOrContractMonth = self.current_expiry
-        contract.multiplier = "100"
         
         # DIAGNOSTIC: Log contract creation to verify expiration
         if not hasattr(self, '_contract_creation_logged'):
@@ -3487,31 +3992,41 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         """
         self.log_message("Refreshing option chain...", "INFO")
         
+        # Drop queued requests that were never sent, then cancel the live ones
+        pending_ids = {req_id for req_id, _ in self.pending_subscriptions}
+        self.pending_subscriptions = []
+        
         # Cancel existing market data subscriptions
         for req_id in list(self.market_data_map.keys()):
-            self.cancelMktData(req_id)
+            if req_id not in pending_ids:
+                self.cancelMktData(req_id)
         
         # Clear data structures
         self.market_data.clear()
         self.market_data_map.clear()
+        self.market_data_by_req_id.clear()
         self.option_chain_data.clear()
         
+        # Drop the row mapping too, so the display loop never writes into rows
+        # that subscribe_market_data is about to replace
+        self.strike_to_row.clear()
+        self.strike_to_keys.clear()
+        self.chain_rows = []
+        self.dirty_rows = set()
+        
         # Request new chain
         self.request_option_chain()
         
         # Schedule next automatic refresh
         if self.root and self.chain_refresh_interval > 0:
-            self.root.after(self.chain_refresh_interval * 1000, self.refresh_option_chain)
+            self.schedule_after('chain_refresh', self.chain_refresh_interval * 1000, self.refresh_option_chain)
     
+    @requires_connection("create option chain")
     def request_option_chain(self):
         """
         Build option chain using manual strike calculation.
         Always uses manual method instead of requesting from IBKR API.
         """
-        if self.connection_state != ConnectionState.CONNECTED:
-            self.log_message("Cannot create option chain - not connected to IBKR", "WARNING")
-            return
-        
         self.log_message("Building option chain using manual strike calculation...", "INFO")
         
         # Always use manual option chain generation
@@ -3537,41 +4052,38 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         
         # Create strikes around current underlying price (every 5 points)
         center_strike = round(self.underlying_price / 5) * 5  # Round to nearest 5
-        strikes = []
         
         # Generate strikes: strikes_below below ATM, then ATM, then strikes_above above ATM
         # Start from (ATM - strikes_below*5) and go to (ATM + strikes_above*5)
         start_strike = center_strike - (self.strikes_below * 5)
         end_strike = center_strike + (self.strikes_above * 5)
-        
-        current_strike = start_strike
-        while current_strike <= end_strike:
-            strikes.append(current_strike)
-            current_strike += 5
+        strikes = np.arange(start_strike, end_strike + 5, 5, dtype=np.float64)
         
         self.log_message(
-            f"Created {len(strikes)} strikes from ${min(strikes):.2f} to ${max(strikes):.2f} "
+            f"Created {len(strikes)} strikes from ${strikes[0]:.2f} to ${strikes[-1]:.2f} "
             f"(center: ${center_strike:.2f}, {self.strikes_below} below, {self.strikes_above} above)",
             "INFO"
         )
         
         # Create contracts for all strikes
-        self.option_contracts = []
+        self.build_chain_contracts(strikes)
         
-        for strike in strikes:
-            call_contract = self.create_option_contract(strike, "C")
-            put_contract = self.create_option_contract(strike, "P")
-            
-            self.option_contracts.append(('C', strike, call_contract))
-            self.option_contracts.append(('P', strike, put_contract))
+        # Subscribe to market data
+        self.subscribe_market_data()
+    
+    def build_chain_contracts(self, strikes):
+        """
+        Build the chain arrays: sorted strikes plus the call/put contract at each index.
+        """
+        self.chain_strikes = np.unique(np.asarray(strikes, dtype=np.float64))  # Sorted, de-duplicated
+        self.call_contracts = [self.create_option_contract(strike, "C") for strike in self.chain_strikes.tolist()]
+        self.put_contracts = [self.create_option_contract(strike, "P") for strike in self.chain_strikes.tolist()]
         
         self.log_message(
-            f"Created {len(self.option_contracts)} option contracts ({len(strikes)} calls + {len(strikes)} puts)", 
+            f"Created {len(self.call_contracts) + len(self.put_contracts)} option contracts "
+            f"({len(self.call_contracts)} calls + {len(self.put_contracts)} puts)", 
             "SUCCESS"
         )
-        
-        # Subscribe to market data
-        self.subscribe_market_data()
     
     def process_option_chain(self):
         """
@@ -3599,20 +4111,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 )
                 
                 # Create contracts for all strikes (calls and puts)
-                self.option_contracts = []
-                
-                for strike in strikes:
-                    # Create call and put contracts for each strike
-                    call_contract = self.create_option_contract(strike, "C")
-                    put_contract = self.create_option_contract(strike, "P")
-                    
-                    self.option_contracts.append(('C', strike, call_contract))
-                    self.option_contracts.append(('P', strike, put_contract))
-                
-                self.log_message(
-                    f"Created {len(self.option_contracts)} option contracts ({len(strikes)} calls + {len(strikes)} puts)",
-                    "SUCCESS"
-                )
+                self.build_chain_contracts(strikes)
                 
                 # Subscribe to market data for all contracts
                 self.subscribe_market_data()
@@ -3629,119 +4128,137 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             return
             
         self.log_message(
-            f"Subscribing to real-time market data for {len(self.option_contracts)} contracts...", 
+            f"Subscribing to real-time market data for {len(self.call_contracts) + len(self.put_contracts)} contracts...", 
             "INFO"
         )
         
         # Clear existing data structures
         self.market_data.clear()
         self.market_data_map.clear()
+        self.market_data_by_req_id.clear()
         self.subscribed_contracts.clear()
         self.strike_to_row.clear()
+        self.strike_to_keys.clear()
+        self.chain_rows = []
         
-        # Clear sheet display
-        if hasattr(self, 'option_sheet'):
-            self.option_sheet.set_sheet_data([[]])
+        # Chain arrays are already sorted by strike
+        sorted_strikes = self.chain_strikes.tolist()
         
-        # Organize contracts by strike (calls and puts together)
-        strikes_dict = {}
+        # Prepare sheet data (2D list)
+        sheet_data = []
         
-        for right, strike, contract in self.option_contracts:
-            if strike not in strikes_dict:
-                strikes_dict[strike] = {'call': None, 'put': None, 'call_contract': None, 'put_contract': None}
-            
-            if right == 'C':
-                strikes_dict[strike]['call'] = right
-                strikes_dict[strike]['call_contract'] = contract
-            else:
-                strikes_dict[strike]['put'] = right
-                strikes_dict[strike]['put_contract'] = contract
+        # reqMktData calls are queued here and sent in batches after the rows exist
+        pending = []
         
-        # Sort strikes
-        sorted_strikes = sorted(strikes_dict.keys())
+        # Fresh column arrays, two slots per strike (call, put) in chain order
+        n_slots = 2 * len(sorted_strikes)
+        self.md_ask = np.zeros(n_slots, dtype=np.float32)
+        self.md_delta = np.zeros(n_slots, dtype=np.float32)
+        self.md_right = np.zeros(n_slots, dtype=np.uint8)
+        self.md_strike = np.zeros(n_slots, dtype=np.float32)
+        self._md_ask_pending = []  # Slots of the old chain don't apply to the new arrays
+        self._md_delta_pending = []
+        self.md_keys = []
+        self.md_index = {}
         
-        # Prepare sheet data (2D list)
-        sheet_data = []
+        # Request ids for the whole chain reserved up front: slot i uses base_req_id + i
+        base_req_id = self.next_req_id
+        self.next_req_id += n_slots
         
         # Subscribe and create display rows
         for row_idx, strike in enumerate(sorted_strikes):
-            strike_data = strikes_dict[strike]
+            strike_str = f"{strike:.2f}"  # Strikes never change after the chain is built
             
-            # Subscribe to call
-            if strike_data['call']:
-                req_id = self.next_req_id
-                self.next_req_id += 1
+            # Subscribe to call and put at this strike
+            for right, contract in (('C', self.call_contracts[row_idx]), ('P', self.put_contracts[row_idx])):
+                slot = len(self.md_keys)
+                req_id = base_req_id + slot
                 
-                contract_key = self.get_contract_key(strike_data['call_contract'])
+                contract_key = self.get_contract_key(contract)
                 self.market_data_map[req_id] = contract_key
+                self.strike_to_keys.setdefault(strike, {})[right] = contract_key
                 
-                self.market_data[contract_key] = {
-                    'contract': strike_data['call_contract'],
-                    'right': 'C',
-                    'strike': strike,
-                    'bid': 0, 'ask': 0, 'last': 0, 'prev_close': 0, 'volume': 0,
-                    'delta': 0, 'gamma': 0, 'theta': 0, 'vega': 0, 'iv': 0,
-                    'row_index': row_idx  # Store row index instead of tree_item
-                }
-                
-                self.subscribed_contracts.append(('C', strike, strike_data['call_contract']))
-                # Request market data with MODEL_OPTION_COMPUTATION (tick type 13)
-                # Empty string "" triggers automatic model-based greek calculations
-                # These greeks work without Last price by using bid/ask mid-point
-                self.reqMktData(req_id, strike_data['call_contract'], "", False, False, [])
-            
-            # Subscribe to put
-            if strike_data['put']:
-                req_id = self.next_req_id
-                self.next_req_id += 1
-                
-                contract_key = self.get_contract_key(strike_data['put_contract'])
-                self.market_data_map[req_id] = contract_key
+                self.md_keys.append(contract_key)
+                self.md_index[contract_key] = slot
+                self.md_right[slot] = 0 if right == 'C' else 1
+                self.md_strike[slot] = strike
                 
                 self.market_data[contract_key] = {
-                    'contract': strike_data['put_contract'],
-                    'right': 'P',
+                    'contract': contract,
+                    'right': right,
                     'strike': strike,
+                    'strike_str': strike_str,
                     'bid': 0, 'ask': 0, 'last': 0, 'prev_close': 0, 'volume': 0,
                     'delta': 0, 'gamma': 0, 'theta': 0, 'vega': 0, 'iv': 0,
-                    'row_index': row_idx  # Store row index instead of tree_item
+                    'row_index': row_idx,  # Sheet row - ticks flag it in dirty_rows
+                    'slot': slot  # Index into the md_* column arrays
                 }
+                self.market_data_by_req_id[req_id] = (contract_key, self.market_data[contract_key])
                 
-                self.subscribed_contracts.append(('P', strike, strike_data['put_contract']))
-                # Request market data with MODEL_OPTION_COMPUTATION (tick type 13)
-                # Empty string "" triggers automatic model-based greek calculations
-                # These greeks work without Last price by using bid/ask mid-point
-                self.reqMktData(req_id, strike_data['put_contract'], "", False, False, [])
+                self.subscribed_contracts.append((right, strike, contract))
+                pending.append((req_id, contract))
+            
+            # Row index -> both entries, so the redraw never goes through string keys
+            keys = self.strike_to_keys[strike]
+            self.chain_rows.append((strike, self.market_data[keys['C']], self.market_data[keys['P']]))
             
             # Create sheet row with call on left, strike in center, put on right
-            # Format: C_Bid, C_Ask, C_Last, C_CHANGE%, C_Vol, C_Gamma, C_Vega, C_Theta, C_Delta, C_IV, Strike, P_IV, P_Delta, P_Theta, P_Vega, P_Gamma, P_Vol, P_CHANGE%, P_Last, P_Ask, P_Bid
-            row_data = [
-                "0.00", "0.00", "0.00", "0.00%", "0", "0.00", "0.00", "0.00", "0.00", "0.00",  # Call data (10 columns)
-                f"{strike:.2f}",  # Strike (1 column)
-                "0.00", "0.00", "0.00", "0.00", "0.00", "0", "0.00%", "0.00", "0.00", "0.00"  # Put data (10 columns - added IV)
-            ]
+            # Format: C_IV, C_Delta, C_Theta, C_Vega, C_Gamma, C_Vol, C_CHANGE%, C_Last, C_Ask, C_Bid, Strike, P_Bid, P_Ask, P_Last, P_CHANGE%, P_Vol, P_Gamma, P_Vega, P_Theta, P_Delta, P_IV
+            row_data = [*BLANK_CALL_CELLS, strike_str, *BLANK_PUT_CELLS]
             
             sheet_data.append(row_data)
             
             # Map strike to row index
             self.strike_to_row[strike] = row_idx
         
-        # Populate sheet with data
-        if hasattr(self, 'option_sheet') and sheet_data:
-            self.option_sheet.set_sheet_data(sheet_data)
+        # First redraw paints every row
+        self.dirty_rows = set(range(len(sorted_strikes)))
+        
+        # Replace the whole sheet in one call (no intermediate clear/redraw) - only when
+        # the strike list changed; otherwise the rows stay put (and so does the scroll
+        # position) and the all-dirty first redraw overwrites their cells
+        if hasattr(self, 'option_sheet') and sorted_strikes != self.sheet_strikes:
+            self.option_sheet.set_sheet_data(sheet_data or [[]])
+            self.sheet_strikes = sorted_strikes
+        
+        # Send the market data requests in small batches so Tk stays responsive
+        self.pending_subscriptions = pending
+        self.schedule_after('subscribe_batch', 0, self._subscribe_batch, pending)
         
         self.log_message(
-            f"Successfully subscribed to {len(sorted_strikes) * 2} contracts ({len(sorted_strikes)} strikes)", 
-            "SUCCESS"
+            f"Queued {len(pending)} contracts ({len(sorted_strikes)} strikes) in batches of {self.subscribe_batch_size}", 
+            "INFO"
         )
         
         # Start periodic GUI update loop
-        self.root.after(500, self.update_option_chain_display)
+        self.schedule_after('chain_display', 500, self.update_option_chain_display)
         
         # Schedule automatic chain refresh based on settings
         refresh_ms = self.chain_refresh_interval * 1000  # Convert seconds to milliseconds
         self.log_message(f"Automatic chain refresh scheduled every {self.chain_refresh_interval} seconds", "INFO")
-        self.root.after(refresh_ms, self.refresh_option_chain)
+        self.schedule_after('chain_refresh', refresh_ms, self.refresh_option_chain)
+    
+    def _subscribe_batch(self, remaining):
+        """
+        Send the next batch of queued reqMktData calls, then yield to the Tk
+        event loop before the next one. Stops if a newer chain replaced the queue.
+        """
+        if remaining is not self.pending_subscriptions:
+            return  # Superseded by a refresh/resubscribe
+        
+        batch = remaining[:self.subscribe_batch_size]
+        del remaining[:self.subscribe_batch_size]
+        
+        for req_id, contract in batch:
+            # Request market data with MODEL_OPTION_COMPUTATION (tick type 13)
+            # Empty string "" triggers automatic model-based greek calculations
+            # These greeks work without Last price by using bid/ask mid-point
+            self.reqMktData(req_id, contract, "", False, False, [])
+        
+        if remaining:
+            self.schedule_after('subscribe_batch', 10, self._subscribe_batch, remaining)
+        else:
+            self.log_message(f"Successfully subscribed to {len(self.market_data_map)} contracts", "SUCCESS")
     
     def resubscribe_market_data(self):
         """
@@ -3757,8 +4274,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             "INFO"
         )
         
-        # Use the existing subscribe_market_data method with stored contracts
-        self.option_contracts = self.subscribed_contracts
+        # The chain arrays survive a disconnect, so just resubscribe them
         self.subscribe_market_data()
     
     def update_option_chain_display(self):
@@ -3770,23 +4286,25 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         if not self.root or not hasattr(self, 'option_sheet'):
             return
         
+        # Drain the scan-column ticks on the chain cadence too, so they never pile up
+        # while no strategy scan is running
+        self.flush_md_columns()
+        
+        # Minimized: skip the work and poll slowly. Ticks keep accumulating in
+        # dirty_rows, so the first visible pass repaints everything that moved.
+        if self.root.state() == 'iconic':
+            self.schedule_after('chain_display', 2000, self.update_option_chain_display)
+            return
+        
         try:
-            # Helper function to safely format values
-            def safe_format(value, format_str, default="—"):
-                """Safely format a value, returning default if None or invalid"""
-                if value is None:
-                    return default
-                try:
-                    if format_str == "int":
-                        return str(int(value)) if value != 0 else "0"
-                    elif format_str == ".2f":
-                        return f"{float(value):.2f}" if value != 0 else "0.00"
-                    elif format_str == ".4f":
-                        return f"{float(value):.4f}" if value != 0 else "0.0000"
-                    else:
-                        return str(value)
-                except (ValueError, TypeError):
-                    return default
+            # Helper function to get CHANGE % cell background
+            def get_change_bg(change_pct):
+                """Green background when up, red when down, black when flat"""
+                if change_pct > 0:
+                    return self.tws_colors['positive_bg']
+                elif change_pct < 0:
+                    return self.tws_colors['negative_bg']
+                return self.tws_colors['bg']
             
             # Helper function to get cell color based on value (for greeks/prices)
             def get_value_color(value):
@@ -3803,86 +4321,131 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                     pass
                 return None  # Default
             
+            # Strike-bucket thresholds - computed once per refresh, not per strike
+            spot = self.underlying_price
+            atm_tolerance = spot * 0.005  # ATM tolerance (within 0.5% of underlying price)
+            atm_lo = spot - atm_tolerance
+            atm_hi = spot + atm_tolerance
+            deep_call_below = spot * 0.98  # Calls deep ITM more than 2% below spot
+            deep_put_above = spot * 1.02   # Puts deep ITM more than 2% above spot
+            
             # Helper function to get ITM/OTM background color
             def get_row_bg_color(strike):
                 """Determine background color based on ITM/OTM status"""
-                if self.underlying_price <= 0:
+                if spot <= 0:
                     return self.tws_colors['bg']  # Default black
                 
-                # ATM tolerance (within 0.5% of underlying price)
-                atm_tolerance = self.underlying_price * 0.005
-                strike_distance = abs(strike - self.underlying_price)
-                
-                if strike_distance <= atm_tolerance:
+                if atm_lo <= strike <= atm_hi:
                     return self.tws_colors['strike_bg']  # ATM: slightly lighter
-                elif strike < self.underlying_price:
+                elif strike < spot:
                     # Calls ITM when strike < spot
-                    if (self.underlying_price - strike) > (self.underlying_price * 0.02):
+                    if strike < deep_call_below:
                         return self.tws_colors['call_itm_deep']  # Deep ITM
-                    else:
-                        return self.tws_colors['call_itm']  # ITM
+                    return self.tws_colors['call_itm']  # ITM
                 else:
                     # Puts ITM when strike > spot
-                    if (strike - self.underlying_price) > (self.underlying_price * 0.02):
+                    if strike > deep_put_above:
                         return self.tws_colors['put_itm_deep']  # Deep ITM
-                    else:
-                        return self.tws_colors['put_itm']  # ITM
+                    return self.tws_colors['put_itm']  # ITM
+            
+            # Time to expiry is the same for every strike in the chain
+            try:
+                expiry_date = datetime.strptime(self.current_expiry, "%Y%m%d")  # Format: YYYYMMDD
+                # Calculate time to expiry in years
+                time_to_expiry = (expiry_date - datetime.now()).total_seconds() / (365.25 * 24 * 3600)
+                time_to_expiry = max(0.0001, time_to_expiry)  # Minimum 1 hour to avoid division by zero
+            except:
+                time_to_expiry = 0.00274  # Default to 1 day if parsing fails
+            
+            # Strike column colours: above spot = current blue, below spot = darker blue
+            strike_bg_above = self.tws_colors['strike_bg']
+            strike_bg_below = '#1a2a3a'
             
             # Batch update cells for performance
             cell_updates = []  # (row, col, value)
             cell_formats = []  # (row, col, fg_color, bg_color)
-            
-            # Process each strike row
-            for strike, row_idx in self.strike_to_row.items():
-                # Get call and put data for this strike
-                # Contract keys now include expiration date: SPX_{strike}_{C/P}_{YYYYMMDD}
-                # Find matching contracts by strike and right
-                call_data = {}
-                put_data = {}
+            cell_fg = self.tws_colors['fg']
+            cell_bg = self.tws_colors['bg']
+            
+            def queue_side_cells(entry, row_idx, first_col, values, change_offset, change_bg):
+                """
+                Queue one side (call or put) of a row, diffed against what was last pushed.
+                First paint sends every cell with its colours; after that only cells whose
+                text changed, plus the CHANGE % cell when its colour flips.
+                """
+                last_values = entry.get('_last_values')
+                if last_values is None:
+                    for offset, val in enumerate(values):
+                        col_idx = first_col + offset
+                        cell_updates.append((row_idx, col_idx, val))
+                        cell_formats.append((row_idx, col_idx, cell_fg, change_bg if offset == change_offset else cell_bg))
+                else:
+                    for offset, val in enumerate(values):
+                        if val != last_values[offset]:
+                            cell_updates.append((row_idx, first_col + offset, val))
+                    if entry.get('_last_tags') != change_bg:
+                        cell_formats.append((row_idx, first_col + change_offset, cell_fg, change_bg))
+                
+                if entry:
+                    entry['_last_values'] = values
+                    entry['_last_tags'] = change_bg
+            
+            def side_inputs(data):
+                """Values one side's cells are formatted from, rounded to the displayed
+                precision - a greek moving past its 4th decimal does not reformat the side"""
+                get = data.get
+                return (round(get('iv', 0), 2), round(get('delta', 0), 4), round(get('theta', 0), 4),
+                        round(get('vega', 0), 4), round(get('gamma', 0), 4), get('volume', 0),
+                        get('last', 0), get('ask', 0), get('bid', 0), get('prev_close', 0))
+            
+            def change_of(data):
+                """CHANGE % vs previous close as (value, display text with sign)"""
+                last, prev_close = data.get('last', 0), data.get('prev_close', 0)
+                if last > 0 and prev_close > 0:
+                    change_pct = (last - prev_close) / prev_close * 100
+                    return change_pct, f"{change_pct:+.2f}%"
+                return 0.0, "0.00%"
+            
+            # Strike column colors flip when the underlying crosses a strike,
+            # so a move across any strike repaints the whole chain once
+            last_underlying = self.last_display_underlying
+            if self.underlying_price != last_underlying:
+                lo, hi = sorted((last_underlying, self.underlying_price))
+                if any(lo <= s <= hi for s in self.strike_to_row):
+                    self.dirty_rows.update(range(len(self.chain_rows)))
+                self.last_display_underlying = self.underlying_price
+            
+            # Swap out the dirty set so ticks arriving mid-redraw land in the next cycle.
+            # tksheet only draws the rows in view, so only those (plus a small margin)
+            # are formatted; off-screen rows stay dirty until they are scrolled into view
+            top, bottom = self.option_sheet.visible_rows
+            top, bottom = top - CHAIN_ROW_MARGIN, bottom + CHAIN_ROW_MARGIN
+            dirty_rows, self.dirty_rows = self.dirty_rows, set()
+            self.dirty_rows.update(r for r in dirty_rows if r is not None and not top <= r < bottom)
+            
+            # Hot-loop locals: skip the global/attribute lookups per strike and per cell
+            fmt = safe_format
+            chain_rows = self.chain_rows
+            n_rows = len(chain_rows)
+            
+            # Process only rows that ticked since the last redraw
+            for row_idx in dirty_rows:
+                if row_idx is None or row_idx >= n_rows:
+                    continue  # Position contract outside the displayed chain
+                if not top <= row_idx < bottom:
+                    continue  # Off screen - kept in self.dirty_rows
                 
-                # Search for matching contracts in market_data
-                strike_int = int(strike) if strike == int(strike) else strike
-                for key, data in self.market_data.items():
-                    if data.get('strike') == strike:
-                        if data.get('right') == 'C':
-                            call_data = data
-                        elif data.get('right') == 'P':
-                            put_data = data
+                strike, call_data, put_data = chain_rows[row_idx]
                 
                 # Determine row background based on ITM/OTM status
                 row_bg = get_row_bg_color(strike)
                 
-                # Calculate CHANGE % for call
-                call_change_pct = 0.0
-                call_change_str = "0.00%"
-                if call_data.get('last', 0) > 0 and call_data.get('prev_close', 0) > 0:
-                    call_change_pct = ((call_data['last'] - call_data['prev_close']) / call_data['prev_close']) * 100
-                    call_change_str = f"{call_change_pct:+.2f}%"  # Show sign (+/-)
-                
-                # Calculate CHANGE % for put
-                put_change_pct = 0.0
-                put_change_str = "0.00%"
-                if put_data.get('last', 0) > 0 and put_data.get('prev_close', 0) > 0:
-                    put_change_pct = ((put_data['last'] - put_data['prev_close']) / put_data['prev_close']) * 100
-                    put_change_str = f"{put_change_pct:+.2f}%"  # Show sign (+/-)
-                
                 # Self-compute greeks using Mid price if greeks are missing
-                # Calculate time to expiry
-                try:
-                    expiry_str = self.current_expiry  # Format: YYYYMMDD
-                    expiry_date = datetime.strptime(expiry_str, "%Y%m%d")
-                    now = datetime.now()
-                    # Calculate time to expiry in years
-                    time_to_expiry = (expiry_date - now).total_seconds() / (365.25 * 24 * 3600)
-                    time_to_expiry = max(0.0001, time_to_expiry)  # Minimum 1 hour to avoid division by zero
-                except:
-                    time_to_expiry = 0.00274  # Default to 1 day if parsing fails
-                
                 # Compute call greeks if missing and we have bid/ask
                 if call_data and (not call_data.get('delta') or call_data.get('delta') == 0):
                     call_bid = call_data.get('bid', 0)
                     call_ask = call_data.get('ask', 0)
-                    if call_bid > 0 and call_ask > 0 and self.underlying_price > 0:
+                    if call_bid > 0 and call_ask > 0 and spot > 0:
                         call_mid = (call_bid + call_ask) / 2.0
                         # Estimate IV from option price (simplified - use 20% if no better estimate)
                         estimated_iv = call_data.get('iv', 0.20)
@@ -3890,7 +4453,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                             estimated_iv = 0.20
                         
                         # Calculate greeks
-                        greeks = calculate_greeks('C', self.underlying_price, strike, time_to_expiry, estimated_iv)
+                        greeks = calculate_greeks('C', spot, strike, time_to_expiry, estimated_iv)
                         call_data['delta'] = greeks['delta']
                         call_data['gamma'] = greeks['gamma']
                         call_data['theta'] = greeks['theta']
@@ -3902,7 +4465,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 if put_data and (not put_data.get('delta') or put_data.get('delta') == 0):
                     put_bid = put_data.get('bid', 0)
                     put_ask = put_data.get('ask', 0)
-                    if put_bid > 0 and put_ask > 0 and self.underlying_price > 0:
+                    if put_bid > 0 and put_ask > 0 and spot > 0:
                         put_mid = (put_bid + put_ask) / 2.0
                         # Estimate IV from option price (simplified - use 20% if no better estimate)
                         estimated_iv = put_data.get('iv', 0.20)
@@ -3910,7 +4473,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                             estimated_iv = 0.20
                         
                         # Calculate greeks
-                        greeks = calculate_greeks('P', self.underlying_price, strike, time_to_expiry, estimated_iv)
+                        greeks = calculate_greeks('P', spot, strike, time_to_expiry, estimated_iv)
                         put_data['delta'] = greeks['delta']
                         put_data['gamma'] = greeks['gamma']
                         put_data['theta'] = greeks['theta']
@@ -3918,94 +4481,60 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                         if put_data.get('iv', 0) == 0:
                             put_data['iv'] = greeks['iv']
                 
-                # Build row values
+                # Format a side only if one of its inputs moved - a strike is dirty when
+                # either side ticked, and the other side's cells would come out the same
                 # Call columns (0-9): Imp Vol, Delta, Theta, Vega, Gamma, Volume, CHANGE%, Last, Ask, Bid (REVERSED)
-                call_values = [
-                    safe_format(call_data.get('iv'), ".2f"),
-                    safe_format(call_data.get('delta'), ".4f"),
-                    safe_format(call_data.get('theta'), ".4f"),
-                    safe_format(call_data.get('vega'), ".4f"),
-                    safe_format(call_data.get('gamma'), ".4f"),
-                    safe_format(call_data.get('volume'), "int"),
-                    call_change_str,  # CHANGE % at index 6
-                    safe_format(call_data.get('last'), ".2f"),
-                    safe_format(call_data.get('ask'), ".2f"),
-                    safe_format(call_data.get('bid'), ".2f")
-                ]
-                
-                # Strike column (10)
-                strike_value = f"{strike:.2f}"
-                
-                # Put columns (11-20): Bid, Ask, Last, CHANGE%, Volume, Gamma, Vega, Theta, Delta, IV (REVERSED)
-                put_values = [
-                    safe_format(put_data.get('bid'), ".2f"),
-                    safe_format(put_data.get('ask'), ".2f"),
-                    safe_format(put_data.get('last'), ".2f"),
-                    put_change_str,  # CHANGE % at index 3 (column 14)
-                    safe_format(put_data.get('volume'), "int"),
-                    safe_format(put_data.get('gamma'), ".4f"),
-                    safe_format(put_data.get('vega'), ".4f"),
-                    safe_format(put_data.get('theta'), ".4f"),
-                    safe_format(put_data.get('delta'), ".4f"),
-                    safe_format(put_data.get('iv'), ".2f")
-                ]
-                
-                # Update cells with values
-                # Call columns mapping: 0=iv, 1=delta, 2=theta, 3=vega, 4=gamma, 5=volume, 6=change%, 7=last, 8=ask, 9=bid
-                greek_keys_call = ['iv', 'delta', 'theta', 'vega', 'gamma', 'volume', 'change%', 'last', 'ask', 'bid']
-                
-                for col_idx, val in enumerate(call_values):
-                    cell_updates.append((row_idx, col_idx, val))
-                    
-                    # CHANGE % column gets green/red background with WHITE text
-                    if col_idx == 6:  # CHANGE % column (now at index 6)
-                        if call_change_pct > 0:
-                            cell_bg = self.tws_colors['positive_bg']  # Green background
-                            fg_color = self.tws_colors['fg']  # WHITE text
-                        elif call_change_pct < 0:
-                            cell_bg = self.tws_colors['negative_bg']  # Red background
-                            fg_color = self.tws_colors['fg']  # WHITE text
-                        else:
-                            cell_bg = self.tws_colors['bg']  # Black
-                            fg_color = self.tws_colors['fg']  # White
-                        cell_formats.append((row_idx, col_idx, fg_color, cell_bg))
-                    # All other cells: pure black background with WHITE text (no coloring for greeks)
-                    else:
-                        cell_formats.append((row_idx, col_idx, self.tws_colors['fg'], self.tws_colors['bg']))
+                call_raw = side_inputs(call_data)
+                if call_raw != call_data.get('_last_raw'):
+                    call_change_pct, call_change_str = change_of(call_data)
+                    call_values = (
+                        fmt(call_data.get('iv'), ".2f"),
+                        fmt(call_data.get('delta'), ".4f"),
+                        fmt(call_data.get('theta'), ".4f"),
+                        fmt(call_data.get('vega'), ".4f"),
+                        fmt(call_data.get('gamma'), ".4f"),
+                        fmt(call_data.get('volume'), "int"),
+                        call_change_str,  # CHANGE % at index 6
+                        fmt(call_data.get('last'), ".2f"),
+                        fmt(call_data.get('ask'), ".2f"),
+                        fmt(call_data.get('bid'), ".2f")
+                    )
+                    # CHANGE % column gets green/red background with WHITE text;
+                    # all other cells: pure black background with WHITE text (no coloring for greeks)
+                    # Call columns mapping: 0=iv, 1=delta, 2=theta, 3=vega, 4=gamma, 5=volume, 6=change%, 7=last, 8=ask, 9=bid
+                    queue_side_cells(call_data, row_idx, 0, call_values, 6, get_change_bg(call_change_pct))
+                    if call_data:
+                        call_data['_last_raw'] = call_raw
                 
                 # Strike column: Dynamic coloring based on ATM position
-                # Strikes above SPX = current blue (#2a4a6a)
-                # Strikes below SPX = darker blue (#1a2a3a)
-                if strike >= self.underlying_price:
-                    strike_bg = self.tws_colors['strike_bg']  # Above ATM: current blue
-                else:
-                    strike_bg = '#1a2a3a'  # Below ATM: darker blue
+                strike_bg = strike_bg_above if strike >= spot else strike_bg_below
                 
-                cell_updates.append((row_idx, 10, strike_value))
-                cell_formats.append((row_idx, 10, self.tws_colors['strike_fg'], strike_bg))
+                if call_data.get('_last_strike_bg') != strike_bg:
+                    cell_updates.append((row_idx, 10, call_data.get('strike_str') or f"{strike:.2f}"))
+                    cell_formats.append((row_idx, 10, self.tws_colors['strike_fg'], strike_bg))
+                    if call_data:
+                        call_data['_last_strike_bg'] = strike_bg
                 
-                # Put columns mapping: 0=bid, 1=ask, 2=last, 3=change%, 4=volume, 5=gamma, 6=vega, 7=theta, 8=delta, 9=iv
-                greek_keys_put = ['bid', 'ask', 'last', 'change%', 'volume', 'gamma', 'vega', 'theta', 'delta', 'iv']
-                
-                for col_offset, val in enumerate(put_values):
-                    col_idx = 11 + col_offset
-                    cell_updates.append((row_idx, col_idx, val))
-                    
-                    # CHANGE % column gets green/red background with WHITE text
-                    if col_offset == 3:  # CHANGE % column (now at index 3, column 14)
-                        if put_change_pct > 0:
-                            cell_bg = self.tws_colors['positive_bg']  # Green background
-                            fg_color = self.tws_colors['fg']  # WHITE text
-                        elif put_change_pct < 0:
-                            cell_bg = self.tws_colors['negative_bg']  # Red background
-                            fg_color = self.tws_colors['fg']  # WHITE text
-                        else:
-                            cell_bg = self.tws_colors['bg']  # Black
-                            fg_color = self.tws_colors['fg']  # White
-                        cell_formats.append((row_idx, col_idx, fg_color, cell_bg))
-                    # All other cells: pure black background with WHITE text (no coloring for greeks)
-                    else:
-                        cell_formats.append((row_idx, col_idx, self.tws_colors['fg'], self.tws_colors['bg']))
+                # Put columns (11-20): Bid, Ask, Last, CHANGE%, Volume, Gamma, Vega, Theta, Delta, IV (REVERSED)
+                put_raw = side_inputs(put_data)
+                if put_raw != put_data.get('_last_raw'):
+                    put_change_pct, put_change_str = change_of(put_data)
+                    put_values = (
+                        fmt(put_data.get('bid'), ".2f"),
+                        fmt(put_data.get('ask'), ".2f"),
+                        fmt(put_data.get('last'), ".2f"),
+                        put_change_str,  # CHANGE % at index 3 (column 14)
+                        fmt(put_data.get('volume'), "int"),
+                        fmt(put_data.get('gamma'), ".4f"),
+                        fmt(put_data.get('vega'), ".4f"),
+                        fmt(put_data.get('theta'), ".4f"),
+                        fmt(put_data.get('delta'), ".4f"),
+                        fmt(put_data.get('iv'), ".2f")
+                    )
+                    # Put columns mapping: 0=bid, 1=ask, 2=last, 3=change%, 4=volume, 5=gamma, 6=vega, 7=theta, 8=delta, 9=iv
+                    queue_side_cells(put_data, row_idx, 11, put_values, 3, get_change_bg(put_change_pct))
+                    if put_data:
+                        put_data['_last_raw'] = put_raw
             
             # Apply all cell updates in batch
             for row, col, value in cell_updates:
@@ -4024,18 +4553,19 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 except:
                     pass  # Skip if row/col out of range
             
-            # Redraw once after all updates
-            self.option_sheet.redraw()
+            # Redraw once after all updates (skip entirely on a quiet cycle)
+            if cell_updates or cell_formats:
+                self.option_sheet.redraw()
             
             # Schedule next update
-            self.root.after(500, self.update_option_chain_display)
+            self.schedule_after('chain_display', 500, self.update_option_chain_display)
             
         except Exception as e:
             self.log_message(f"Error updating option chain display: {e}", "ERROR")
             import traceback
             traceback.print_exc()
             # Continue updating even if there was an error
-            self.root.after(500, self.update_option_chain_display)
+            self.schedule_after('chain_display', 500, self.update_option_chain_display)
     
     # ========================================================================
     # TRADING LOGIC
@@ -4045,56 +4575,65 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         """
         Check if it's time to enter a new straddle based on configured frequency.
         Only executes during regular market hours (8:30 AM - 3:15 PM ET).
+        
+        Runs as a one-shot alarm: each call schedules itself for the moment the
+        next straddle is due instead of polling every second.
+        set_straddle_enabled() re-arms it when the strategy is toggled.
         """
         if not self.root:
             return
         
+        # Drop any alarm still pending so there is only ever one in flight
+        if self.straddle_alarm_id is not None:
+            self.root.after_cancel(self.straddle_alarm_id)
+            self.straddle_alarm_id = None
+        
         # Only check if straddle strategy is enabled
-        if self.straddle_enabled:
-            now = datetime.now()
-            
-            # Check if market is open
-            if not self.is_market_open():
-                # Market closed - update status
-                if hasattr(self, 'straddle_next_label'):
-                    self.straddle_next_label.config(
-                        text="Market Closed",
-                        foreground="#FF0000"
-                    )
-                # Schedule next check
-                self.root.after(1000, self.check_trade_time)
-                return
+        if not self.straddle_enabled:
+            return
+        
+        now = datetime.now()
+        
+        # Check if market is open
+        if not self.is_market_open():
+            # Market closed - update status and look again in a minute
+            if hasattr(self, 'straddle_next_label'):
+                self.straddle_next_label.config(
+                    text="Market Closed",
+                    foreground="#FF0000"
+                )
+            self.straddle_alarm_id = self.root.after(60_000, self.check_trade_time)
+            return
+        
+        # Market is open - check if it's time to trade
+        if self.last_straddle_time is None:
+            # Should not happen (timer set in set_straddle_enabled)
+            # But if it does, start timer now
+            self.last_straddle_time = now
+        else:
+            # Check if enough time has elapsed
+            elapsed_minutes = (now - self.last_straddle_time).total_seconds() / 60
             
-            # Market is open - check if it's time to trade
-            if self.last_straddle_time is None:
-                # Should not happen (timer set in set_straddle_enabled)
-                # But if it does, start timer now
+            if elapsed_minutes >= self.straddle_frequency_minutes:
+                self.log_message(
+                    f"Straddle timer triggered ({elapsed_minutes:.1f} min elapsed, "
+                    f"frequency: {self.straddle_frequency_minutes} min)", 
+                    "INFO"
+                )
+                self.enter_straddle()
                 self.last_straddle_time = now
-            else:
-                # Check if enough time has elapsed
-                elapsed_minutes = (now - self.last_straddle_time).total_seconds() / 60
-                
-                if elapsed_minutes >= self.straddle_frequency_minutes:
-                    self.log_message(
-                        f"Straddle timer triggered ({elapsed_minutes:.1f} min elapsed, "
-                        f"frequency: {self.straddle_frequency_minutes} min)", 
-                        "INFO"
-                    )
-                    self.enter_straddle()
-                    self.last_straddle_time = now
-                else:
-                    # Update countdown display
-                    remaining = self.straddle_frequency_minutes - elapsed_minutes
-                    next_time = now + timedelta(minutes=remaining)
-                    if hasattr(self, 'straddle_next_label'):
-                        self.straddle_next_label.config(
-                            text=f"Next: {next_time.strftime('%H:%M')}",
-                            foreground="#00BFFF"
-                        )
-        
-        # Schedule next check (every second for smooth countdown)
-        self.root.after(1000, self.check_trade_time)
+        
+        # Update next-entry display and sleep until it's due
+        next_time = self.last_straddle_time + timedelta(minutes=self.straddle_frequency_minutes)
+        if hasattr(self, 'straddle_next_label'):
+            self.straddle_next_label.config(
+                text=f"Next: {next_time.strftime('%H:%M')}",
+                foreground="#00BFFF"
+            )
+        delay_ms = max(1000, int((next_time - datetime.now()).total_seconds() * 1000))
+        self.straddle_alarm_id = self.root.after(delay_ms, self.check_trade_time)
     
+    @requires_connection("enter straddle")
     def enter_straddle(self):
         """
         Enter a long straddle using the same logic as Manual Buy Call/Put buttons.
@@ -4107,10 +4646,6 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             self.log_message("Straddle strategy is disabled - skipping entry", "INFO")
             return
         
-        if self.connection_state != ConnectionState.CONNECTED:
-            self.log_message("Cannot enter straddle: Not connected to IBKR", "WARNING")
-            return
-        
         if not self.data_server_ok:
             self.log_message("Cannot enter straddle: Data server not ready", "WARNING")
             return
@@ -4124,20 +4659,158 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         self.log_message("🔔 STRADDLE STRATEGY ENTRY TRIGGERED 🔔", "SUCCESS")
         self.log_message("=" * 60, "INFO")
         
-        # This emulates clicking BUY CALL and BUY PUT buttons
-        # Uses same Master Settings (target delta, position size mode, etc.)
+        # Same leg selection as the Manual Buy Call/Put buttons (Master Settings target delta)
+        try:
+            target_delta = float(self.target_delta_entry.get())
+            if target_delta <= 0 or target_delta > 100:
+                raise ValueError("Target delta must be between 0 and 100")
+        except ValueError as e:
+            self.log_message(f"Cannot enter straddle: invalid target delta: {e}", "ERROR")
+            return
         
-        self.log_message("Entering CALL leg...", "INFO")
-        self.manual_buy_call()
+        call, put = self.find_straddle_by_delta(target_delta)
+        if not call or not put:
+            self.log_message("Cannot enter straddle: no call/put near target delta", "WARNING")
+            return
         
-        # Small delay between legs to avoid overwhelming the system
-        if self.root:
-            self.root.after(500, lambda: self.log_message("Entering PUT leg...", "INFO"))
-            self.root.after(1000, self.manual_buy_put)
+        call_key, call_contract, call_ask, _ = call
+        put_key, put_contract, put_ask, _ = put
         
-        self.log_message("=" * 60, "INFO")
-        self.log_message("=" * 60, "INFO")
+        # Position sizing (same modes as manual trading, on the combined premium)
+        try:
+            if self.position_size_mode.get() == "fixed":
+                quantity = int(self.trade_qty_entry.get())
+            else:
+                quantity = max(1, int(float(self.max_risk_entry.get()) / (call_ask + put_ask)))
+        except ValueError:
+            self.log_message("Cannot enter straddle: invalid trade qty / max risk", "ERROR")
+            return
+        if quantity <= 0:
+            self.log_message("Cannot enter straddle: trade qty must be positive", "ERROR")
+            return
+        
+        # Net debit limit at the combined mid (fall back to ask when a mid is unavailable)
+        net_debit = round((self.calculate_mid_price(call_key) or call_ask) +
+                          (self.calculate_mid_price(put_key) or put_ask), 2)
+        
+        # Both legs go out as one BAG order once their conIds are known
+        self.resolve_con_ids(
+            [(call_key, call_contract), (put_key, put_contract)],
+            lambda: self.place_combo_straddle(call_key, put_key, quantity, net_debit)
+        )
+    
+    def resolve_con_ids(self, legs: list, on_done):
+        """
+        Make sure self.con_ids has an entry for every (contract_key, contract) in legs,
+        requesting contract details for the missing ones, then call on_done().
+        """
+        missing = [(key, contract) for key, contract in legs if key not in self.con_ids]
+        if not missing:
+            on_done()
+            return
+        
+        remaining = [len(missing)]
+        
+        def leg_resolved():
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                on_done()
+        
+        for key, contract in missing:
+            req_id = self.next_req_id
+            self.next_req_id += 1
+            self.contract_details_requests[req_id] = {'contract_key': key, 'on_done': leg_resolved}
+            self.reqContractDetails(req_id, contract)
     
+    @requires_connection("place straddle", level="ERROR")
+    def place_combo_straddle(self, call_key: str, put_key: str, quantity: int, net_debit: float) -> int | None:
+        """
+        Buy a call and a put as one BAG (combo) limit order for a net debit.
+        Both legs fill together or not at all - no leg risk between two orders.
+        
+        Returns:
+            order_id or None
+        """
+        if not self.data_server_ok:
+            self.log_message("✗ Cannot place straddle: Data server not ready", "ERROR")
+            return None
+        
+        if not self.con_ids.get(call_key) or not self.con_ids.get(put_key):
+            self.log_message(f"✗ Cannot place straddle: conId not resolved for {call_key} / {put_key}", "ERROR")
+            return None
+        
+        combo = Contract()
+        combo.symbol = TRADING_SYMBOL
+        combo.secType = "BAG"
+        combo.currency = "USD"
+        combo.exchange = "SMART"
+        combo.comboLegs = []
+        for key in (call_key, put_key):
+            leg = ComboLeg()
+            leg.conId = self.con_ids[key]
+            leg.ratio = 1
+            leg.action = "BUY"
+            leg.exchange = "SMART"
+            combo.comboLegs.append(leg)
+        
+        # Same clean LMT order setup as place_order()
+        order = Order()
+        order.action = "BUY"
+        order.totalQuantity = quantity
+        order.orderType = "LMT"
+        order.lmtPrice = net_debit
+        order.tif = "DAY"
+        order.transmit = True
+        order.eTradeOnly = False
+        order.firmQuoteOnly = False
+        order.auxPrice = UNSET_DOUBLE
+        order.minQty = UNSET_INTEGER
+        if self.account:
+            order.account = self.account
+        
+        order_id = self.next_order_id
+        self.next_order_id += 1
+        
+        self.log_message(f"=== PLACING STRADDLE COMBO #{order_id} ===", "INFO")
+        self.log_message(f"Legs: BUY {call_key} + BUY {put_key}", "INFO")
+        self.log_message(f"Order: BUY {quantity} LMT @ ${net_debit:.2f} net debit", "INFO")
+        
+        # Track like a manual order so update_manual_orders chases the combined mid
+        combo_key = f"STRADDLE {call_key} / {put_key}"
+        self.combo_orders[order_id] = {'legs': (call_key, put_key), 'quantity': quantity, 'net_debit': net_debit}
+        self.pending_orders[order_id] = (combo_key, "BUY", quantity)
+        self.manual_orders[order_id] = {
+            'contract_key': combo_key,
+            'contract': combo,
+            'action': "BUY",
+            'quantity': quantity,
+            'initial_mid': net_debit,
+            'last_mid': net_debit,
+            'attempts': 1,
+            'timestamp': datetime.now(),
+            'order': order,
+            'legs': (call_key, put_key)
+        }
+        
+        try:
+            self.placeOrder(order_id, combo, order)
+            self.log_message(f"✓ Straddle combo #{order_id} placed successfully", "SUCCESS")
+        except Exception as e:
+            self.log_message(f"✗ EXCEPTION during placeOrder(): {e}", "ERROR")
+            self.combo_orders.pop(order_id, None)
+            self.pending_orders.pop(order_id, None)
+            self.manual_orders.pop(order_id, None)
+            return None
+        
+        self.add_order_to_tree(order_id, combo, "BUY", quantity, net_debit, "Submitted",
+                               contract_key=combo_key)
+        
+        # Start monitoring (same chasing loop as manual orders)
+        if self.root:
+            self.root.after(self.manual_order_update_interval, self.update_manual_orders)
+        return order_id
+    
+    @requires_connection("place order", level="ERROR")
     def place_order(self, contract_key: str, contract: Contract, action: str, 
                    quantity: int, limit_price: float, 
                    enable_chasing: bool = False, stop_price: float | None = None) -> int | None:
@@ -4161,11 +4834,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             - Stop-Limit Order: stop_price=value (exit orders with stops)
             - Manual Order with Chasing: enable_chasing=True (manual trading mode)
         """
-        # CRITICAL: Check connection state AND data server readiness
-        if self.connection_state != ConnectionState.CONNECTED:
-            self.log_message("✗ Cannot place order: Not connected to IBKR", "ERROR")
-            return None
-        
+        # CRITICAL: Check data server readiness (connection state checked by decorator)
         if not self.data_server_ok:
             self.log_message("✗ Cannot place order: Data server not ready (waiting for 2104/2106 message)", "ERROR")
             return None
@@ -4322,14 +4991,12 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         if contract_key not in self.positions:
             # New position - fill_price is already per-option price
             data = self.market_data[contract_key]
-            self.positions[contract_key] = {
-                'contract': data['contract'],
-                'position': quantity if action == "BUY" else -quantity,
-                'avgCost': fill_price,  # Per-option price (not x100)
-                'currentPrice': fill_price,
-                'pnl': 0,
-                'entryTime': datetime.now()
-            }
+            self.positions[contract_key] = Position(
+                contract=data['contract'],
+                position=quantity if action == "BUY" else -quantity,
+                avgCost=fill_price,  # Per-option price (not x100)
+                currentPrice=fill_price
+            )
             
             # Subscribe to market data for real-time updates
             if contract_key not in self.market_data:
@@ -4351,16 +5018,19 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                     'contract': contract_obj,
                     'right': contract_obj.right,
                     'strike': contract_obj.strike,
+                    'row_index': None,  # Not a chain row
+                    'slot': None,  # No md_* scan column outside the chain
                     'bid': 0, 'ask': 0, 'last': 0, 'volume': 0,
                     'delta': 0, 'gamma': 0, 'theta': 0, 'vega': 0, 'iv': 0
                 }
+                self.market_data_by_req_id[req_id] = (contract_key, self.market_data[contract_key])
                 
                 self.reqMktData(req_id, contract_obj, "", False, False, [])
         else:
             # Update existing position
             pos = self.positions[contract_key]
-            old_qty = pos['position']
-            old_cost = pos['avgCost']
+            old_qty = pos.position
+            old_cost = pos.avgCost
             
             if action == "BUY":
                 new_qty = old_qty + quantity
@@ -4369,45 +5039,77 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 new_qty = old_qty - quantity
                 new_cost = old_cost  # Keep original cost basis
             
-            pos['position'] = new_qty
-            pos['avgCost'] = new_cost
+            pos.position = new_qty
+            pos.avgCost = new_cost
             
             # Remove position if closed
             if new_qty == 0:
                 del self.positions[contract_key]
         
+        self._positions_dirty = True
         self.update_positions_display()
     
+    def mark_pnl_dirty(self, contract_key: str, current_price: float | None = None):
+        """
+        Queue a P&L recompute for a held contract (called per tick from the API thread).
+        All ticks inside one PNL_FLUSH_MS window are folded into a single _flush_pnl pass.
+        """
+        self._pnl_dirty.append((contract_key, current_price))
+        if not self._pnl_flush_scheduled and self.root:
+            self._pnl_flush_scheduled = True
+            self.post_to_gui(self.schedule_after, 'pnl_flush', PNL_FLUSH_MS, self._flush_pnl)
+    
+    def _flush_pnl(self):
+        """Recompute P&L once for every position that ticked since the last flush"""
+        # Clear the flag before draining so a tick landing mid-drain schedules the next flush
+        self._pnl_flush_scheduled = False
+        dirty = {}
+        pending = self._pnl_dirty
+        for _ in range(len(pending)):
+            contract_key, price = pending.popleft()
+            dirty[contract_key] = price  # Latest tick per contract wins
+        positions = self.positions
+        self._refresh_pnl([(key, positions[key], price) for key, price in dirty.items() if key in positions])
+        if dirty:
+            self._positions_dirty = True
+    
     def update_position_pnl(self, contract_key: str, current_price: float | None = None):
         """
         Update position PnL with current mid-price
         If current_price not provided, calculate from bid/ask
         """
         if contract_key in self.positions:
-            pos = self.positions[contract_key]
-            
-            # Get current mid-price from market data
-            if current_price is None and contract_key in self.market_data:
-                data = self.market_data[contract_key]
-                bid = data.get('bid', 0)
-                ask = data.get('ask', 0)
-                if bid > 0 and ask > 0:
-                    current_price = (bid + ask) / 2
-                    # DEBUG: Log mid-price calculation
-                    # self.log_message(f"Mid price for {contract_key}: ${current_price:.2f} (bid: ${bid:.2f}, ask: ${ask:.2f})", "INFO")
-                else:
-                    current_price = data.get('last', pos['avgCost'])
-                    # DEBUG: Log fallback to last price
-                    # self.log_message(f"Using last price for {contract_key}: ${current_price:.2f} (no bid/ask)", "WARNING")
-            elif current_price is None:
-                # Market data not found - use last known price silently
-                # (Don't spam warnings for positions with different expirations than loaded chain)
-                current_price = pos.get('currentPrice', pos['avgCost'])
-            
-            if current_price:
-                pos['currentPrice'] = current_price
-                # P&L = (Current - Entry) × Quantity × Multiplier
-                pos['pnl'] = (current_price - pos['avgCost']) * pos['position'] * 100
+            self._refresh_pnl([(contract_key, self.positions[contract_key], current_price)])
+    
+    def _refresh_pnl(self, items):
+        """
+        Recompute currentPrice and P&L for [(contract_key, Position, trade price or None)]
+        over column arrays in one pass.
+        
+        Price used: the trade price if given, else the bid/ask mid, else the last trade
+        (avgCost before any trade); contracts outside the loaded chain keep their last price.
+        """
+        n = len(items)
+        if not n:
+            return
+        md_get = self.market_data.get
+        quotes = [md_get(key) for key, _, _ in items]
+        given = np.fromiter((np.nan if price is None else price for _, _, price in items), dtype=np.float64, count=n)
+        bid = np.fromiter((q.get('bid', 0) if q else 0 for q in quotes), dtype=np.float64, count=n)
+        ask = np.fromiter((q.get('ask', 0) if q else 0 for q in quotes), dtype=np.float64, count=n)
+        last = np.fromiter((q.get('last', pos.avgCost) if q else pos.currentPrice
+                            for q, (_, pos, _) in zip(quotes, items)), dtype=np.float64, count=n)
+        avg_cost = np.fromiter((pos.avgCost for _, pos, _ in items), dtype=np.float64, count=n)
+        qty = np.fromiter((pos.position for _, pos, _ in items), dtype=np.float64, count=n)
+        
+        mid = np.where((bid > 0) & (ask > 0), (bid + ask) / 2, last)
+        current = np.where(np.isnan(given), mid, given)
+        pnls = (current - avg_cost) * qty * 100  # P&L = (Current - Entry) × Quantity × Multiplier
+        
+        for (_, pos, _), price, pnl in zip(items, current.tolist(), pnls.tolist()):
+            if price:
+                pos.currentPrice = price
+                pos.pnl = pnl
     
     # ========================================================================
     # Z-SCORE STRATEGY (Gamma-Snap HFS v3.0)
@@ -4422,25 +5124,15 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         if len(self.underlying_1min_bars) < self.z_score_period:
             return
         
-        # Convert to DataFrame for easier calculation
-        bar_data = [{'time': b['time'], 'close': b['close']} for b in self.underlying_1min_bars]
-        df = pd.DataFrame(bar_data).set_index('time')
+        bars = self.underlying_1min_bars
+        closes = np.fromiter((b['close'] for b in bars), dtype=np.float64, count=len(bars))
         
-        # 1. Calculate 9-EMA (for Profit Target)
-        self.indicators['ema9'] = df['close'].ewm(span=9, adjust=False).mean().iloc[-1]
+        # 1. Calculate 9-EMA (for Profit Target) - recursive, so it needs the whole series
+        self.indicators['ema9'] = pd.Series(closes).ewm(span=9, adjust=False).mean().iloc[-1]
         
-        # 2. Calculate Z-Score
-        sma = df['close'].rolling(window=self.z_score_period).mean()
-        std = df['close'].rolling(window=self.z_score_period).std()
-        
-        last_sma = sma.iloc[-1]
-        last_std = std.iloc[-1]
-        last_close = df['close'].iloc[-1]
-        
-        if last_std > 0:
-            self.indicators['z_score'] = (last_close - last_sma) / last_std
-        else:
-            self.indicators['z_score'] = 0.0
+        # 2. Calculate Z-Score - only the newest window is needed
+        z_score = float(zscore_tail(closes, self.z_score_period, 1)[0])
+        self.indicators['z_score'] = z_score if np.isfinite(z_score) else 0.0  # Flat window
         
         # Update GUI display if method exists
         if hasattr(self, 'update_indicator_display'):
@@ -4486,18 +5178,10 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         if hasattr(self, 'strategy_status_var'):
             self.strategy_status_var.set("Status: SCANNING...")
         
-        # Get last two Z-Scores for crossover logic
-        bar_data = [{'time': b['time'], 'close': b['close']} for b in self.underlying_1min_bars]
-        df = pd.DataFrame(bar_data).set_index('time')
-        sma = df['close'].rolling(window=self.z_score_period).mean()
-        std = df['close'].rolling(window=self.z_score_period).std()
-        z_scores = (df['close'] - sma) / std
-        
-        if len(z_scores) < 2:
-            return
-        
-        last_z_score = z_scores.iloc[-1]
-        prev_z_score = z_scores.iloc[-2]
+        # Get last two Z-Scores for crossover logic (only their two windows are computed)
+        bars = self.underlying_1min_bars
+        closes = np.fromiter((b['close'] for b in bars), dtype=np.float64, count=len(bars))
+        prev_z_score, last_z_score = zscore_tail(closes, self.z_score_period, 2).tolist()
         
         # Long Entry: Z-Score crosses UP from below the threshold
         if (prev_z_score < -self.z_score_threshold and 
@@ -4776,22 +5460,19 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             
             self.log_message(f"Scanning for {option_type} option with ask ≤ ${max_price:.2f}...", "INFO")
             
-            for contract_key, data in self.market_data.items():
-                # Safely check if this is the right option type
-                if data.get('right') != option_type:
-                    continue
-                
-                ask = data.get('ask', 0)
-                
-                # Must have valid ask price
-                if ask <= 0 or ask > max_price:
-                    continue
-                
-                # Find the option closest to max price (maximum value without exceeding)
-                if ask > best_price:
-                    best_price = ask
+            self.flush_md_columns()
+            
+            # Highest ask that fits under the cap, scanned over the column arrays
+            ask = self.md_ask
+            side = 0 if option_type == 'C' else 1
+            mask = (ask > 0) & (ask <= np.float32(max_price)) & (self.md_right == side)  # Same rounding on both sides
+            if mask.any():
+                idx = int(np.flatnonzero(mask)[ask[mask].argmax()])  # argmax keeps the first of equal asks
+                best_contract_key = self.md_keys[idx]
+                data = self.market_data.get(best_contract_key)
+                if data is not None:
+                    best_price = data['ask']  # Exact quote, not the float32 scan column
                     best_option = data.get('contract')
-                    best_contract_key = contract_key
             
             if best_option and best_contract_key:
                 self.log_message(
@@ -4812,6 +5493,60 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             self.log_message(f"Traceback: {traceback.format_exc()}", "ERROR")
             return None
     
+    def flush_md_columns(self):
+        """Scatter the ask/delta ticks queued by the API thread into md_ask / md_delta.
+        
+        One fancy-index assignment per column instead of a NumPy __setitem__ per tick;
+        later ticks for a slot come later in the batch, so the newest value wins.
+        Only the first n items are taken and deleted, so ticks appended meanwhile stay queued.
+        """
+        for column, pending in ((self.md_ask, self._md_ask_pending),
+                                (self.md_delta, self._md_delta_pending)):
+            n = len(pending)
+            if n:
+                slots, values = zip(*pending[:n])
+                del pending[:n]
+                column[list(slots)] = values
+    
+    def find_straddle_by_delta(self, target_delta: float):
+        """
+        find_option_by_delta for both sides in one reduction: slots are laid out as
+        (call, put) per strike, so the distance array reshapes to [strike, side] and a
+        single argmin over axis 0 picks the call and the put together.
+        
+        Returns:
+            (call, put) - each (contract_key, contract, ask_price, actual_delta) or None
+        """
+        target_delta_decimal = abs(target_delta / 100.0)
+        self.flush_md_columns()
+        valid = (self.md_delta != 0) & (self.md_ask > 0)
+        if not valid.any():
+            self.log_message(f"✗ No options found with valid delta near {target_delta}", "WARNING")
+            return None, None
+        
+        distance = np.where(valid, np.abs(np.abs(self.md_delta) - target_delta_decimal), np.inf)
+        by_side = distance.reshape(-1, 2)
+        rows = by_side.argmin(axis=0)  # argmin keeps the first of equal distances
+        
+        picks = []
+        for side, option_type in enumerate(("C", "P")):
+            row = int(rows[side])
+            if not np.isfinite(by_side[row, side]):
+                self.log_message(f"✗ No {option_type} options found with valid delta near {target_delta}", "WARNING")
+                picks.append(None)
+                continue
+            idx = 2 * row + side
+            contract_key = self.md_keys[idx]
+            price = self.market_data[contract_key]['ask']  # Exact quote, not the float32 scan column
+            delta = abs(float(self.md_delta[idx])) * 100  # Convert back to 0-100 scale
+            self.log_message(
+                f"✓ Found {option_type} option: {contract_key} @ ${price:.2f} "
+                f"(Delta: {delta:.1f}, Target: {target_delta:.1f})",
+                "SUCCESS"
+            )
+            picks.append((contract_key, self.market_data[contract_key]['contract'], price, delta))
+        return picks[0], picks[1]
+    
     def find_option_by_delta(self, option_type: str, target_delta: float):
         """
         Find option contract closest to target delta
@@ -4831,37 +5566,24 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             # Convert target delta to decimal (30 -> 0.30)
             target_delta_decimal = abs(target_delta / 100.0)
             
-            best_delta_diff = float('inf')
+            # This side's quoted contracts (must have greeks and a valid ask), scanned
+            # over the column arrays rather than the per-contract dicts
+            side = 0 if option_type == 'C' else 1
+            self.flush_md_columns()
+            mask = (self.md_right == side) & (self.md_delta != 0) & (self.md_ask > 0)
+            
             best_option = None
             best_contract_key = None
-            best_price = 0
-            best_delta = 0
-            
-            # Scan all options in market_data
-            for contract_key, data in self.market_data.items():
-                # Skip if wrong option type
-                if option_type not in contract_key:
-                    continue
-                
-                # Must have valid greeks
-                delta = data.get('delta')
-                if delta is None or delta == 0:
-                    continue
-                
-                # For puts, delta is negative - use absolute value
-                abs_delta = abs(delta)
-                
-                # Find closest to target delta
-                delta_diff = abs(abs_delta - target_delta_decimal)
-                
-                if delta_diff < best_delta_diff:
-                    ask = data.get('ask', 0)
-                    if ask > 0:  # Must have valid ask price
-                        best_delta_diff = delta_diff
-                        best_option = data.get('contract')
-                        best_contract_key = contract_key
-                        best_price = ask
-                        best_delta = abs_delta * 100  # Convert back to 0-100 scale
+            if mask.any():
+                slots = np.flatnonzero(mask)
+                distance = np.abs(np.abs(self.md_delta[slots]) - target_delta_decimal)
+                idx = int(slots[distance.argmin()])  # argmin keeps the first of equal distances
+                best_contract_key = self.md_keys[idx]
+                best_data = self.market_data.get(best_contract_key)
+                if best_data is not None:
+                    best_option = best_data.get('contract')
+                    best_price = best_data['ask']  # Exact quote, not the float32 scan column
+                    best_delta = abs(float(self.md_delta[idx])) * 100  # Convert back to 0-100 scale
             
             if best_option and best_contract_key:
                 self.log_message(
@@ -5128,8 +5850,13 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 orders_to_remove.append(order_id)
                 continue
             
-            contract_key = order_info['contract_key']
-            current_mid = self.calculate_mid_price(contract_key)
+            legs = order_info.get('legs')
+            if legs:
+                # Combo: chase the sum of the leg mids, and only when every leg has a quote
+                leg_mids = [self.calculate_mid_price(key) for key in legs]
+                current_mid = round(sum(leg_mids), 2) if all(leg_mids) else 0
+            else:
+                current_mid = self.calculate_mid_price(order_info['contract_key'])
             
             if current_mid == 0:
                 continue  # No valid market data
@@ -5260,7 +5987,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             pos = self.positions[matching_key]
             
             # PROTECTION: Check if position is zero (nothing to close)
-            if pos['position'] == 0:
+            if pos.position == 0:
                 self.log_message(f"⚠️ WARNING: Position for {matching_key} is zero - nothing to close!", "WARNING")
                 messagebox.showwarning(
                     "Invalid Position",
@@ -5276,13 +6003,13 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             for order_id, order_info in self.manual_orders.items():
                 if order_info['contract_key'] == matching_key:
                     # Check if this is an exit order (opposite direction of position)
-                    is_exit_order = (pos['position'] > 0 and order_info['action'] == "SELL") or \
-                                   (pos['position'] < 0 and order_info['action'] == "BUY")
+                    is_exit_order = (pos.position > 0 and order_info['action'] == "SELL") or \
+                                   (pos.position < 0 and order_info['action'] == "BUY")
                     if is_exit_order:
                         pending_exit_orders.append(order_id)
             
             if pending_exit_orders:
-                action_type = "SELL" if pos['position'] > 0 else "BUY"
+                action_type = "SELL" if pos.position > 0 else "BUY"
                 self.log_message(f"⚠️ WARNING: Already have {len(pending_exit_orders)} pending {action_type} order(s) for {matching_key}!", "WARNING")
                 messagebox.showwarning(
                     "Pending Exit Order",
@@ -5296,8 +6023,8 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             confirm = messagebox.askyesno(
                 "Close Position",
                 f"Close position: {contract_display}\n"
-                f"Quantity: {pos['position']}\n"
-                f"Current P&L: ${pos['pnl']:.2f}\n\n"
+                f"Quantity: {pos.position}\n"
+                f"Current P&L: ${pos.pnl:.2f}\n\n"
                 f"Place exit order at mid-price?"
             )
             
@@ -5311,13 +6038,13 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             mid_price = self.calculate_mid_price(matching_key)
             if mid_price == 0:
                 # Fallback to last price
-                mid_price = pos['currentPrice']
+                mid_price = pos.currentPrice
                 self.log_message(f"Using last price ${mid_price:.2f} for exit", "WARNING")
             
             # CRITICAL FIX: Determine action based on position direction
             # If LONG (positive) → SELL to close
             # If SHORT (negative) → BUY to close (should never happen for options!)
-            position_qty = pos['position']
+            position_qty = pos.position
             quantity = int(abs(position_qty))  # Ensure integer quantity
             
             if position_qty > 0:
@@ -5330,7 +6057,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 return
             
             # Ensure contract has all required fields for order placement
-            exit_contract = pos['contract']
+            exit_contract = pos.contract
             if not exit_contract.exchange:
                 exit_contract.exchange = "SMART"
             if not exit_contract.tradingClass:
@@ -5406,6 +6133,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             # Remove from pending orders
             if order_id in self.pending_orders:
                 del self.pending_orders[order_id]
+            self.combo_orders.pop(order_id, None)
             
             # Remove from display
             self.update_order_in_tree(order_id, "Cancelled")
@@ -5432,51 +6160,19 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         if len(bars) < self.atr_period:
             return
         
-        # Convert to DataFrame
-        df = pd.DataFrame(bars)
-        df['high'] = df['high'].astype(float)
-        df['low'] = df['low'].astype(float)
-        df['close'] = df['close'].astype(float)
-        
-        # Calculate ATR
-        df['tr'] = df.apply(lambda row: max(
-            row['high'] - row['low'],
-            abs(row['high'] - df['close'].shift(1).iloc[row.name]) if row.name > 0 else 0,
-            abs(row['low'] - df['close'].shift(1).iloc[row.name]) if row.name > 0 else 0
-        ), axis=1)
-        
-        df['atr'] = df['tr'].rolling(window=self.atr_period).mean()
-        
-        # Calculate Supertrend
-        df['basic_upper'] = (df['high'] + df['low']) / 2 + (self.chandelier_multiplier * df['atr'])
-        df['basic_lower'] = (df['high'] + df['low']) / 2 - (self.chandelier_multiplier * df['atr'])
-        
-        df['supertrend_upper'] = df['basic_upper']
-        df['supertrend_lower'] = df['basic_lower']
-        df['supertrend'] = 0
-        
-        for i in range(1, len(df)):
-            # Upper band
-            if df['close'].iloc[i-1] <= df['supertrend_upper'].iloc[i-1]:
-                df.loc[df.index[i], 'supertrend_upper'] = min(df['basic_upper'].iloc[i], 
-                                                              df['supertrend_upper'].iloc[i-1])
-            else:
-                df.loc[df.index[i], 'supertrend_upper'] = df['basic_upper'].iloc[i]
-            
-            # Lower band
-            if df['close'].iloc[i-1] >= df['supertrend_lower'].iloc[i-1]:
-                df.loc[df.index[i], 'supertrend_lower'] = max(df['basic_lower'].iloc[i], 
-                                                              df['supertrend_lower'].iloc[i-1])
-            else:
-                df.loc[df.index[i], 'supertrend_lower'] = df['basic_lower'].iloc[i]
-            
-            # Supertrend direction
-            if df['close'].iloc[i] <= df['supertrend_upper'].iloc[i]:
-                df.loc[df.index[i], 'supertrend'] = df['supertrend_upper'].iloc[i]
-            else:
-                df.loc[df.index[i], 'supertrend'] = df['supertrend_lower'].iloc[i]
-        
-        self.supertrend_data[contract_key] = df
+        # Kernels work on contiguous float64 arrays (AOT signature is f8[:]); upcast the
+        # float32 bar columns once here - ATR's running sum would drift in float32.
+        # One [3, n] allocation and cast; its rows are contiguous views
+        n = len(bars)
+        high, low, close = np.array((bars.high[:n], bars.low[:n], bars.close[:n]), dtype=np.float64)
+
+        # Calculate ATR and Supertrend (see indicator_kernels.py)
+        atr_values = atr_kernel(high, low, close, int(self.atr_period))
+        basic_upper, basic_lower = basic_bands(high, low, atr_values, float(self.chandelier_multiplier))
+        upper, lower, trend = np.empty(n), np.empty(n), np.empty(n)
+        values = supertrend_kernel(close, basic_upper, basic_lower, upper, lower, trend)
+        state = SupertrendState(bars.date[:n].copy(), high, low, close, atr_values, values)
+        self.supertrend_data[contract_key] = state
         
         # Check for exit signal
         self.check_exit_signal(contract_key)
@@ -5484,28 +6180,96 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         # Update chart
         self.update_chart(contract_key)
     
+    def _warm_supertrend_batch(self):
+        """Build and JIT-compile the batch kernel on a worker thread, then publish it"""
+        try:
+            kernel = batch_kernel()
+            # numba compiles on the first call - run one tiny row so the GUI thread never pays for it
+            row = np.ones((1, 2))
+            kernel(row, row, row, np.array([2], dtype=np.int64),
+                   np.empty((1, 2)), np.empty((1, 2)), np.empty((1, 2)), np.empty((1, 2)))
+            self._supertrend_batch = kernel
+        except Exception as e:
+            self.log_message(f"Supertrend batch kernel unavailable, using per-row kernel: {e}", "WARNING")
+    
+    def calculate_supertrend_bulk(self, contract_keys: List[str]):
+        """
+        Recalculate supertrend state for many contracts in one batch kernel call
+        (rows run in parallel under numba), e.g. after a reconnect.
+        
+        Only refreshes supertrend_data - exit signals are not checked here, since the
+        bars may predate the reconnect and fresh history/positions are still in flight.
+        """
+        period = int(self.atr_period)
+        multiplier = float(self.chandelier_multiplier)
+        keys = [k for k in contract_keys if len(self.historical_data.get(k, ())) >= period]
+        if not keys:
+            return
+        
+        lengths = np.array([len(self.historical_data[k]) for k in keys], dtype=np.int64)
+        shape = (len(keys), int(lengths.max()))
+        high = np.zeros(shape)
+        low = np.zeros(shape)
+        close = np.zeros(shape)
+        for row, key in enumerate(keys):
+            bars = self.historical_data[key]
+            n = int(lengths[row])
+            high[row, :n] = bars.high[:n]
+            low[row, :n] = bars.low[:n]
+            close[row, :n] = bars.close[:n]
+        
+        # ATR and bands for every contract in one 2-D pass (rows are zero-padded at
+        # the end, which never reaches back into a row's real bars)
+        atr_values = atr_vectorized(high, low, close, period)
+        basic_upper, basic_lower = basic_bands(high, low, atr_values, multiplier)
+        
+        states = []
+        for row, key in enumerate(keys):
+            n = int(lengths[row])
+            states.append(SupertrendState(self.historical_data[key].date[:n].copy(), high[row, :n].copy(),
+                                          low[row, :n].copy(), close[row, :n].copy(),
+                                          atr_values[row, :n].copy(), None))
+        
+        upper, lower, trend, out = np.empty(shape), np.empty(shape), np.empty(shape), np.empty(shape)
+        batch = self._supertrend_batch
+        if batch is not None:
+            batch(close, basic_upper, basic_lower, lengths, upper, lower, trend, out)
+        else:
+            # Batch kernel still compiling in the background - run the rows serially
+            for row in range(len(keys)):
+                n = int(lengths[row])
+                out[row, :n] = supertrend_kernel(close[row, :n], basic_upper[row, :n], basic_lower[row, :n],
+                                                 upper[row, :n], lower[row, :n], trend[row, :n])
+        
+        for row, (key, state) in enumerate(zip(keys, states)):
+            n = int(lengths[row])
+            state.supertrend = out[row, :n].copy()
+            self.supertrend_data[key] = state
+        
+        self.log_message(f"Supertrend recalculated for {len(keys)} contract(s)", "INFO")
+    
     def check_exit_signal(self, contract_key: str):
         """Check if supertrend signals an exit"""
         if contract_key not in self.positions or contract_key not in self.supertrend_data:
             return
         
-        df = self.supertrend_data[contract_key]
+        state = self.supertrend_data[contract_key]
         
-        if len(df) < 2:
+        if len(state) < 2:
             return
         
-        current_price = df['close'].iloc[-1]
-        supertrend = df['supertrend'].iloc[-1]
+        current_price = state.close[-1]
+        supertrend = state.supertrend[-1]
         
         # Exit if price crosses below supertrend
         if current_price < supertrend:
             pos = self.positions[contract_key]
-            if pos['position'] > 0:  # Long position
+            if pos.position > 0:  # Long position
                 self.log_message(f"Supertrend exit signal for {contract_key}", "WARNING")
                 
                 # Place market order to exit
-                contract = pos['contract']
-                quantity = pos['position']
+                contract = pos.contract
+                quantity = pos.position
                 
                 # Use current bid as limit price
                 current_bid = self.market_data[contract_key]['bid']
@@ -5545,13 +6309,12 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 self.log_message("Could not identify clicked cell", "WARNING")
                 return
             
-            # Get strike from the selected row
-            # Find strike by row index from strike_to_row mapping
+            # Get strike from the selected row (rows are laid out in chain_strikes order)
             strike = None
-            for s, r_idx in self.strike_to_row.items():
-                if r_idx == row_idx:
-                    strike = s
-                    break
+            if 0 <= row_idx < len(self.chain_strikes):
+                candidate = float(self.chain_strikes[row_idx])
+                if self.strike_to_row.get(candidate) == row_idx:
+                    strike = candidate
             
             if strike is None:
                 self.log_message(f"Could not determine strike for row {row_idx}", "WARNING")
@@ -5560,44 +6323,43 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             self.log_message(f"Clicked: row={row_idx}, column={col_idx}, strike={strike}", "INFO")
             
             # Determine if user clicked on call or put side
-            # Columns 0-8 are calls, 9 is strike, 10-17 are puts
-            if col_idx < 9:
-                # Clicked on call side - find contract by strike and right using get_contract_key
-                contract_key = None
-                for key, data in self.market_data.items():
-                    if data.get('strike') == float(strike) and data.get('right') == 'C':
-                        contract_key = key
-                        break
+            # Columns 0-9 are calls, 10 is strike, 11-20 are puts
+            strike_col = len(BLANK_CALL_CELLS)
+            if col_idx < strike_col:
+                # Clicked on call side - direct lookup instead of scanning market_data
+                contract_key = self.strike_to_keys.get(strike, {}).get('C')
                 
                 self.log_message(f"Looking for call contract at strike {strike}, found: {contract_key}", "INFO")
                 
                 if contract_key and contract_key in self.market_data:
                     # Create fresh contract with current expiration for chart data
                     self.selected_call_contract = self.create_option_contract(float(strike), "C")
+                    self.subscribe_tick_stream(self.selected_call_contract,
+                                               self.get_contract_key(self.selected_call_contract), 'call')
                     self.log_message(f"✓ Selected CALL: Strike {strike} (Expiry: {self.current_expiry}) - Requesting chart data...", "SUCCESS")
                     self.update_call_chart()
                 else:
                     self.log_message(f"Call contract at strike {strike} not found in market_data", "WARNING")
-                    self.log_message(f"Available contracts: {list(self.market_data.keys())[:5]}...", "DEBUG")
+                    if self.log_level_num <= LOG_LEVELS["DEBUG"]:
+                        self.log_message(f"Available contracts: {list(self.market_data.keys())[:5]}...", "DEBUG")
                     
-            elif col_idx > 9:
-                # Clicked on put side - find contract by strike and right using get_contract_key
-                contract_key = None
-                for key, data in self.market_data.items():
-                    if data.get('strike') == float(strike) and data.get('right') == 'P':
-                        contract_key = key
-                        break
+            elif col_idx > strike_col:
+                # Clicked on put side - direct lookup instead of scanning market_data
+                contract_key = self.strike_to_keys.get(strike, {}).get('P')
                 
                 self.log_message(f"Looking for put contract at strike {strike}, found: {contract_key}", "INFO")
                 
                 if contract_key and contract_key in self.market_data:
                     # Create fresh contract with current expiration for chart data
                     self.selected_put_contract = self.create_option_contract(float(strike), "P")
+                    self.subscribe_tick_stream(self.selected_put_contract,
+                                               self.get_contract_key(self.selected_put_contract), 'put')
                     self.log_message(f"✓ Selected PUT: Strike {strike} (Expiry: {self.current_expiry}) - Requesting chart data...", "SUCCESS")
                     self.update_put_chart()
                 else:
                     self.log_message(f"Put contract at strike {strike} not found in market_data", "WARNING")
-                    self.log_message(f"Available contracts: {list(self.market_data.keys())[:5]}...", "DEBUG")
+                    if self.log_level_num <= LOG_LEVELS["DEBUG"]:
+                        self.log_message(f"Available contracts: {list(self.market_data.keys())[:5]}...", "DEBUG")
             else:
                 self.log_message("Clicked on strike column - please click on call or put columns", "INFO")
                     
@@ -5612,11 +6374,10 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         self.on_option_sheet_click(event)
     
     def show_call_loading(self):
-        """Show loading spinner on call chart with animated rotation"""
+        """Show the (static) loading indicator on the call chart"""
         if self.root:
             # Place the loading frame over the chart
             self.call_loading_frame.place(relx=0.5, rely=0.5, anchor=CENTER, relwidth=0.5, relheight=0.3)
-            self.animate_call_spinner()
             
             # Set 30-second timeout
             if self.call_loading_timeout_id:
@@ -5631,30 +6392,16 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 self.root.after_cancel(self.call_loading_timeout_id)
                 self.call_loading_timeout_id = None
     
-    def animate_call_spinner(self):
-        """Animate the call chart loading spinner"""
-        if self.call_loading_frame.winfo_ismapped():
-            current_text = self.call_loading_label.cget("text")
-            # Rotate through different spinner states
-            if "⟳" in current_text:
-                new_text = current_text.replace("⟳", "⟲")
-            else:
-                new_text = current_text.replace("⟲", "⟳")
-            self.call_loading_label.config(text=new_text)
-            if self.root:
-                self.root.after(500, self.animate_call_spinner)
-    
     def call_loading_timeout(self):
         """Handle call chart loading timeout"""
         self.hide_call_loading()
         self.log_message("Call chart failed to load data within 30 seconds", "WARNING")
     
     def show_put_loading(self):
-        """Show loading spinner on put chart with animated rotation"""
+        """Show the (static) loading indicator on the put chart"""
         if self.root:
             # Place the loading frame over the chart
             self.put_loading_frame.place(relx=0.5, rely=0.5, anchor=CENTER, relwidth=0.5, relheight=0.3)
-            self.animate_put_spinner()
             
             # Set 30-second timeout
             if self.put_loading_timeout_id:
@@ -5669,19 +6416,6 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 self.root.after_cancel(self.put_loading_timeout_id)
                 self.put_loading_timeout_id = None
     
-    def animate_put_spinner(self):
-        """Animate the put chart loading spinner"""
-        if self.put_loading_frame.winfo_ismapped():
-            current_text = self.put_loading_label.cget("text")
-            # Rotate through different spinner states
-            if "⟳" in current_text:
-                new_text = current_text.replace("⟳", "⟲")
-            else:
-                new_text = current_text.replace("⟲", "⟳")
-            self.put_loading_label.config(text=new_text)
-            if self.root:
-                self.root.after(500, self.animate_put_spinner)
-    
     def put_loading_timeout(self):
         """Handle put chart loading timeout"""
         self.hide_put_loading()
@@ -5694,6 +6428,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             # Clear historical data to force re-request with new settings
             if contract_key in self.historical_data:
                 del self.historical_data[contract_key]
+            self.tick_buckets.pop(contract_key, None)  # Restart bucketing on the new bars
         self.update_call_chart()
         # Auto-save chart settings
         self.save_settings()
@@ -5705,6 +6440,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             # Clear historical data to force re-request with new settings
             if contract_key in self.historical_data:
                 del self.historical_data[contract_key]
+            self.tick_buckets.pop(contract_key, None)  # Restart bucketing on the new bars
         self.update_put_chart()
         # Auto-save chart settings
         self.save_settings()
@@ -5787,12 +6523,102 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         self.hide_put_loading()  # Hide loading spinner when data is available
         self.draw_candlestick_chart(self.put_ax, self.put_canvas, contract_key, "Put")
     
-    def request_historical_data(self, contract, contract_key, option_type):
-        """Request historical bar data for charting"""
-        if self.connection_state != ConnectionState.CONNECTED:
-            self.log_message("Cannot request historical data - not connected", "WARNING")
+    @requires_connection("stream chart ticks")
+    def subscribe_tick_stream(self, contract, contract_key, option_type):
+        """
+        Stream tick-by-tick midpoints for the selected call/put chart contract.
+        Replaces the previous stream for the same side so at most two are open
+        (IBKR caps concurrent tick-by-tick subscriptions).
+        """
+        for req_id, (key, side) in list(self.tick_req_ids.items()):
+            if side != option_type:
+                continue
+            if key == contract_key:
+                return  # Already streaming this contract
+            self.cancel_tick_stream(req_id)
+        
+        req_id = self.next_req_id
+        self.next_req_id += 1
+        self.tick_req_ids[req_id] = (contract_key, option_type)
+        self.tick_buckets.pop(contract_key, None)
+        
+        try:
+            self.reqTickByTickData(req_id, contract, "MidPoint", 0, False)
+            self.log_message(f"Tick-by-tick midpoint stream started for {contract_key} (reqId: {req_id})", "INFO")
+        except Exception as e:
+            self.tick_req_ids.pop(req_id, None)
+            self.log_message(f"Error requesting tick-by-tick data for {contract_key}: {e}", "ERROR")
+    
+    def cancel_tick_stream(self, req_id):
+        """Stop a tick-by-tick midpoint stream"""
+        stream = self.tick_req_ids.pop(req_id, None)
+        if stream is None:
             return
+        self.tick_buckets.pop(stream[0], None)
+        try:
+            self.cancelTickByTickData(req_id)
+        except Exception:
+            pass  # Connection may already be gone
+    
+    def cache_bar_seconds(self, option_type):
+        """Re-read a chart's timeframe so ticks don't query the Tk variable each time"""
+        timeframe = self.call_timeframe_var.get() if option_type == 'call' else self.put_timeframe_var.get()
+        self.tick_bar_seconds[option_type] = CHART_BAR_SECONDS.get(timeframe, 60)
+    
+    def on_midpoint_tick(self, contract_key, option_type, tick_time, mid):
+        """GUI-thread side of tickByTickMidPoint"""
+        if self.apply_midpoint_tick(contract_key, option_type, tick_time, mid):
+            self.schedule_tick_redraw(option_type)
+    
+    def apply_midpoint_tick(self, contract_key, option_type, tick_time, mid) -> bool:
+        """
+        Fold a midpoint tick into the chart bars for contract_key, bucketed by the
+        chart's timeframe. Returns True when the chart should be redrawn.
+        
+        Ticks are ignored until the historical request has filled the bars; the
+        first tick after that continues the last (still forming) historical bar.
+        """
+        bars = self.historical_data.get(contract_key)
+        if not bars:
+            return False
+        
+        bar_seconds = self.tick_bar_seconds[option_type]
+        bucket = int(tick_time) - int(tick_time) % bar_seconds
+        current = self.tick_buckets.get(contract_key)
+        
+        if current is None or bucket == current:
+            bars.update_last(mid)
+        elif bucket > current:
+            bars.append(datetime.fromtimestamp(bucket).strftime('%Y%m%d  %H:%M:%S'), mid, mid, mid, mid)
+        else:
+            return False  # Late tick for a bar that already closed
         
+        self.tick_buckets[contract_key] = bucket
+        return True
+    
+    def schedule_tick_redraw(self, option_type):
+        """Queue one chart redraw per frame no matter how many ticks arrive"""
+        if option_type in self.tick_redraw_pending or not self.root:
+            return
+        self.tick_redraw_pending.add(option_type)
+        redraw = self._redraw_call_from_ticks if option_type == 'call' else self._redraw_put_from_ticks
+        self.root.after(50, redraw)
+    
+    def _redraw_call_from_ticks(self):
+        self.tick_redraw_pending.discard('call')
+        if self.selected_call_contract:
+            self.draw_candlestick_chart(self.call_ax, self.call_canvas,
+                                        self.get_contract_key(self.selected_call_contract), "Call")
+    
+    def _redraw_put_from_ticks(self):
+        self.tick_redraw_pending.discard('put')
+        if self.selected_put_contract:
+            self.draw_candlestick_chart(self.put_ax, self.put_canvas,
+                                        self.get_contract_key(self.selected_put_contract), "Put")
+    
+    @requires_connection("request historical data")
+    def request_historical_data(self, contract, contract_key, option_type):
+        """Request historical bar data for charting"""
         req_id = self.next_req_id
         self.next_req_id += 1
         
@@ -5842,13 +6668,16 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         Uses efficient data structures and minimal redraws for TradingView-like responsiveness.
         """
         try:
-            # Clear previous artists efficiently
-            ax.clear()
+            # Fast path: only the forming bar changed - blit it instead of a full redraw
+            if self._blit_last_candle(chart_type, contract_key):
+                return
             
             # Check if we have historical data
             if contract_key not in self.historical_data or len(self.historical_data[contract_key]) < 2:
+                self._candle_live.pop(chart_type, None)
+                ax.clear()
                 # FALLBACK: Display current market data instead
-                strike = contract_key.split('_')[1]
+                strike = self.parse_contract_key(contract_key)[1]
                 
                 if contract_key in self.market_data:
                     md = self.market_data[contract_key]
@@ -5880,20 +6709,31 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 ax.set_xlim(0, 1)
                 ax.set_ylim(0, 1)
                 ax.axis('off')
-                canvas.draw()
+                canvas.draw_idle()
                 return
             
-            # OPTIMIZATION 1: Use numpy for fast array operations
+            # OPTIMIZATION 1: Bars are already column arrays - slice views, no copies
             data = self.historical_data[contract_key]
             n_bars = len(data)
             
-            # Pre-allocate numpy arrays for better performance
-            indices = np.arange(n_bars)
-            opens = np.array([bar['open'] for bar in data])
-            highs = np.array([bar['high'] for bar in data])
-            lows = np.array([bar['low'] for bar in data])
-            closes = np.array([bar['close'] for bar in data])
-            dates = [bar['date'] for bar in data]
+            # Only build geometry for the bars inside a user pan/zoom (whole series otherwise)
+            live = self._candle_live.get(chart_type)
+            if live is not None and live['contract_key'] != contract_key:
+                live = None
+            view = live.get('view') if live is not None else None
+            lo, hi = 0, n_bars
+            if view is not None:
+                lo = max(0, int(np.floor(view[0])))
+                hi = min(n_bars, int(np.ceil(view[1])) + 1)
+                if hi - lo < 2:
+                    view, lo, hi = None, 0, n_bars
+            
+            indices = np.arange(lo, hi, dtype=np.float32)  # Keeps collection geometry in float32 too
+            opens = data.open[lo:hi]
+            highs = data.high[lo:hi]
+            lows = data.low[lo:hi]
+            closes = data.close[lo:hi]
+            dates = data.date[:n_bars]
             
             # Calculate mid prices using numpy (faster than list comprehension)
             mids = (highs + lows) / 2
@@ -5901,88 +6741,64 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             # OPTIMIZATION 2: Vectorized color determination
             is_bullish = closes >= opens
             
-            # OPTIMIZATION 3: Draw candlesticks in batches instead of individually
-            # Separate bullish and bearish candles for batch drawing
-            bullish_indices = indices[is_bullish]
-            bearish_indices = indices[~is_bullish]
-            
-            # Draw high-low lines in batches
-            for idx_arr, color in [(bullish_indices, '#44FF44'), (bearish_indices, '#FF4444')]:
-                if len(idx_arr) > 0:
-                    for i in idx_arr:
-                        i_scalar = int(i)  # Convert numpy int to Python int
-                        ax.plot([i_scalar, i_scalar], [float(lows[i]), float(highs[i])], 
-                               color=color, linewidth=1, solid_capstyle='butt', antialiased=True)
-            
-            # Draw bodies using collections for better performance
-            for idx_arr, color in [(bullish_indices, '#44FF44'), (bearish_indices, '#FF4444')]:
-                if len(idx_arr) > 0:
-                    for i in idx_arr:
-                        i_scalar = int(i)  # Convert numpy int to Python int
-                        body_height = float(abs(closes[i] - opens[i]))
-                        body_bottom = float(min(opens[i], closes[i]))
-                        rect = Rectangle((i_scalar - 0.3, body_bottom), 0.6, body_height, 
-                                       facecolor=color, edgecolor=color, linewidth=0.5)
-                        ax.add_patch(rect)
-            
-            # OPTIMIZATION 4: Plot mid-price line once (vectorized)
-            ax.plot(indices, mids, color='#FF8C00', linewidth=1.5, 
-                   label='Mid Price', alpha=0.7, antialiased=True, zorder=10)
-            
-            # OPTIMIZATION 5: Efficient styling - set all at once
-            strike = contract_key.split('_')[1]
-            # Update toolbar label instead of chart title
-            if chart_type == "Call":
-                self.call_contract_label.config(text=f"Strike {strike}")
-            elif chart_type == "Put":
-                self.put_contract_label.config(text=f"Strike {strike}")
-            
-            ax.set_xlabel('Time', color='#E0E0E0', fontsize=8)
-            ax.grid(True, alpha=0.2, color='#444444', linewidth=0.5, linestyle='-')
-            
-            # Move Y-axis to the right
-            ax.yaxis.tick_right()
-            ax.yaxis.set_label_position("right")
-            ax.set_ylabel('Price', color='#E0E0E0', fontsize=8)
-            
-            # Add current price label on Y-axis (bold and highlighted)
-            current_price = float(closes[-1])  # Last close price
-            ax.text(n_bars + 0.5, current_price, f' ${current_price:.2f} ', 
-                   fontsize=9, fontweight='bold', color='#FF8C00',
-                   bbox=dict(boxstyle='round,pad=0.3', facecolor='#000000', 
-                            edgecolor='#FF8C00', linewidth=1.5),
-                   verticalalignment='center', horizontalalignment='left')
-            
-            # Add horizontal line at current price
-            ax.axhline(y=current_price, color='#FF8C00', linestyle='--', linewidth=1, alpha=0.3)
-            
-            # Legend with minimal overhead
-            ax.legend(facecolor='#181818', edgecolor='#FF8C00', 
-                     labelcolor='#E0E0E0', fontsize=8, loc='best', framealpha=0.9)
+            # OPTIMIZATION 3: Draw all candles as two collections (one artist each)
+            colors = np.where(is_bullish, '#44FF44', '#FF4444')
+            wick_segments, body_verts = self._candle_geometry(indices, opens, highs, lows, closes)
+            current_price = float(data.close[n_bars - 1])  # Last close price
+            xlim = view if view is not None else (-0.5, n_bars - 0.5)
+            
+            # Same contract as last time: reuse the artists instead of clearing the axes
+            if live is not None:
+                self._update_candle_artists(live, indices, wick_segments, body_verts, colors,
+                                            mids, current_price, xlim[1] + 1.0)
+            else:
+                self._candle_live.pop(chart_type, None)
+                ax.clear()
+                live = self._create_candle_artists(ax, contract_key, chart_type, indices, wick_segments,
+                                                   body_verts, colors, mids, current_price, xlim[1] + 1.0)
+                live['canvas'] = canvas
+                self._candle_live[chart_type] = live
+                # ax.clear() drops axes callbacks, so hook pan/zoom again for the new contract
+                ax.callbacks.connect('xlim_changed', lambda a, ct=chart_type: self._on_candle_xlim_changed(ct, a))
+            
+            # Ticks and limits below are ours, not a user pan/zoom (see _on_candle_xlim_changed)
+            live['setting_xlim'] = True
             
             # OPTIMIZATION 6: Smart x-axis labeling - show fewer ticks for large datasets
-            if n_bars > 0:
-                # Adaptive tick spacing based on data size
-                tick_spacing = max(1, n_bars // 15)  # Show ~15 ticks maximum
-                xtick_positions = list(range(0, n_bars, tick_spacing))
+            if hi > lo:
+                # Adaptive tick spacing based on the visible bar count
+                tick_spacing = max(1, (hi - lo) // 15)  # Show ~15 ticks maximum
+                xtick_positions = list(range(lo, hi, tick_spacing))
                 
                 # Ensure we include the last point
-                if xtick_positions[-1] != n_bars - 1:
-                    xtick_positions.append(n_bars - 1)
+                if xtick_positions[-1] != hi - 1:
+                    xtick_positions.append(hi - 1)
                 
-                # Extract time from date strings efficiently
-                xtick_labels = [dates[i].split()[1] if ' ' in dates[i] else dates[i] 
-                               for i in xtick_positions]
+                # Time-of-day labels were split out once when the bars arrived
+                xtick_labels = data.label[xtick_positions].tolist()
                 
-                ax.set_xticks(xtick_positions)
-                ax.set_xticklabels(xtick_labels, rotation=45, ha='right', fontsize=7)
-            
-            # Set reasonable limits to avoid auto-scaling overhead
-            ax.set_xlim(-0.5, n_bars - 0.5)
-            y_min, y_max = np.min(lows), np.max(highs)
+                # Hand new ticks to the locator/formatter installed with the artists; the
+                # axis only rebuilds its Tick objects when positions or labels changed
+                if (xtick_positions, xtick_labels) != live.get('xticks'):
+                    live['xlocator'].locs = np.asarray(xtick_positions)
+                    live['xformatter'].seq = xtick_labels
+                    live['xticks'] = (xtick_positions, xtick_labels)
+            
+            # Set reasonable limits to avoid auto-scaling overhead (y fits the visible bars)
+            ax.set_xlim(*xlim)
+            live['setting_xlim'] = False
+            y_min, y_max = self._candle_y_extent(live, lo, hi, dates[0], lows, highs)
             y_padding = (y_max - y_min) * 0.05  # 5% padding
             ax.set_ylim(y_min - y_padding, y_max + y_padding)
             
+            # Remember what the blit fast path needs; the background is captured on the next draw_event
+            live.update({'n_bars': n_bars, 'first_date': dates[0], 'ylim': ax.get_ylim(),
+                         'mids': mids, 'view': view, 'drawn_view': view, 'clipped': hi < n_bars,
+                         'background': None})
+            if chart_type not in self._candle_draw_hooks:
+                self._candle_draw_hooks[chart_type] = canvas.mpl_connect(
+                    'draw_event', lambda event, ct=chart_type: self._on_candle_canvas_draw(ct))
+            
             # OPTIMIZATION 7: Use draw_idle() for non-blocking updates
             # This queues the redraw instead of blocking immediately
             canvas.draw_idle()
@@ -5993,33 +6809,212 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         except Exception as e:
             self.log_message(f"Error drawing {chart_type} chart: {e}", "ERROR")
     
+    @staticmethod
+    def _candle_y_extent(live, lo, hi, first_date, lows, highs):
+        """
+        Price range of bars [lo, hi). Closed bars never change, so their min/max is kept
+        in live until the window moves (new bar, pan/zoom, oldest bars dropped); only the
+        forming bar is reduced again on each redraw.
+        """
+        window = (lo, hi, first_date)
+        cached = live.get('closed_extent')
+        if cached is None or cached[0] != window:
+            cached = (window, float(lows[:-1].min(initial=np.inf)), float(highs[:-1].max(initial=-np.inf)))
+            live['closed_extent'] = cached
+        return min(cached[1], float(lows[-1])), max(cached[2], float(highs[-1]))
+    
+    def _create_candle_artists(self, ax, contract_key, chart_type, indices, wick_segments,
+                               body_verts, colors, mids, current_price, price_x) -> dict:
+        """Build the candle/mid/price artists on a freshly cleared axes (new contract)"""
+        # Closed bars go into the static background...
+        closed_wick = LineCollection(wick_segments[:-1], colors=colors[:-1], linewidths=0.8,
+                                     capstyle='butt', antialiaseds=False)
+        closed_body = PolyCollection(body_verts[:-1], facecolors=colors[:-1], edgecolors=colors[:-1],
+                                     linewidths=0.5)
+        ax.add_collection(closed_wick)
+        ax.add_collection(closed_body)
+        
+        # ...the forming bar is animated so later ticks can be blitted over the background
+        last_wick = LineCollection(wick_segments[-1:], colors=colors[-1:], linewidths=0.8,
+                                   capstyle='butt', antialiaseds=False, animated=True)
+        last_body = PolyCollection(body_verts[-1:], facecolors=colors[-1:], edgecolors=colors[-1:],
+                                   linewidths=0.5, animated=True)
+        ax.add_collection(last_wick)
+        ax.add_collection(last_body)
+        
+        # OPTIMIZATION 4: Plot mid-price line once (vectorized)
+        mid_line, = ax.plot(indices, mids, color='#FF8C00', linewidth=1.5, 
+                           label='Mid Price', alpha=0.7, antialiased=True, zorder=10, animated=True)
+        
+        # OPTIMIZATION 5: Efficient styling - set all at once
+        strike = self.parse_contract_key(contract_key)[1]
+        # Update toolbar label instead of chart title
+        if chart_type == "Call":
+            self.call_contract_label.config(text=f"Strike {strike}")
+        elif chart_type == "Put":
+            self.put_contract_label.config(text=f"Strike {strike}")
+        
+        ax.set_xlabel('Time', color='#E0E0E0', fontsize=8)
+        ax.grid(True, alpha=0.2, color='#444444', linewidth=0.5, linestyle='-')
+        
+        # Fixed time-of-day ticks: draw_candlestick_chart swaps their positions/labels in place
+        xlocator, xformatter = FixedLocator([]), FixedFormatter([])
+        ax.xaxis.set_major_locator(xlocator)
+        ax.xaxis.set_major_formatter(xformatter)
+        ax.tick_params(axis='x', labelrotation=45, labelsize=7)
+        # Tick 0 is the template the axis copies label properties from for every new tick
+        ax.xaxis.majorTicks[0].label1.set_horizontalalignment('right')
+        
+        # Move Y-axis to the right
+        ax.yaxis.tick_right()
+        ax.yaxis.set_label_position("right")
+        ax.set_ylabel('Price', color='#E0E0E0', fontsize=8)
+        
+        # Add current price label on Y-axis (bold and highlighted)
+        price_text = ax.text(price_x, current_price, f' ${current_price:.2f} ', 
+               fontsize=9, fontweight='bold', color='#FF8C00',
+               bbox=dict(boxstyle='round,pad=0.3', facecolor='#000000', 
+                        edgecolor='#FF8C00', linewidth=1.5),
+               verticalalignment='center', horizontalalignment='left', animated=True)
+        
+        # Add horizontal line at current price
+        price_line = ax.axhline(y=current_price, color='#FF8C00', linestyle='--', linewidth=1,
+                                alpha=0.3, animated=True)
+        
+        # Legend with minimal overhead
+        ax.legend(facecolor='#181818', edgecolor='#FF8C00', 
+                 labelcolor='#E0E0E0', fontsize=8, loc='best', framealpha=0.9)
+        
+        return {'ax': ax, 'contract_key': contract_key, 'closed': (closed_wick, closed_body),
+                'artists': (last_wick, last_body, mid_line, price_line, price_text),
+                'xlocator': xlocator, 'xformatter': xformatter}
+    
+    def _update_candle_artists(self, live, indices, wick_segments, body_verts, colors,
+                               mids, current_price, price_x):
+        """Point the existing artists at the new bars (new bar appeared or range changed)"""
+        closed_wick, closed_body = live['closed']
+        closed_wick.set_segments(wick_segments[:-1])
+        closed_wick.set_color(colors[:-1])
+        closed_body.set_verts(body_verts[:-1])
+        closed_body.set_facecolor(colors[:-1])
+        closed_body.set_edgecolor(colors[:-1])
+        
+        last_wick, last_body, mid_line, price_line, price_text = live['artists']
+        last_wick.set_segments(wick_segments[-1:])
+        last_wick.set_color(colors[-1:])
+        last_body.set_verts(body_verts[-1:])
+        last_body.set_facecolor(colors[-1:])
+        last_body.set_edgecolor(colors[-1:])
+        
+        mid_line.set_data(indices, mids)
+        price_line.set_ydata([current_price, current_price])
+        price_text.set_position((price_x, current_price))
+        price_text.set_text(f' ${current_price:.2f} ')
+    
+    @staticmethod
+    def _candle_geometry(indices, opens, highs, lows, closes, half_width=0.3):
+        """Wick segments (n, 2, 2) and body rectangles (n, 4, 2) centred on indices for a run of bars"""
+        wick_segments = np.stack([np.column_stack([indices, lows]),
+                                  np.column_stack([indices, highs])], axis=1)
+        body_bottom = np.minimum(opens, closes)
+        body_top = np.maximum(opens, closes)
+        left = indices - half_width
+        right = indices + half_width
+        body_verts = np.stack([np.column_stack([left, body_bottom]),
+                               np.column_stack([left, body_top]),
+                               np.column_stack([right, body_top]),
+                               np.column_stack([right, body_bottom])], axis=1)
+        return wick_segments, body_verts
+    
+    def _on_candle_canvas_draw(self, chart_type):
+        """After a full draw: grab the static background, then paint the animated artists on top"""
+        live = self._candle_live.get(chart_type)
+        if not live:
+            return
+        canvas = live['canvas']
+        live['background'] = canvas.copy_from_bbox(canvas.figure.bbox)
+        for artist in live['artists']:
+            live['ax'].draw_artist(artist)
+        canvas.blit(canvas.figure.bbox)
+    
+    def _on_candle_xlim_changed(self, chart_type, ax):
+        """Toolbar pan/zoom: remember the view and rebuild the candles for just that range"""
+        live = self._candle_live.get(chart_type)
+        if not live or live['ax'] is not ax or live.get('setting_xlim') or 'n_bars' not in live:
+            return
+        lo, hi = ax.get_xlim()
+        live['view'] = None if lo <= -0.5 and hi >= live['n_bars'] - 0.5 else (lo, hi)
+        if chart_type == "Call":
+            self.update_call_chart()
+        else:
+            self.update_put_chart()
+    
+    def _blit_last_candle(self, chart_type, contract_key) -> bool:
+        """
+        Update only the forming bar, mid line tail and price marker, then blit.
+        Returns False (caller does a full redraw) when anything else changed:
+        different contract, new/removed bars, a pan/zoom, or the bar left the current y-range.
+        """
+        live = self._candle_live.get(chart_type)
+        if not live or live['background'] is None or live['contract_key'] != contract_key:
+            return False
+        if live['view'] != live['drawn_view']:
+            return False  # Panned/zoomed since the last full draw - rebuild for the new range
+        
+        data = self.historical_data.get(contract_key)
+        if not data or len(data) != live['n_bars'] or data.date[0] != live['first_date']:
+            return False
+        
+        i = live['n_bars'] - 1
+        o, h, l, c = float(data.open[i]), float(data.high[i]), float(data.low[i]), float(data.close[i])
+        y_min, y_max = live['ylim']
+        if not live['clipped'] and (l < y_min or h > y_max):
+            return False
+        
+        last_wick, last_body, mid_line, price_line, price_text = live['artists']
+        if not live['clipped']:  # Forming bar is on screen (not panned back into history)
+            color = '#44FF44' if c >= o else '#FF4444'
+            wick, body = self._candle_geometry(np.array([i]), np.array([o]), np.array([h]),
+                                               np.array([l]), np.array([c]))
+            last_wick.set_segments(wick)
+            last_wick.set_color(color)
+            last_body.set_verts(body)
+            last_body.set_facecolor(color)
+            last_body.set_edgecolor(color)
+            
+            live['mids'][-1] = (h + l) / 2
+            mid_line.set_ydata(live['mids'])
+        price_line.set_ydata([c, c])
+        price_text.set_y(c)
+        price_text.set_text(f' ${c:.2f} ')
+        
+        ax, canvas = live['ax'], live['canvas']
+        canvas.restore_region(live['background'])
+        for artist in live['artists']:
+            ax.draw_artist(artist)
+        canvas.blit(canvas.figure.bbox)
+        return True
+    
     # ========================================================================
     # GUI UPDATES
     # ========================================================================
     
     def add_order_to_tree(self, order_id: int, contract: Contract, action: str,
-                         quantity: int, price: float, status: str):
-        """Add order to the order sheet (tksheet)"""
+                         quantity: int, price: float, status: str, contract_key: Optional[str] = None):
+        """Add order to the order sheet (tksheet); contract_key overrides the label (e.g. combos)"""
         try:
-            contract_key = self.get_contract_key(contract)
+            if contract_key is None:
+                contract_key = self.get_contract_key(contract)
             
-            # Get current data
-            current_data = self.order_sheet.get_sheet_data()
-            
-            # Add new row with price and Cancel button
+            # Append the row in place (column widths and other rows untouched)
             new_row = [str(order_id), contract_key, action, str(quantity), f"${price:.2f}", status, "Cancel"]
-            current_data.append(new_row)
-            
-            # Update sheet (unavoidable when adding rows)
-            self.order_sheet.set_sheet_data(current_data)
-            
-            # Re-apply column widths (only when row count changes)
-            for col_idx, width in enumerate([80, 210, 60, 50, 80, 100, 80]):
-                self.order_sheet.column_width(column=col_idx, width=width)
+            row_idx = self.order_sheet.get_total_rows()
+            self.order_sheet.insert_row(new_row, idx=row_idx, redraw=False)
+            self._order_rows[order_id] = row_idx
             
             # Apply yellow background to Cancel button (column 6)
-            row_idx = len(current_data) - 1
-            self.order_sheet.highlight_cells(row=row_idx, column=6, fg="#000000", bg="#FFFF00")
+            self.order_sheet.highlight_cells(row=row_idx, column=6, fg="#000000", bg="#FFFF00", redraw=False)
+            self.order_sheet.redraw()
             
         except Exception as e:
             self.log_message(f"Error adding order to sheet: {e}", "ERROR")
@@ -6027,155 +7022,167 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
     def update_order_in_tree(self, order_id: int, status: str, price: Optional[float] = None):
         """Update order status and optionally price in sheet (tksheet)"""
         try:
-            # Get all rows
-            data = self.order_sheet.get_sheet_data()
-            
-            # Find and update the row
-            for i, row in enumerate(data):
-                if row and len(row) > 0 and str(row[0]) == str(order_id):
-                    # Only remove order when actually filled or cancelled
-                    # "PreSubmitted" and "Submitted" mean order is working, NOT filled!
-                    # "Inactive" means rejected (exchange closed, invalid order, etc.)
-                    if status in ["Filled", "Cancelled", "Inactive"]:
-                        data.pop(i)
-                        # Update sheet (row count changed)
-                        self.order_sheet.set_sheet_data(data)
-                        # Re-apply column widths (only when row count changes)
-                        for col_idx, width in enumerate([80, 210, 60, 50, 80, 100, 80]):
-                            self.order_sheet.column_width(column=col_idx, width=width)
-                    else:
-                        # Update cells individually (preserves column widths)
-                        if price is not None:
-                            self.order_sheet.set_cell_data(i, 4, f"${price:.2f}")
-                        self.order_sheet.set_cell_data(i, 5, status)
-                    break
-                    
+            # Row lookup by order id instead of scanning the sheet
+            i = self._order_rows.get(order_id)
+            if i is None:
+                return
+            
+            # Only remove order when actually filled or cancelled
+            # "PreSubmitted" and "Submitted" mean order is working, NOT filled!
+            # "Inactive" means rejected (exchange closed, invalid order, etc.)
+            if status in ["Filled", "Cancelled", "Inactive"]:
+                # Drop just this row; highlights on the rows below shift up with it
+                self.order_sheet.delete_row(i)
+                del self._order_rows[order_id]
+                for other_id, row_idx in self._order_rows.items():
+                    if row_idx > i:
+                        self._order_rows[other_id] = row_idx - 1
+            else:
+                # Update cells individually (preserves column widths); repeated status
+                # callbacks with nothing new skip the redraw
+                changed = False
+                if price is not None:
+                    price_text = f"${price:.2f}"
+                    if self.order_sheet.get_cell_data(i, 4) != price_text:
+                        self.order_sheet.set_cell_data(i, 4, price_text, redraw=False)
+                        changed = True
+                if self.order_sheet.get_cell_data(i, 5) != status:
+                    self.order_sheet.set_cell_data(i, 5, status, redraw=False)
+                    changed = True
+                if changed:
+                    self.order_sheet.redraw()
+            
         except Exception as e:
             self.log_message(f"Error updating order in sheet: {e}", "ERROR")
     
+    def on_notebook_tab_changed(self, event=None):
+        """Build the settings tab on first view; repaint the positions sheet right away
+        when the dashboard tab comes back into view"""
+        if hasattr(self, 'settings_tab') and not self._settings_built \
+                and self.notebook.select() == str(self.settings_tab):
+            self.build_settings_tab()
+        if hasattr(self, 'position_sheet') and self.notebook.select() == str(self.dashboard_tab):
+            self._positions_dirty = True
+            self.update_positions_display()
+    
     def update_positions_display(self):
         """Update the positions tksheet grid"""
         if not self.root:
             return
         
+        # Repaint only when something changed (or once a second for the time-in-position
+        # column), and not while the dashboard is hidden or minimized
+        now = time.monotonic()
+        visible = self.root.state() != 'iconic' and self.notebook.select() == str(self.dashboard_tab)
+        due = self._positions_dirty or (self.positions and now - self._positions_drawn_at >= 1.0)
+        if not visible:
+            # Slow poll while hidden; on_notebook_tab_changed repaints as soon as it's shown
+            self.schedule_after('positions_display', 1000, self.update_positions_display)
+            return
+        if not due:
+            self.schedule_after('positions_display', 250, self.update_positions_display)
+            return
+        self._positions_dirty = False
+        self._positions_drawn_at = now
+        
+        # One snapshot for the whole repaint: API-thread callbacks may add/remove positions meanwhile
+        snapshot = tuple(self.positions.items())
+        
+        # Update P&L with current mid-price from market data
+        self._refresh_pnl([(key, pos, None) for key, pos in snapshot])
+        
+        # P&L %, total and row colours for all positions in one pass over column arrays
+        n_positions = len(snapshot)
+        current = np.fromiter((p.currentPrice for _, p in snapshot), dtype=np.float64, count=n_positions)
+        avg_cost = np.fromiter((p.avgCost for _, p in snapshot), dtype=np.float64, count=n_positions)
+        pnls = np.fromiter((p.pnl for _, p in snapshot), dtype=np.float64, count=n_positions)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pnl_pcts = np.where(avg_cost > 0, (current / avg_cost - 1.0) * 100.0, 0.0)
+        total_pnl = float(pnls.sum())
+        
         # Build data rows
         rows = []
-        total_pnl = 0
-        
-        for contract_key, pos in self.positions.items():
-            # Update P&L with current mid-price from market data
-            self.update_position_pnl(contract_key)
+        now_dt = datetime.now()
+        
+        for i, (contract_key, pos) in enumerate(snapshot):
+            pnl = pos.pnl
+            entry_time = pos.entryTime
+            
+            # Re-format the price cells only when the numbers behind them moved
+            state = (pos.position, pos.avgCost, pos.currentPrice, pnl, entry_time)
+            cached = self._pos_cells.get(contract_key)
+            if cached is None or cached[0] != state:
+                pnl_pct = pnl_pcts[i]
+                cells = (
+                    "%.0f" % pos.position,
+                    "$%.2f" % pos.avgCost,
+                    "$%.2f" % pos.currentPrice,
+                    "$%.2f" % pnl,
+                    "%.2f%%" % pnl_pct,
+                    entry_time.strftime("%H:%M:%S")  # Entry time as HH:MM:SS
+                )
+                self._pos_cells[contract_key] = (state, cells)
+            else:
+                cells = cached[1]
             
-            pnl = pos['pnl']
-            pnl_pct = (pos['currentPrice'] / pos['avgCost'] - 1) * 100 if pos['avgCost'] > 0 else 0
+            # Time in position as HH:MM:SS (changes every second)
+            hours, remainder = divmod(int((now_dt - entry_time).total_seconds()), 3600)
+            minutes, seconds = divmod(remainder, 60)
+            time_span_str = "%02d:%02d:%02d" % (hours, minutes, seconds)
             
-            # Calculate time in position
-            entry_time = pos.get('entryTime', datetime.now())
-            time_span = datetime.now() - entry_time
+            rows.append([contract_key, *cells, time_span_str, "Close"])
+        
+        # Forget closed positions
+        if len(self._pos_cells) > n_positions:
+            for contract_key in self._pos_cells.keys() - {key for key, _ in snapshot}:
+                del self._pos_cells[contract_key]
+        
+        # PnL colour per row: green profit, red loss, white flat
+        colors = np.where(pnls > 0, "#00FF00", np.where(pnls < 0, "#FF0000", "#FFFFFF")).tolist()
+        
+        old_rows, old_colors = self._position_rows, self._position_colors
+        if [r[0] for r in old_rows] != [r[0] for r in rows]:
+            # Positions opened/closed/reordered - rebuild (rare)
+            self.position_sheet.set_sheet_data(rows, redraw=False)
             
-            # Format time span as HH:MM:SS
-            hours, remainder = divmod(int(time_span.total_seconds()), 3600)
-            minutes, seconds = divmod(remainder, 60)
-            time_span_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            
-            # Format entry time as HH:MM:SS
-            entry_time_str = entry_time.strftime("%H:%M:%S")
-            
-            # Format row data
-            row = [
-                contract_key,
-                f"{pos['position']:.0f}",
-                f"${pos['avgCost']:.2f}",
-                f"${pos['currentPrice']:.2f}",
-                f"${pnl:.2f}",
-                f"{pnl_pct:.2f}%",
-                entry_time_str,
-                time_span_str,
-                "Close"
-            ]
-            rows.append(row)
-            total_pnl += pnl
-        
-        # Get current sheet size
-        current_data = self.position_sheet.get_sheet_data()
-        current_row_count = len(current_data)
-        new_row_count = len(rows)
-        
-        # Handle row count changes (positions added/removed)
-        if current_row_count != new_row_count:
-            # Row count changed - need to use set_sheet_data (but this is rare)
-            # This only happens when positions are opened or closed
-            self.position_sheet.set_sheet_data(rows)
-            
-            # Re-apply column widths after set_sheet_data (unavoidable when row count changes)
+            # Re-apply column widths after set_sheet_data (unavoidable when rows change)
             for col_idx, width in enumerate([230, 50, 80, 80, 100, 80, 100, 90, 70]):
                 self.position_sheet.column_width(column=col_idx, width=width)
             
-            # Color-code rows
-            for row_idx, (contract_key, pos) in enumerate(self.positions.items()):
-                pnl = pos['pnl']
-                
-                # Determine row color
-                if pnl > 0:
-                    fg_color = "#00FF00"  # Green for profit
-                elif pnl < 0:
-                    fg_color = "#FF0000"  # Red for loss
-                else:
-                    fg_color = "#FFFFFF"  # White for zero
-                
+            for row_idx, fg_color in enumerate(colors):
                 # Apply color to PnL columns (indices 4 and 5)
-                self.position_sheet.highlight_cells(row=row_idx, column=4, fg=fg_color, bg="#000000")
-                self.position_sheet.highlight_cells(row=row_idx, column=5, fg=fg_color, bg="#000000")
+                self.position_sheet.highlight_cells(row=row_idx, column=4, fg=fg_color, bg="#000000", redraw=False)
+                self.position_sheet.highlight_cells(row=row_idx, column=5, fg=fg_color, bg="#000000", redraw=False)
                 
                 # Style Close button: Red background, white text (index 8)
-                self.position_sheet.highlight_cells(row=row_idx, column=8, fg="#FFFFFF", bg="#CC0000")
+                self.position_sheet.highlight_cells(row=row_idx, column=8, fg="#FFFFFF", bg="#CC0000", redraw=False)
+            changed = True
         else:
-            # Same number of rows - update cells individually (preserves column widths)
-            for row_idx, row in enumerate(rows):
+            # Same positions - touch only the cells whose text or colour changed
+            changed = False
+            for row_idx, (row, old_row) in enumerate(zip(rows, old_rows)):
                 for col_idx, value in enumerate(row):
-                    # Update each cell individually
-                    self.position_sheet.set_cell_data(row_idx, col_idx, value)
-            
-            # Update cell colors for PnL columns
-            for row_idx, (contract_key, pos) in enumerate(self.positions.items()):
-                pnl = pos['pnl']
-                
-                # Determine row color
-                if pnl > 0:
-                    fg_color = "#00FF00"  # Green for profit
-                elif pnl < 0:
-                    fg_color = "#FF0000"  # Red for loss
-                else:
-                    fg_color = "#FFFFFF"  # White for zero
+                    if value != old_row[col_idx]:
+                        self.position_sheet.set_cell_data(row_idx, col_idx, value, redraw=False)
+                        changed = True
                 
-                # Apply color to PnL columns (indices 4 and 5)
-                self.position_sheet.highlight_cells(row=row_idx, column=4, fg=fg_color, bg="#000000")
-                self.position_sheet.highlight_cells(row=row_idx, column=5, fg=fg_color, bg="#000000")
-                
-                # Style Close button: Red background, white text (index 8)
-                self.position_sheet.highlight_cells(row=row_idx, column=8, fg="#FFFFFF", bg="#CC0000")
+                if colors[row_idx] != old_colors[row_idx]:
+                    self.position_sheet.highlight_cells(row=row_idx, column=4, fg=colors[row_idx], bg="#000000", redraw=False)
+                    self.position_sheet.highlight_cells(row=row_idx, column=5, fg=colors[row_idx], bg="#000000", redraw=False)
+                    changed = True
+        
+        if changed:
+            self.position_sheet.redraw()
+        self._position_rows, self._position_colors = rows, colors
         
         # Update total PnL label
         pnl_color = "#44FF44" if total_pnl >= 0 else "#FF4444"
         self.pnl_label.config(text=f"Total PnL: ${total_pnl:.2f}", 
                              foreground=pnl_color)
         
-        # Schedule next update
-        self.root.after(1000, self.update_positions_display)
-    
-    def process_gui_queue(self):
-        """Process messages from API thread to GUI thread"""
-        if not self.root:
-            return
-        try:
-            while not self.gui_queue.empty():
-                message = self.gui_queue.get_nowait()
-                # Process message (if needed)
-        except queue.Empty:
-            pass
-        
-        # Schedule next check
-        self.root.after(100, self.process_gui_queue)
+        # Schedule next check (replaces the pending one, so fill/positionEnd refreshes
+        # don't start extra loops)
+        self.schedule_after('positions_display', 250, self.update_positions_display)
     
     def log_message(self, message: str, level: str = "INFO"):
         """
@@ -6183,15 +7190,21 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
         
         Args:
             message: The message to log
-            level: Log level (INFO, WARNING, ERROR, SUCCESS)
+            level: Log level (DEBUG, INFO, SUCCESS, WARNING, ERROR)
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        if LOG_LEVELS.get(level, 20) < self.log_level_num:
+            return
         
-        # GUI log entry (can include emojis) - only if GUI exists
-        if hasattr(self, 'log_text') and self.log_text:
-            log_entry = f"[{timestamp}] {message}\n"
-            self.log_text.insert(tk.END, log_entry, level)
-            self.log_text.see(tk.END)
+        # Formatted once per second - (epoch second, text) swapped as one tuple since
+        # both the Tk and API threads log
+        sec = int(time.time())
+        cached = self._log_timestamp
+        if cached[0] != sec:
+            cached = self._log_timestamp = (sec, time.strftime("%H:%M:%S", time.localtime(sec)))
+        timestamp = cached[1]
+        
+        # GUI log entry (can include emojis) - queued, written by flush_log_queue
+        self._log_queue.append((f"[{timestamp}] {message}\n", level))
         
         # Console log (no emojis, plain text)
         console_message = f"[{timestamp}] [{level}] {message}"
@@ -6205,13 +7218,48 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
             file_logger.warning(message)
         elif level == "SUCCESS":
             file_logger.info(f"✓ {message}")
+        elif level == "DEBUG":
+            file_logger.debug(message)
         else:  # INFO or any other level
             file_logger.info(message)
+    
+    def flush_log_queue(self):
+        """Write all queued log lines to the log widget in a single insert (~60 Hz)"""
+        if not self.root:
+            return
         
-        # Keep log size manageable - only if GUI exists
-        if hasattr(self, 'log_text') and self.log_text:
-            if int(self.log_text.index('end-1c').split('.')[0]) > 1000:
-                self.log_text.delete('1.0', '500.0')
+        busy = bool(self._log_queue)
+        if busy and hasattr(self, 'log_text') and self.log_text:
+            # Only auto-scroll if the view was already at the bottom (user isn't reading history)
+            follow = self.log_text.yview()[1] > 0.999
+            
+            # Text.insert accepts alternating chars, tags pairs; consecutive lines of the
+            # same level are joined into one chunk so the insert carries one tag range per run
+            chunks = []
+            run, run_level = [], None
+            while self._log_queue:
+                text, level = self._log_queue.popleft()
+                if level != run_level and run:
+                    chunks.append(''.join(run))
+                    chunks.append(run_level)
+                    run = []
+                run.append(text)
+                run_level = level
+                self._log_line_count += text.count('\n')
+            chunks.append(''.join(run))
+            chunks.append(run_level)
+            self.log_text.insert(tk.END, *chunks)
+            
+            # Keep log size manageable: trim back to half the cap in one delete
+            if self._log_line_count > LOG_WIDGET_MAX_LINES:
+                drop = self._log_line_count - LOG_WIDGET_MAX_LINES // 2
+                self.log_text.delete('1.0', f'{drop + 1}.0')
+                self._log_line_count -= drop
+            if follow:
+                self.log_text.see(tk.END)
+        
+        # Back off while idle instead of waking Tk at 60 Hz for an empty queue
+        self.root.after(LOG_FLUSH_INTERVAL_MS if busy else LOG_IDLE_INTERVAL_MS, self.flush_log_queue)
     
     # ========================================================================
     # MAIN LOOP
@@ -6231,6 +7279,7 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                     except Exception as e:
                         pass  # Ignore errors during cleanup
                 self.market_data_map.clear()
+                self.market_data_by_req_id.clear()
                 self.subscribed_contracts.clear()
             
             # Cancel all historical data requests
@@ -6243,6 +7292,10 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                         pass  # Ignore errors during cleanup
                 self.historical_data_requests.clear()
             
+            # Cancel tick-by-tick chart streams
+            for req_id in list(self.tick_req_ids.keys()):
+                self.cancel_tick_stream(req_id)
+            
             # Cancel position subscription
             try:
                 self.log_message("Cancelling position subscription...", "INFO")
@@ -6297,11 +7350,13 @@ class SPXTradingApp(IBKRWrapper, IBKRClient):
                 if hasattr(self, 'api_thread') and self.api_thread and self.api_thread.is_alive():
                     self.api_thread.join(timeout=1.0)
             
+            # Let any queued settings write finish
+            self._io_pool.shutdown(wait=True)
+            
             # Destroy the GUI window
             self.root.destroy()
             
             # Force exit the Python process
-            import sys
             sys.exit(0)
     
     def run_gui(self):
@@ -6334,12 +7389,10 @@ if __name__ == "__main__":
         
         # Normal exit after GUI closes
         print("[SHUTDOWN] Application closed normally")
-        import sys
         sys.exit(0)
         
     except KeyboardInterrupt:
         print("\n[SHUTDOWN] Application interrupted by user (Ctrl+C)")
-        import sys
         sys.exit(0)
         
     except Exception as e:
@@ -6347,5 +7400,4 @@ if __name__ == "__main__":
         import traceback
         traceback.print_exc()
         input("Press Enter to exit...")
-        import sys
         sys.exit(1)
@@ -5,36 +5,27 @@ def calculate_expiry_date(offset: int) -> str:
     current_date = datetime(2025, 10, 21)  # Tuesday, Oct 21, 2025
     target_date = current_date
     
-    # SPX has daily expirations Monday-Friday
-    expiry_days = [0, 1, 2, 3, 4]
-    
-    days_checked = 0
-    expirations_found = 0
-    
     print(f"\nTesting offset={offset}")
     print(f"Start date: {current_date.strftime('%Y-%m-%d %A')} (weekday {current_date.weekday()})")
-    print()
     
-    # Find the Nth expiration (where N = offset)
-    while True:
-        is_expiry = target_date.weekday() in expiry_days
-        print(f"Day {days_checked}: {target_date.strftime('%Y-%m-%d %A')} (weekday {target_date.weekday()}) - Is expiry: {is_expiry}")
-        
-        if is_expiry:
-            print(f"  -> Expiration #{expirations_found} found")
-            if expirations_found == offset:
-                result = target_date.strftime("%Y%m%d")
-                print(f"  -> MATCH! Returning {result}")
-                return result
-            expirations_found += 1
-        
-        target_date += timedelta(days=1)
-        days_checked += 1
-        
-        if days_checked > 10:
-            break
+    # SPX has daily expirations Monday-Friday, so the Nth one is closed-form
+    # (same arithmetic as SPXTradingApp._nth_expiry): first expiry is today on a
+    # weekday, otherwise the coming Monday; every 5 expirations span one calendar
+    # week, and a remainder that runs past Friday skips the weekend
+    weekday = target_date.weekday()
+    if weekday >= 5:
+        target_date += timedelta(days=7 - weekday)
+        weekday = 0
+    
+    weeks, rem = divmod(offset, 5)
+    days = weeks * 7 + rem
+    if weekday + rem >= 5:
+        days += 2  # Crossed a weekend
+    target_date += timedelta(days=days)
     
-    return "ERROR"
+    result = target_date.strftime("%Y%m%d")
+    print(f"  -> Expiration #{offset}: {target_date.strftime('%Y-%m-%d %A')}, returning {result}")
+    return result
 
 # Test offsets 0-5
 for i in range(6):